@@ -0,0 +1 @@
+"""Standalone benchmarks for the generac integration (not run by pytest)."""
@@ -0,0 +1,53 @@
+"""Compare models.decode against dacite.from_dict on a large fleet.
+
+    python -m benchmarks.bench_decode [--devices 500] [--rounds 5]
+
+dacite is only a dev requirement now; it is used here as the baseline.
+"""
+import argparse
+import time
+
+from benchmarks.fleet import fleet
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import decode
+from dacite import from_dict
+
+
+def _decode_fleet(fn, apparatuses, details) -> None:
+    for raw in apparatuses:
+        fn(Apparatus, raw)
+        fn(ApparatusDetail, details[raw["apparatusId"]])
+
+
+def _best_of(rounds: int, fn, apparatuses, details) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _decode_fleet(fn, apparatuses, details)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    apparatuses, details = fleet(args.devices)
+    for raw in apparatuses:
+        assert decode(Apparatus, raw) == from_dict(Apparatus, raw)
+        detail = details[raw["apparatusId"]]
+        assert decode(ApparatusDetail, detail) == from_dict(ApparatusDetail, detail)
+
+    baseline = _best_of(args.rounds, from_dict, apparatuses, details)
+    compiled = _best_of(args.rounds, decode, apparatuses, details)
+    print(f"{args.devices} devices, best of {args.rounds} rounds")
+    print(f"  dacite.from_dict : {baseline * 1000:8.1f} ms")
+    print(f"  models.decode    : {compiled * 1000:8.1f} ms")
+    print(f"  speedup          : {baseline / compiled:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure DPoP proof signing throughput.
+
+    python -m benchmarks.bench_dpop [--proofs 5000]
+
+Compares `DPoPKey.sign_proof` against the previous implementation, which
+re-encoded the constant header and rebuilt the ECDSA signature algorithm
+on every call.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import time
+import uuid
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from custom_components.generac.auth import DPoPKey
+from custom_components.generac.auth import TOKEN_URL
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _sign_proof_baseline(key: DPoPKey, htm, htu, nonce=None, access_token=None):
+    """sign_proof as it was before the header segment was cached."""
+    header = {"alg": "ES256", "typ": "dpop+jwt", "jwk": key.jwk}
+    payload: dict = {
+        "jti": str(uuid.uuid4()),
+        "htm": htm.upper(),
+        "htu": htu,
+        "iat": int(time.time()),
+    }
+    if nonce is not None:
+        payload["nonce"] = nonce
+    if access_token is not None:
+        ath = hashlib.sha256(access_token.encode("ascii")).digest()
+        payload["ath"] = _b64url(ath)
+
+    signing_input = (
+        _b64url(json.dumps(header, separators=(",", ":")).encode())
+        + "."
+        + _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    ).encode("ascii")
+
+    der_sig = key.private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+    r, s = decode_dss_signature(der_sig)
+    raw_sig = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    return signing_input.decode("ascii") + "." + _b64url(raw_sig)
+
+
+def _proofs_per_second(sign, proofs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(proofs):
+        sign("POST", TOKEN_URL, nonce="nonce-value")
+    return proofs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--proofs", type=int, default=5000)
+    args = parser.parse_args()
+
+    key = DPoPKey.generate()
+    current = _proofs_per_second(key.sign_proof, args.proofs)
+    baseline = _proofs_per_second(
+        lambda *a, **kw: _sign_proof_baseline(key, *a, **kw), args.proofs
+    )
+    print(f"{args.proofs} proofs")
+    print(f"  baseline sign_proof : {baseline:10.0f} proofs/s")
+    print(f"  DPoPKey.sign_proof  : {current:10.0f} proofs/s")
+    print(f"  speedup             : {current / baseline:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Time the per-entity state write for a large fleet.
+
+    python -m benchmarks.bench_entity [--devices 500] [--rounds 10]
+
+Builds every sensor, binary sensor and weather entity the integration
+creates for a synthetic fleet, attaches them to a bare HomeAssistant
+instance (needs homeassistant installed) and runs each entity's
+coordinator update as if a poll had changed everything it shows, so
+every entity writes its state: the cost a busy poll pays per entity.
+A profile of one round (`--profile`) shows where that time goes.
+"""
+import argparse
+import asyncio
+import cProfile
+import logging
+import pstats
+import tempfile
+import time
+import types
+from datetime import timedelta
+
+from benchmarks.fleet import fleet
+from custom_components.generac import binary_sensor
+from custom_components.generac import sensor
+from custom_components.generac import weather
+from custom_components.generac.diff import DeviceDiff
+from custom_components.generac.diff import FleetDiff
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import decode
+from custom_components.generac.models import Item
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+
+def _entities(hass: HomeAssistant, devices: int) -> list:
+    apparatuses, details = fleet(devices)
+    coordinator = types.SimpleNamespace(is_online=True, data={}, renamed=set())
+    entry = types.SimpleNamespace(entry_id="bench")
+    platforms = {
+        domain: EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain=domain,
+            platform_name="generac",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        for domain in ("sensor", "binary_sensor", "weather")
+    }
+    entities = []
+    for raw in apparatuses:
+        device_id = str(raw["apparatusId"])
+        item = Item(
+            decode(Apparatus, raw),
+            decode(ApparatusDetail, details[raw["apparatusId"]]),
+        )
+        coordinator.data[device_id] = item
+        args = (coordinator, entry, device_id, item)
+        built = [
+            ("sensor", sensor.GeneracSensor(*args, description))
+            for description in sensor.descriptions(item)
+        ]
+        built += [("binary_sensor", cls(*args)) for cls in binary_sensor.sensors()]
+        if item.apparatus.weather is not None:
+            built += [("weather", cls(*args)) for cls in weather.sensors(item)]
+        for domain, entity in built:
+            entity.hass = hass
+            entity.platform = platforms[domain]
+            entity.entity_id = f"{domain}.bench_{len(entities)}"
+            entities.append(entity)
+    coordinator.changes = _all_shown_changed(entities)
+    return entities
+
+
+def _all_shown_changed(entities: list) -> FleetDiff:
+    """A poll that changed every field shown, but no device's name/model."""
+    paths: dict[str, set[str]] = {}
+    for entity in entities:
+        shown = paths.setdefault(entity.device_id, {"apparatusDetail.statusLabel"})
+        shown.update(entity.watched_fields)
+    return FleetDiff(
+        devices={
+            device_id: DeviceDiff(changed=frozenset(shown))
+            for device_id, shown in paths.items()
+        }
+    )
+
+
+def _update_all(entities: list) -> float:
+    start = time.perf_counter()
+    for entity in entities:
+        entity._handle_coordinator_update()
+    return time.perf_counter() - start
+
+
+async def _run(args: argparse.Namespace) -> None:
+    hass = HomeAssistant(tempfile.mkdtemp())
+    entities = _entities(hass, args.devices)
+    _update_all(entities)  # first writes create the states
+    best = min(_update_all(entities) for _ in range(args.rounds))
+    print(
+        f"{args.devices} devices, {len(entities)} entities, "
+        f"best of {args.rounds} rounds"
+    )
+    print(f"  all updates      : {best * 1000:8.1f} ms")
+    print(f"  per entity       : {best / len(entities) * 1e6:8.1f} us")
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(_update_all, entities)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    await hass.async_stop(force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--profile", action="store_true")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare JSON backends on /Apparatus/list and /Apparatus/details bodies.
+
+    python -m benchmarks.bench_json [--devices 500] [--rounds 5]
+        [--capture generac_payloads.log]
+
+By default the bodies come from the synthetic fleet; ``--capture``
+replays the 200 responses recorded by the ``capture_payloads`` option
+instead. Both the body decode and the list-entry fingerprint (used by
+incremental polling) are timed for each backend.
+"""
+import argparse
+import hashlib
+import json
+import time
+
+from benchmarks.fleet import fleet
+from custom_components.generac.api import _fingerprint
+from custom_components.generac.api import JSON_BACKEND
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _recorded(path: str) -> tuple[list[bytes], list[dict]]:
+    """Bodies and list entries from a payload capture file."""
+    bodies: list[bytes] = []
+    entries: list[dict] = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            # "<date> <time> <endpoint> <status> <body>"
+            parts = line.rstrip("\n").split(" ", 4)
+            if len(parts) < 5 or parts[3] != "200":
+                continue
+            bodies.append(parts[4].encode())
+            if parts[2].endswith("/Apparatus/list"):
+                entries.extend(json.loads(parts[4]))
+    return bodies, entries
+
+
+def _synthetic(devices: int) -> tuple[list[bytes], list[dict]]:
+    apparatuses, details = fleet(devices)
+    bodies = [json.dumps(apparatuses).encode()]
+    bodies += [json.dumps(detail).encode() for detail in details.values()]
+    return bodies, apparatuses
+
+
+def _stdlib_fingerprint(raw) -> str:
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _best_of(rounds: int, fn, items) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--capture", help="payload capture file to replay")
+    args = parser.parse_args()
+
+    if args.capture:
+        bodies, entries = _recorded(args.capture)
+        source = f"{len(bodies)} bodies from {args.capture}"
+    else:
+        bodies, entries = _synthetic(args.devices)
+        source = f"{args.devices} devices (synthetic)"
+    size = sum(len(body) for body in bodies)
+
+    print(f"{source}, {size / 1024:.0f} KiB, best of {args.rounds} rounds")
+    print(f"  client backend      : {JSON_BACKEND}")
+    stdlib = _best_of(args.rounds, json.loads, bodies)
+    print(f"  json.loads          : {stdlib * 1000:8.1f} ms")
+    if orjson is not None:
+        fast = _best_of(args.rounds, orjson.loads, bodies)
+        print(f"  orjson.loads        : {fast * 1000:8.1f} ms")
+        print(f"  decode speedup      : {stdlib / fast:8.1f}x")
+    stdlib = _best_of(args.rounds, _stdlib_fingerprint, entries)
+    client = _best_of(args.rounds, _fingerprint, entries)
+    print(f"  fingerprint (json)  : {stdlib * 1000:8.1f} ms")
+    print(f"  fingerprint (client): {client * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
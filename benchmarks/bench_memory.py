@@ -0,0 +1,81 @@
+"""Measure the memory held by decoded models for a large fleet.
+
+    python -m benchmarks.bench_memory [--devices 1000]
+
+Every device's list entry and details body is serialised and parsed
+again first, as the client does, so no strings are shared between
+devices unless the decoder shares them. tracemalloc then measures what
+one poll's `Item` graph keeps alive once the parsed payloads are gone,
+which is what entities hold on to between polls.
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.fleet import fleet
+from custom_components.generac.api import json_loads
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import decode
+from custom_components.generac.models import Item
+
+
+def _bodies(devices: int) -> list[tuple[bytes, bytes]]:
+    apparatuses, details = fleet(devices)
+    return [
+        (json.dumps(raw).encode(), json.dumps(details[raw["apparatusId"]]).encode())
+        for raw in apparatuses
+    ]
+
+
+def _retained(build) -> tuple[object, int]:
+    """`build()`'s result and the bytes still allocated for it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def _decode_poll(bodies: list[tuple[bytes, bytes]]) -> dict[str, Item]:
+    items = {}
+    for entry, detail in bodies:
+        apparatus = decode(Apparatus, json_loads(entry))
+        items[str(apparatus.apparatusId)] = Item(
+            apparatus=apparatus,
+            apparatusDetail=decode(ApparatusDetail, json_loads(detail)),
+        )
+    return items
+
+
+def _parse_poll(bodies: list[tuple[bytes, bytes]]) -> list:
+    return [(json_loads(entry), json_loads(detail)) for entry, detail in bodies]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1000)
+    args = parser.parse_args()
+
+    bodies = _bodies(args.devices)
+    # Warm the decoder caches so they aren't counted against the fleet.
+    _decode_poll(bodies[:1])
+
+    payloads, payload_bytes = _retained(lambda: _parse_poll(bodies))
+    del payloads
+    items, model_bytes = _retained(lambda: _decode_poll(bodies))
+
+    size = sum(len(entry) + len(detail) for entry, detail in bodies)
+    print(f"{args.devices} devices, {size / 1024:.0f} KiB of JSON")
+    print(f"  parsed payloads : {payload_bytes / 1024:8.0f} KiB")
+    print(f"  decoded models  : {model_bytes / 1024:8.0f} KiB")
+    print(f"  per device      : {model_bytes / len(items):8.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Drive real polls against the local MobileLink stub and time them.
+
+    python -m benchmarks.bench_poll [--devices 200] [--polls 20]
+        [--concurrency 4] [--latency 0.05] [--error-rate 0.01]
+        [--rate-limit 0] [--coordinator]
+
+Every poll goes through the real `GeneracAuth` token refresh (including
+the DPoP nonce challenge) and `GeneracApiClient` HTTP path; with
+``--coordinator`` polls are driven through
+`GeneracDataUpdateCoordinator.async_refresh` on a bare HomeAssistant
+instance instead (needs homeassistant installed).
+
+The stub runs on its own event loop in a background thread, so the
+reported CPU time is the polling thread's alone.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+import types
+
+from benchmarks.mobilelink_stub import MobileLinkStub
+from benchmarks.mobilelink_stub import REFRESH_TOKEN
+from custom_components.generac.api import create_api_session
+from custom_components.generac.api import GeneracApiClient
+from custom_components.generac.auth import DPoPKey
+from custom_components.generac.auth import GeneracAuth
+
+
+class _StubThread(threading.Thread):
+    """Runs a `MobileLinkStub` on a private event loop."""
+
+    def __init__(self, stub: MobileLinkStub) -> None:
+        super().__init__(daemon=True)
+        self.stub = stub
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self.stub.start())
+        self._ready.set()
+        self.loop.run_forever()
+        self.loop.run_until_complete(self.stub.stop())
+        self.loop.close()
+
+    def __enter__(self) -> MobileLinkStub:
+        self.start()
+        self._ready.wait()
+        return self.stub
+
+    def __exit__(self, *exc) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _poll_client(client: GeneracApiClient):
+    try:
+        await client.async_get_data()
+    except Exception as ex:  # noqa: BLE001
+        return type(ex).__name__
+    return None
+
+
+async def _coordinator_poller(client: GeneracApiClient):
+    # Imported lazily: the plain client benchmark doesn't need HA.
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.generac.coordinator import GeneracDataUpdateCoordinator
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    # The coordinator checks the device registry for devices to remove.
+    await dr.async_load(hass)
+    entry = types.SimpleNamespace(
+        options={}, entry_id="bench", async_on_unload=lambda func: None
+    )
+    coordinator = GeneracDataUpdateCoordinator(hass, client, entry)
+
+    async def poll():
+        await coordinator.async_refresh()
+        if coordinator.last_update_success:
+            return None
+        return type(coordinator.last_exception).__name__
+
+    return hass, poll
+
+
+async def _run(args: argparse.Namespace, stub: MobileLinkStub) -> None:
+    async with create_api_session(args.concurrency) as session:
+        auth = GeneracAuth(
+            session, REFRESH_TOKEN, DPoPKey.generate(), token_url=stub.token_url
+        )
+        client = GeneracApiClient(
+            session,
+            auth,
+            max_concurrency=args.concurrency,
+            base_url=stub.api_base,
+        )
+        hass = None
+        if args.coordinator:
+            hass, poll = await _coordinator_poller(client)
+        else:
+
+            async def poll():
+                return await _poll_client(client)
+
+        # Warm-up: token refresh + nonce challenge, import costs.
+        await poll()
+
+        latencies: list[float] = []
+        failures: dict[str, int] = {}
+        cpu_start = time.thread_time()
+        for _ in range(args.polls):
+            start = time.perf_counter()
+            error = await poll()
+            latencies.append(time.perf_counter() - start)
+            if error is not None:
+                failures[error] = failures.get(error, 0) + 1
+        cpu = time.thread_time() - cpu_start
+        if hass is not None:
+            await hass.async_stop(force=True)
+
+    mode = "coordinator" if args.coordinator else "api client"
+    print(
+        f"{args.devices} devices, {args.polls} polls via {mode}, "
+        f"concurrency {args.concurrency}, latency {args.latency * 1000:.0f} ms"
+    )
+    print(f"  p50 poll       : {_percentile(latencies, 50) * 1000:8.1f} ms")
+    print(f"  p90 poll       : {_percentile(latencies, 90) * 1000:8.1f} ms")
+    print(f"  p99 poll       : {_percentile(latencies, 99) * 1000:8.1f} ms")
+    print(f"  max poll       : {max(latencies) * 1000:8.1f} ms")
+    print(f"  mean poll      : {statistics.fmean(latencies) * 1000:8.1f} ms")
+    print(f"  CPU total      : {cpu * 1000:8.1f} ms")
+    print(f"  CPU per poll   : {cpu / args.polls * 1000:8.1f} ms")
+    print(f"  failed polls   : {sum(failures.values())} {failures or ''}")
+    print(f"  server counters: {dict(stub.stats)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--coordinator", action="store_true")
+    args = parser.parse_args()
+
+    stub = MobileLinkStub(
+        args.devices,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+    )
+    with _StubThread(stub):
+        asyncio.run(_run(args, stub))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Synthetic MobileLink payloads shaped like real /Apparatus responses.
+
+Field names, nesting and property type codes follow what the API returns
+for generators (type 0) and propane tank monitors (type 2); values are
+randomised but deterministic for a given seed so runs are comparable.
+"""
+import random
+
+_STATUS_LABELS = ["Ready", "Running", "Exercising", "Warning", "Stopped"]
+_DEALERS = ["Acme Power Systems", "Standby Generator Co", "Northside Electric"]
+
+
+def _weather(rng: random.Random) -> dict:
+    return {
+        "temperature": {
+            "value": rng.randint(-10, 100),
+            "unit": "°F",
+            "unitType": 1,
+        },
+        "iconCode": rng.randint(1, 44),
+    }
+
+
+def apparatus_entry(apparatus_id: int, rng: random.Random) -> dict:
+    """One element of the /Apparatus/list response."""
+    is_tank = apparatus_id % 4 == 0
+    entry = {
+        "apparatusId": apparatus_id,
+        "serialNumber": f"{rng.randint(10**9, 10**10 - 1)}",
+        "name": f"{'Tank' if is_tank else 'Generator'} {apparatus_id}",
+        "type": 2 if is_tank else 0,
+        "localizedAddress": f"{rng.randint(1, 9999)} Main St, Springfield, IL",
+        "materialDescription": "Home Standby 22kW" if not is_tank else "Tank Utility",
+        "heroImageUrl": f"https://cdn.example.com/img/{apparatus_id}.png",
+        "apparatusStatus": rng.randint(1, 5),
+        "isConnected": True,
+        "isConnecting": False,
+        "showWarning": rng.random() < 0.05,
+        "weather": _weather(rng),
+        "preferredDealerName": rng.choice(_DEALERS),
+        "preferredDealerPhone": "555-0100",
+        "preferredDealerEmail": "service@example.com",
+        "isDealerManaged": True,
+        "isDealerUnmonitored": False,
+        "modelNumber": "G0072101" if not is_tank else "TU-LTE-2",
+        "panelId": f"P{apparatus_id:08d}",
+        "properties": [
+            {
+                "name": "Device",
+                "value": {
+                    "type": 0,
+                    "status": "Online",
+                    "isLegacy": False,
+                    "isRunning": False,
+                    "deviceId": f"dev-{apparatus_id}",
+                    "deviceType": "lte-tankutility-v2" if is_tank else "wifi",
+                    "signalStrength": f"{rng.randint(10, 100)}%",
+                    "batteryLevel": "good",
+                },
+                "type": 3,
+            },
+            {"name": "Subscriptions", "value": [], "type": 4},
+            {"name": "Model", "value": "22kW", "type": 5},
+        ],
+    }
+    return entry
+
+
+def apparatus_detail(apparatus_id: int, rng: random.Random) -> dict:
+    """The /Apparatus/details/{id} response for `apparatus_id`."""
+    is_tank = apparatus_id % 4 == 0
+    properties = [
+        {"name": f"Property {code}", "value": rng.uniform(0, 500), "type": code}
+        for code in (70, 71, 32, 31, 33, 36, 37, 38, 40, 41, 42, 43, 44, 45)
+    ]
+    tu_properties = (
+        [
+            {"name": "Fuel Type", "value": "Propane", "type": 0},
+            {"name": "Capacity", "value": 500, "type": 1},
+            {"name": "Orientation", "value": "horizontal", "type": 2},
+            {"name": "Fuel Level", "value": rng.randint(5, 95), "type": 9},
+            {
+                "name": "Last Reading",
+                "value": "2026-10-01T12:34:56.000Z",
+                "type": 11,
+            },
+            {"name": "Battery", "value": "good", "type": 17},
+        ]
+        if is_tank
+        else []
+    )
+    return {
+        "apparatusId": apparatus_id,
+        "name": f"{'Tank' if is_tank else 'Generator'} {apparatus_id}",
+        "serialNumber": f"{rng.randint(10**9, 10**10 - 1)}",
+        "apparatusClassification": 0,
+        "panelId": f"P{apparatus_id:08d}",
+        "activationDate": "2021-05-04T15:00:00Z",
+        "deviceType": "lte-tankutility-v2" if is_tank else "wifi",
+        "deviceSsid": "MLG-1234",
+        "shortDeviceId": f"{apparatus_id:06d}",
+        "apparatusStatus": rng.randint(1, 5),
+        "heroImageUrl": f"https://cdn.example.com/img/{apparatus_id}.png",
+        "statusLabel": rng.choice(_STATUS_LABELS),
+        "statusText": "Your generator is ready to run.",
+        "eCodeLabel": None,
+        "weather": _weather(rng),
+        "isConnected": True,
+        "isConnecting": False,
+        "showWarning": False,
+        "hasMaintenanceAlert": rng.random() < 0.1,
+        "lastSeen": "2026-10-01T12:34:56.123Z",
+        "connectionTimestamp": "2026-09-30T08:00:00Z",
+        "address": {
+            "line1": "123 Main St",
+            "line2": None,
+            "city": "Springfield",
+            "region": "IL",
+            "country": "US",
+            "postalCode": "62701",
+        },
+        "properties": properties,
+        "tuProperties": tu_properties,
+        "subscription": {
+            "type": 1,
+            "status": 1,
+            "isLegacy": False,
+            "isDunning": False,
+        },
+        "enrolledInVpp": False,
+        "hasActiveVppEvent": False,
+        "productInfo": [
+            {"name": "Fuel", "value": "Natural Gas", "type": 1},
+            {"name": "kW", "value": "22", "type": 2},
+        ],
+        "hasDisconnectedNotificationsOn": True,
+    }
+
+
+def fleet(size: int, seed: int = 0) -> tuple[list[dict], dict[int, dict]]:
+    """Return (/Apparatus/list payload, {apparatusId: details payload})."""
+    rng = random.Random(seed)
+    ids = range(1, size + 1)
+    apparatuses = [apparatus_entry(i, rng) for i in ids]
+    details = {i: apparatus_detail(i, rng) for i in ids}
+    return apparatuses, details
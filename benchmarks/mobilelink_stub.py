@@ -0,0 +1,263 @@
+"""Local stand-in for the MobileLink API and the Auth0 token endpoint.
+
+Serves just enough of both for `GeneracAuth` and `GeneracApiClient` to
+run their real HTTP code paths against it:
+
+* ``POST /oauth/token`` — DPoP refresh-token grant. Proofs must carry
+  the current server nonce; a missing or stale one gets the same
+  ``400 use_dpop_nonce`` + ``DPoP-Nonce`` challenge Auth0 sends.
+* ``GET /api/v5/Apparatus/list`` and ``GET /api/v5/Apparatus/details/{id}``
+  — Bearer-authenticated, backed by a synthetic fleet from
+  `benchmarks.fleet`.
+
+Fleet size, response latency, the share of requests failing with 500
+and a per-second request limit (answered with 429 + Retry-After) are
+configurable, so the same server covers integration checks and load
+benchmarks. Run it standalone with
+
+    python -m benchmarks.mobilelink_stub [--devices 100] [--port 8080]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import secrets
+import time
+from collections import Counter
+
+from aiohttp import web
+from benchmarks.fleet import fleet
+
+API_PREFIX = "/api/v5"
+TOKEN_PATH = "/oauth/token"
+REFRESH_TOKEN = "stub-refresh-token"
+
+
+def _jwt_payload(token: str) -> dict:
+    """Decode (without verifying) the payload segment of a compact JWT."""
+    try:
+        segment = token.split(".")[1]
+        segment += "=" * (-len(segment) % 4)
+        return json.loads(base64.urlsafe_b64decode(segment))
+    except (IndexError, ValueError):
+        return {}
+
+
+class MobileLinkStub:
+    """aiohttp application imitating MobileLink + Auth0 for one account."""
+
+    def __init__(
+        self,
+        devices: int = 10,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after: int = 1,
+        token_ttl: int = 3600,
+        nonce_ttl: float = 300.0,
+        seed: int = 0,
+    ) -> None:
+        self.apparatuses, self.details = fleet(devices, seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        # Requests per second per endpoint family before answering 429;
+        # 0 disables throttling.
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.token_ttl = token_ttl
+        self.nonce_ttl = nonce_ttl
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._tokens: set[str] = set()
+        self._nonce = ""
+        self._nonce_issued = 0.0
+        self._window = (0, 0)
+        self._runner: web.AppRunner | None = None
+        self.origin = ""
+
+    # -- server lifecycle -------------------------------------------------
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(TOKEN_PATH, self._token)
+        app.router.add_get(f"{API_PREFIX}/Apparatus/list", self._list)
+        app.router.add_get(f"{API_PREFIX}/Apparatus/details/{{id}}", self._details)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on `host:port` (0 = any free port) and return the origin."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = site._server.sockets[0].getsockname()  # noqa: SLF001
+        self.origin = f"http://{bound[0]}:{bound[1]}"
+        return self.origin
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @property
+    def api_base(self) -> str:
+        return self.origin + API_PREFIX
+
+    @property
+    def token_url(self) -> str:
+        return self.origin + TOKEN_PATH
+
+    # -- fault injection --------------------------------------------------
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay = max(0.0, self._rng.gauss(self.latency, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _throttled(self) -> bool:
+        if not self.rate_limit:
+            return False
+        second = int(time.monotonic())
+        window, count = self._window
+        count = count + 1 if window == second else 1
+        self._window = (second, count)
+        return count > self.rate_limit
+
+    def _fault(self) -> web.Response | None:
+        if self._throttled():
+            self.stats["429"] += 1
+            return web.json_response(
+                {"message": "Too Many Requests"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats["500"] += 1
+            return web.json_response({"message": "Internal Server Error"}, status=500)
+        return None
+
+    # -- Auth0 ------------------------------------------------------------
+
+    def _current_nonce(self) -> str:
+        now = time.monotonic()
+        if not self._nonce or now - self._nonce_issued >= self.nonce_ttl:
+            self._nonce = secrets.token_urlsafe(16)
+            self._nonce_issued = now
+        return self._nonce
+
+    async def _token(self, request: web.Request) -> web.Response:
+        self.stats["token"] += 1
+        await self._delay()
+        nonce = self._current_nonce()
+        proof = _jwt_payload(request.headers.get("DPoP", ""))
+        if proof.get("htm") != "POST" or proof.get("htu") != str(request.url):
+            return web.json_response(
+                {"error": "invalid_dpop_proof", "error_description": "bad proof"},
+                status=400,
+            )
+        if proof.get("nonce") != nonce:
+            self.stats["nonce_challenge"] += 1
+            return web.json_response(
+                {
+                    "error": "use_dpop_nonce",
+                    "error_description": "Authorization server requires nonce",
+                },
+                status=400,
+                headers={"DPoP-Nonce": nonce},
+            )
+        body = await request.json()
+        if body.get("refresh_token") != REFRESH_TOKEN:
+            return web.json_response(
+                {"error": "invalid_grant", "error_description": "Unknown token"},
+                status=403,
+            )
+        access_token = secrets.token_urlsafe(24)
+        self._tokens.add(access_token)
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "expires_in": self.token_ttl,
+                "scope": "openid email offline_access invoke:api",
+                "token_type": "DPoP",
+            },
+            headers={"DPoP-Nonce": nonce},
+        )
+
+    # -- MobileLink -------------------------------------------------------
+
+    def _authorized(self, request: web.Request) -> bool:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        return scheme == "Bearer" and token in self._tokens
+
+    async def _list(self, request: web.Request) -> web.Response:
+        self.stats["list"] += 1
+        await self._delay()
+        if not self._authorized(request):
+            return web.Response(status=401)
+        # Not `fault or ...`: an aiohttp Response is an empty mapping, so
+        # it is falsy.
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        return web.json_response(self.apparatuses)
+
+    async def _details(self, request: web.Request) -> web.Response:
+        self.stats["details"] += 1
+        await self._delay()
+        if not self._authorized(request):
+            return web.Response(status=401)
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        try:
+            detail = self.details[int(request.match_info["id"])]
+        except (KeyError, ValueError):
+            return web.json_response({"message": "Not Found"}, status=404)
+        return web.json_response(detail)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    stub = MobileLinkStub(
+        args.devices,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+    )
+    origin = await stub.start(args.host, args.port)
+    print(f"MobileLink stub for {args.devices} devices on {origin}")
+    print(f"  API base  : {stub.api_base}")
+    print(f"  token URL : {stub.token_url}")
+    print(f"  refresh_token: {REFRESH_TOKEN}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stub.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
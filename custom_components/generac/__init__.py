@@ -10,22 +10,53 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.storage import Store
 
 from .api import GeneracApiClient
 from .api import InvalidCredentialsException
-from .auth import GeneracAuth
+from .auth import acquire_shared_auth
 from .auth import InvalidGrantError
+from .auth import release_shared_auth
+from .capture import CAPTURE_FILENAME
+from .capture import PayloadCapture
+from .const import CONF_BACKGROUND_TOKEN_REFRESH
+from .const import CONF_CAPTURE_PAYLOADS
 from .const import CONF_DPOP_PEM
+from .const import CONF_FULL_REFRESH_POLLS
+from .const import CONF_MAX_CONCURRENCY
+from .const import CONF_RATE_BURST
+from .const import CONF_RATE_LIMIT
 from .const import CONF_REFRESH_TOKEN
+from .const import CONF_RETRY_ATTEMPTS
 from .const import CONF_USERNAME
+from .const import DEFAULT_BACKGROUND_TOKEN_REFRESH
+from .const import DEFAULT_CAPTURE_PAYLOADS
+from .const import DEFAULT_FULL_REFRESH_POLLS
+from .const import DEFAULT_MAX_CONCURRENCY
+from .const import DEFAULT_RATE_BURST
+from .const import DEFAULT_RATE_LIMIT
+from .const import DEFAULT_RETRY_ATTEMPTS
 from .const import DOMAIN
 from .const import PLATFORMS
 from .const import STARTUP_MESSAGE
 from .coordinator import GeneracDataUpdateCoordinator
-from .utils import async_client_session
+from .coordinator import snapshot_store
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy
+from .utils import async_api_session
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Access token, its expiry and the last DPoP nonce. Kept in a Store rather
+# than entry.data: the token changes hourly and every entry.data update
+# fires the reload listener.
+TOKEN_STORE_VERSION = 1
+
+
+def token_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, TOKEN_STORE_VERSION, f"{DOMAIN}.{entry_id}.auth")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up this integration using UI."""
@@ -42,42 +73,115 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         # somehow the credentials were lost. Either way, reauth.
         raise ConfigEntryAuthFailed("Missing refresh token or DPoP key")
 
-    session = await async_client_session(hass)
+    max_concurrency = entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+    session = await async_api_session(hass, entry, max_concurrency)
+    tokens = token_store(hass, entry.entry_id)
     try:
-        auth = GeneracAuth.from_storage(session, refresh_token, pem_str, email=email)
-    except Exception as ex:
-        _LOGGER.error("Failed to load stored credentials: %s", ex)
-        raise ConfigEntryAuthFailed("Stored credentials are unreadable") from ex
+        token_state = await tokens.async_load()
+    except Exception as ex:  # noqa: BLE001
+        _LOGGER.debug("Ignoring unreadable token state: %s", ex)
+        token_state = None
 
     async def _persist_rt(new_rt: str) -> None:
         hass.config_entries.async_update_entry(
             entry, data={**entry.data, CONF_REFRESH_TOKEN: new_rt}
         )
 
-    auth.set_refresh_token_persist_callback(_persist_rt)
+    async def _persist_token(state: dict | None) -> None:
+        if state is None:
+            await tokens.async_remove()
+        else:
+            # Runs under the auth's refresh lock: schedule the write rather
+            # than make every poll waiting on the token wait on the disk.
+            tokens.async_delay_save(lambda: state)
 
-    client = GeneracApiClient(session, auth)
-    coordinator = GeneracDataUpdateCoordinator(hass, client=client, config_entry=entry)
+    # Entries holding the same credential share one GeneracAuth, and with
+    # it one access token and one refresh at a time.
     try:
-        await coordinator.async_config_entry_first_refresh()
-    except InvalidCredentialsException as ex:
-        raise ConfigEntryAuthFailed(str(ex)) from ex
-    except InvalidGrantError as ex:
-        raise ConfigEntryAuthFailed(str(ex)) from ex
-    except (ConfigEntryAuthFailed, ConfigEntryNotReady):
-        # Let HA handle these — the coordinator already raises the right
-        # one. Wrapping them in ConfigEntryNotReady would mask reauth.
-        raise
+        auth = acquire_shared_auth(
+            entry.entry_id,
+            session,
+            refresh_token,
+            pem_str,
+            email=email,
+            token_state=token_state,
+            refresh_token_persist_cb=_persist_rt,
+            token_persist_cb=_persist_token,
+        )
     except Exception as ex:
-        raise ConfigEntryNotReady from ex
-
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        _LOGGER.error("Failed to load stored credentials: %s", ex)
+        raise ConfigEntryAuthFailed("Stored credentials are unreadable") from ex
+    # Also runs when setup fails below.
+    entry.async_on_unload(lambda: release_shared_auth(entry.entry_id, auth))
+
+    # Keyed by account so every entry logged in as the same user shares
+    # one bucket — Generac throttles per account, not per entry.
+    rate_limiter = get_rate_limiter(
+        email or entry.entry_id,
+        entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+    )
+    payload_capture = None
+    if entry.options.get(CONF_CAPTURE_PAYLOADS, DEFAULT_CAPTURE_PAYLOADS):
+        payload_capture = PayloadCapture(hass.config.path(CAPTURE_FILENAME))
+        payload_capture.start()
+        _LOGGER.warning("Capturing raw API responses to %s", payload_capture.path)
+
+        async def _stop_capture() -> None:
+            await hass.async_add_executor_job(payload_capture.stop)
+
+        entry.async_on_unload(_stop_capture)
+    client = GeneracApiClient(
+        session,
+        auth,
+        max_concurrency=max_concurrency,
+        full_refresh_polls=entry.options.get(
+            CONF_FULL_REFRESH_POLLS, DEFAULT_FULL_REFRESH_POLLS
+        ),
+        rate_limiter=rate_limiter,
+        payload_capture=payload_capture,
+        retry_policy=RetryPolicy(
+            entry.options.get(CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS)
+        ),
+    )
+    coordinator = GeneracDataUpdateCoordinator(hass, client=client, config_entry=entry)
+    # With a snapshot from the last good poll, entities come up from cache
+    # immediately and the first live refresh runs in the background.
+    # Without one, block on the first refresh as before.
+    if not await coordinator.async_load_snapshot():
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except InvalidCredentialsException as ex:
+            raise ConfigEntryAuthFailed(str(ex)) from ex
+        except InvalidGrantError as ex:
+            raise ConfigEntryAuthFailed(str(ex)) from ex
+        except (ConfigEntryAuthFailed, ConfigEntryNotReady):
+            # Let HA handle these — the coordinator already raises the right
+            # one. Wrapping them in ConfigEntryNotReady would mask reauth.
+            raise
+        except Exception as ex:
+            raise ConfigEntryNotReady from ex
+
+        if not coordinator.last_update_success:
+            raise ConfigEntryNotReady
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if coordinator.from_snapshot:
+        # Auth failures here still reach HA's reauth flow: the coordinator
+        # raises ConfigEntryAuthFailed and async_refresh starts reauth.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    if entry.options.get(
+        CONF_BACKGROUND_TOKEN_REFRESH, DEFAULT_BACKGROUND_TOKEN_REFRESH
+    ):
+        # Cancelled by HA when the entry unloads.
+        entry.async_create_background_task(
+            hass, auth.async_background_refresh(), f"{DOMAIN} token refresh"
+        )
     return True
 
 
@@ -87,10 +191,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unloaded:
         # Defensive default: if a previous reload already popped the
         # coordinator (e.g. mid-reconfigure race), don't KeyError.
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            # Stop polling now rather than when the entry's unload callbacks
+            # (which also drop the platforms' device listeners) run.
+            await coordinator.async_shutdown()
     return unloaded
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> bool:
+    """Allow deleting a device from the UI once MobileLink no longer lists it."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is None:
+        return True
+    data = coordinator.data or {}
+    return not any(
+        domain == DOMAIN and (device_id in data or device_id in coordinator.listed)
+        for domain, device_id in device.identifiers
+    )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the persisted snapshot and token state when the entry is deleted."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await token_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
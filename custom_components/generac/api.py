@@ -8,25 +8,145 @@ API versioning: `/api/v1`, `/api/v2`, and `/api/v5` were all observed
 returning identical payloads for the endpoints we use. The iOS app uses
 `/api/v5`; we follow suit for futureproofing.
 """
+import asyncio
+import hashlib
 import json
 import logging
+import time
+from typing import Callable
 
 import aiohttp
-from dacite import from_dict
 
 from .auth import GeneracAuth
 from .auth import InvalidGrantError
 from .auth import USER_AGENT_API
+from .breaker import CircuitBreaker
+from .capture import PayloadCapture
 from .const import ALLOWED_DEVICES
 from .const import API_BASE
+from .const import DEFAULT_FULL_REFRESH_POLLS
+from .const import DEFAULT_MAX_CONCURRENCY
+from .httpcache import body_digest
+from .httpcache import CachedResponse
+from .httpcache import ResponseCache
+from .metrics import PHASE_DECODE
+from .metrics import PHASE_DETAILS
+from .metrics import PHASE_LIST
+from .metrics import PHASE_TOKEN
+from .metrics import PollMetrics
 from .models import Apparatus
 from .models import ApparatusDetail
+from .models import decode
 from .models import Item
+from .ratelimit import parse_retry_after
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+
+try:
+    import orjson
+except ImportError:  # HA ships orjson; plain venvs (benchmarks) may not.
+    orjson = None
 
 TIMEOUT = 10
+# Enforced on every API request: the whole request, getting a pooled or
+# new connection (TCP + TLS), and any single wait for response data.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT, connect=5, sock_read=TIMEOUT)
+# Connection pool of the API session (see `create_api_session`).
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+# Longest slice of a response body written to the debug log.
+_DEBUG_PREVIEW_BYTES = 1000
+# How many times a request that drew a 429 is retried (after waiting out
+# Retry-After) before the poll fails.
+_THROTTLE_RETRIES = 1
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Response bodies are decoded with orjson when it is available: several
+# times faster than the stdlib on the list/detail payloads (see
+# benchmarks/bench_json.py). Both raise a ValueError subclass on bad input.
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+    json_loads = orjson.loads
+    _SORTED = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def _canonical_json(raw) -> bytes:
+        return orjson.dumps(raw, option=_SORTED, default=str)
+
+else:
+    JSON_BACKEND = "json"
+    json_loads = json.loads
+
+    def _canonical_json(raw) -> bytes:
+        return json.dumps(
+            raw, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+
+
+def _fingerprint(raw) -> str:
+    """Stable digest of one /Apparatus/list entry.
+
+    Used by incremental polling to detect whether a device changed since
+    the previous poll without keeping the whole raw entry around. Only
+    compared within one process, so the backend's exact output doesn't
+    matter as long as it is canonical.
+    """
+    return hashlib.blake2b(_canonical_json(raw), digest_size=16).hexdigest()
+
+
+def _preview(body: bytes) -> str:
+    """Bounded, printable excerpt of a response body for debug logging."""
+    text = body[:_DEBUG_PREVIEW_BYTES].decode("utf-8", "replace")
+    if len(body) > _DEBUG_PREVIEW_BYTES:
+        text += f"... ({len(body)} bytes)"
+    return text
+
+
+def create_api_session(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY, **kwargs
+) -> aiohttp.ClientSession:
+    """A session whose pool matches the client's detail fan-out.
+
+    Each host gets `max_concurrency` connections — exactly what the
+    fan-out uses — kept alive between requests so a poll pays for one
+    TLS handshake per connection rather than per request. DNS answers
+    are cached for the same reason. Requests default to REQUEST_TIMEOUT,
+    so the token refresh sharing this session can't hang a poll either.
+    `kwargs` go to `ClientSession`; `ssl` goes to the connector.
+    """
+    per_host = max(1, int(max_concurrency))
+    connector = aiohttp.TCPConnector(
+        # The API host plus the token endpoint.
+        limit=per_host + 1,
+        limit_per_host=per_host,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ssl=kwargs.pop("ssl", True),
+    )
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+
+async def _gather_or_cancel(coros: list) -> list:
+    """Run `coros` concurrently and return their results in order.
+
+    Unlike a bare `asyncio.gather`, the first exception cancels every
+    sibling that is still in flight, so a failed poll doesn't leave
+    orphaned requests running against the API after it has returned.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class _TransientStatus(Exception):
+    """A retryable HTTP status (5xx); never escapes get_endpoint."""
+
 
 class InvalidCredentialsException(Exception):
     """Credentials supplied by the user were rejected."""
@@ -36,6 +156,10 @@ class SessionExpiredException(Exception):
     """The current access token / refresh token is no longer valid."""
 
 
+class ServerErrorException(SessionExpiredException):
+    """MobileLink answered with a 5xx (after any retries)."""
+
+
 class GeneracApiClient:
     """HTTP client for the MobileLink API.
 
@@ -48,16 +172,89 @@ class GeneracApiClient:
         self,
         session: aiohttp.ClientSession,
         auth: GeneracAuth,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        full_refresh_polls: int = DEFAULT_FULL_REFRESH_POLLS,
+        rate_limiter: TokenBucket | None = None,
+        base_url: str = API_BASE,
+        payload_capture: PayloadCapture | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        timeout: aiohttp.ClientTimeout = REQUEST_TIMEOUT,
     ) -> None:
         self._session = session
+        self._base_url = base_url
         self._auth = auth
+        self._rate_limiter = rate_limiter
+        self._payload_capture = payload_capture
+        self._retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._timeout = timeout
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._full_refresh_polls = max(1, int(full_refresh_polls))
+        self._poll_count = 0
+        # apparatusId -> (list-entry fingerprint, detail decoded from it).
+        self._detail_cache: dict[str, tuple[str, ApparatusDetail]] = {}
+        # Last payload per URL, for conditional requests (see httpcache).
+        self._responses = ResponseCache()
+        # The /Apparatus/list payload last decoded, what it decoded to and
+        # the device IDs it lists.
+        self._list_decoded: tuple[
+            list, list[tuple[Apparatus, str]], frozenset[str]
+        ] | None = None
+        self.metrics = PollMetrics()
 
-    async def async_get_data(self) -> dict[str, Item] | None:
-        """Top-level entry point used by the coordinator."""
-        return await self.get_device_data()
+    @property
+    def rate_limiter(self) -> TokenBucket | None:
+        return self._rate_limiter
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self._responses
+
+    async def async_get_data(
+        self, select: Callable[[list[Apparatus]], set[str]] | None = None
+    ) -> tuple[dict[str, Item], frozenset[str]]:
+        """Top-level entry point used by the coordinator.
+
+        Returns `get_device_data`'s devices together with the ID of every
+        device /Apparatus/list reported, including those skipped this poll
+        (empty or malformed details, malformed or unsupported list entry):
+        a device is only gone when the list itself leaves it out.
+        """
+        probe = self.breaker.before_poll()
+        with self.metrics.poll():
+            try:
+                result = await self._poll(select, probe)
+            except (IOError, ServerErrorException):
+                self.breaker.record_failure()
+                raise
+        self.breaker.record_success()
+        return result
 
-    async def get_device_data(self) -> dict[str, Item] | None:
-        apparatuses = await self.get_endpoint("/Apparatus/list")
+    async def get_device_data(
+        self, select: Callable[[list[Apparatus]], set[str]] | None = None
+    ) -> dict[str, Item]:
+        """Poll the device list and the details of (some of) the devices.
+
+        `select`, when given, picks the IDs of the devices whose details
+        are re-fetched this poll (adaptive polling); every other device
+        reuses its detail from the previous poll. Devices without one are
+        always fetched.
+
+        Raises `CircuitOpenError` without making any request while the
+        circuit breaker is open.
+        """
+        items, _ = await self.async_get_data(select)
+        return items
+
+    async def _poll(
+        self, select: Callable[[list[Apparatus]], set[str]] | None, probe: bool
+    ) -> tuple[dict[str, Item], frozenset[str]]:
+        with self.metrics.timer(PHASE_LIST):
+            # A half-open probe gets one shot; the breaker decides when
+            # to try again.
+            apparatuses = await self.get_endpoint("/Apparatus/list", retry=not probe)
         if apparatuses is None:
             # Decode failure on /Apparatus/list — surface as a poll
             # failure rather than treating it as "fleet has zero devices".
@@ -68,10 +265,68 @@ class GeneracApiClient:
                 f"{str(apparatuses)[:200]}"
             )
 
+        full_refresh = self._poll_count % self._full_refresh_polls == 0
+
+        # One entry per device plus the list itself.
+        self._responses.reserve(len(apparatuses) + 1)
+
+        if self._list_decoded is not None and self._list_decoded[0] is apparatuses:
+            # Unchanged list body: get_endpoint handed back the payload
+            # decoded last time.
+            _, wanted, listed = self._list_decoded
+        else:
+            wanted, listed = self._decode_list(apparatuses)
+            self._list_decoded = (apparatuses, wanted, listed)
+
+        refresh = None
+        if select is not None:
+            refresh = select([apparatus for apparatus, _ in wanted])
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(apparatus: Apparatus, fingerprint: str) -> Item | None:
+            device_id = str(apparatus.apparatusId)
+            cached = self._detail_cache.get(device_id)
+            if cached is not None:
+                if refresh is not None:
+                    if device_id not in refresh:
+                        return Item(apparatus, cached[1])
+                elif not full_refresh and cached[0] == fingerprint:
+                    return Item(apparatus, cached[1])
+            async with semaphore:
+                return await self._get_item(apparatus)
+
+        with self.metrics.timer(PHASE_DETAILS):
+            items = await _gather_or_cancel([_bounded(a, fp) for a, fp in wanted])
+
         data: dict[str, Item] = {}
+        detail_cache: dict[str, tuple[str, ApparatusDetail]] = {}
+        for (apparatus, fingerprint), item in zip(wanted, items):
+            if item is not None:
+                device_id = str(apparatus.apparatusId)
+                data[device_id] = item
+                detail_cache[device_id] = (fingerprint, item.apparatusDetail)
+        # Rebuilt every poll so devices that vanished or failed to decode
+        # are always re-fetched next time.
+        self._detail_cache = detail_cache
+        self._poll_count += 1
+        return data, listed
+
+    def _decode_list(
+        self, apparatuses: list
+    ) -> tuple[list[tuple[Apparatus, str]], frozenset[str]]:
+        """Decode /Apparatus/list into (apparatus, fingerprint) pairs.
+
+        Also returns the IDs of all listed devices, decodable or not.
+        """
+        wanted: list[tuple[Apparatus, str]] = []
+        listed: set[str] = set()
         for raw in apparatuses:
+            if isinstance(raw, dict) and raw.get("apparatusId") is not None:
+                listed.add(str(raw["apparatusId"]))
             try:
-                apparatus = from_dict(Apparatus, raw)
+                with self.metrics.timer(PHASE_DECODE):
+                    apparatus = decode(Apparatus, raw)
             except Exception as ex:
                 _LOGGER.warning(
                     "Skipping malformed apparatus entry: %s (raw=%s)",
@@ -84,76 +339,203 @@ class GeneracApiClient:
                     "Unknown apparatus type %s %s", apparatus.type, apparatus.name
                 )
                 continue
+            wanted.append((apparatus, _fingerprint(raw)))
+        return wanted, frozenset(listed)
+
+    async def _get_item(self, apparatus: Apparatus) -> Item | None:
+        """Fetch and decode the detail payload for one apparatus.
 
-            detail_json = await self.get_endpoint(
-                f"/Apparatus/details/{apparatus.apparatusId}"
+        Returns None when the detail payload is missing or malformed so the
+        device is skipped for this poll. Transport / auth errors propagate
+        and fail the whole poll, exactly as in the sequential version.
+        """
+        endpoint = f"/Apparatus/details/{apparatus.apparatusId}"
+        detail_json = await self.get_endpoint(endpoint)
+        if detail_json is None:
+            _LOGGER.debug(
+                "Could not decode response from /Apparatus/details/%s",
+                apparatus.apparatusId,
             )
-            if detail_json is None:
-                _LOGGER.debug(
-                    "Could not decode response from /Apparatus/details/%s",
-                    apparatus.apparatusId,
-                )
-                continue
+            return None
+        cached = self._responses.get(self._base_url + endpoint)
+        if cached is not None and cached.payload is not detail_json:
+            cached = None
+        if cached is not None and isinstance(cached.decoded, ApparatusDetail):
+            # Body unchanged since it was last decoded.
+            return Item(apparatus, cached.decoded)
+        try:
+            with self.metrics.timer(PHASE_DECODE):
+                detail = decode(ApparatusDetail, detail_json)
+        except Exception as ex:
+            _LOGGER.warning(
+                "Skipping apparatus %s due to malformed detail payload: %s",
+                apparatus.apparatusId,
+                ex,
+            )
+            return None
+        if cached is not None:
+            cached.decoded = detail
+        return Item(apparatus, detail)
+
+    async def get_endpoint(self, endpoint: str, *, retry: bool = True):
+        """GET `endpoint` and return its decoded JSON body.
+
+        Responses are cached per URL (see `httpcache`): when the server
+        answers 304, or with the same body as last time, the payload
+        returned last time is returned again without parsing. Transient
+        failures are retried according to the client's `RetryPolicy`
+        unless `retry` is False.
+        """
+        url = self._base_url + endpoint
+        throttled = 0
+        failures = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+
             try:
-                detail = from_dict(ApparatusDetail, detail_json)
-            except Exception as ex:
-                _LOGGER.warning(
-                    "Skipping apparatus %s due to malformed detail payload: %s",
-                    apparatus.apparatusId,
-                    ex,
-                )
-                continue
-            data[str(apparatus.apparatusId)] = Item(apparatus, detail)
-        return data
+                with self.metrics.timer(PHASE_TOKEN):
+                    access_token = await self._auth.ensure_access_token()
+            except InvalidGrantError as ex:
+                raise InvalidCredentialsException(str(ex)) from ex
 
-    async def get_endpoint(self, endpoint: str):
-        try:
-            access_token = await self._auth.ensure_access_token()
-        except InvalidGrantError as ex:
-            raise InvalidCredentialsException(str(ex)) from ex
-
-        # Bearer is intentional here, even though this access token is
-        # DPoP-*bound* (authorize sends dpop_jkt, so the token carries a
-        # cnf.jkt claim). Probed 2026-06-25 (probe_rs_dpop.py): the MobileLink
-        # resource server does NOT implement DPoP — `Authorization: DPoP` + a
-        # valid `ath` proof 401s, identically to a wrong-key proof (so it's
-        # rejecting the scheme, not validating proofs), while Bearer with the
-        # same bound token returns 200. Do NOT "finish" the dormant
-        # DPoPKey.sign_proof(access_token=...)/ath path by switching this to the
-        # DPoP scheme: it would 401 every poll for every user on the next
-        # refresh. Re-probe first; only wire a resource-side proof if the RS has
-        # started honoring DPoP (200 on a valid proof, or a use_dpop_nonce
-        # challenge).
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/json",
-            "User-Agent": USER_AGENT_API,
-        }
-
-        url = API_BASE + endpoint
-        try:
-            async with self._session.get(url, headers=headers) as response:
-                if response.status == 204:
-                    return None
-
-                if response.status == 401:
-                    raise SessionExpiredException(f"API returned 401 for {endpoint}")
-
-                if response.status != 200:
-                    body = ""
-                    try:
-                        body = (await response.text())[:200]
-                    except Exception:
-                        pass
-                    raise SessionExpiredException(
-                        f"API returned status code {response.status} for "
-                        f"{endpoint}: {body}"
+            # Bearer is intentional here, even though this access token is
+            # DPoP-*bound* (authorize sends dpop_jkt, so the token carries a
+            # cnf.jkt claim). Probed 2026-06-25 (probe_rs_dpop.py): the MobileLink
+            # resource server does NOT implement DPoP — `Authorization: DPoP` + a
+            # valid `ath` proof 401s, identically to a wrong-key proof (so it's
+            # rejecting the scheme, not validating proofs), while Bearer with the
+            # same bound token returns 200. Do NOT "finish" the dormant
+            # DPoPKey.sign_proof(access_token=...)/ath path by switching this to the
+            # DPoP scheme: it would 401 every poll for every user on the next
+            # refresh. Re-probe first; only wire a resource-side proof if the RS has
+            # started honoring DPoP (200 on a valid proof, or a use_dpop_nonce
+            # challenge).
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/json",
+                "User-Agent": USER_AGENT_API,
+            }
+            cached = self._responses.get(url)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+            start = time.perf_counter()
+            nbytes = 0
+            error = None
+            hit = False
+            try:
+                async with self._session.get(
+                    url, headers=headers, timeout=self._timeout
+                ) as response:
+                    length = response.content_length
+                    if isinstance(length, int):
+                        nbytes = length
+                    if response.status == 304 and cached is not None:
+                        hit = True
+                        self._responses.hits += 1
+                        return cached.payload
+
+                    if response.status != 200:
+                        error = f"http_{response.status}"
+
+                    if response.status == 204:
+                        return None
+
+                    if response.status == 401:
+                        raise SessionExpiredException(
+                            f"API returned 401 for {endpoint}"
+                        )
+
+                    if response.status == 429 and self._rate_limiter is not None:
+                        # Throttled: hold back every request sharing this
+                        # account's bucket, then retry this one.
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        self._rate_limiter.penalize(retry_after)
+                        if throttled < _THROTTLE_RETRIES:
+                            throttled += 1
+                            _LOGGER.warning(
+                                "API throttled %s; backing off %.0fs",
+                                endpoint,
+                                retry_after,
+                            )
+                            continue
+
+                    if response.status != 200:
+                        body = ""
+                        try:
+                            body = await response.text()
+                        except Exception:
+                            pass
+                        if self._payload_capture is not None:
+                            self._payload_capture.record(
+                                endpoint, response.status, body
+                            )
+                        body = body[:200]
+                        if self._retry_policy.retryable_status(response.status):
+                            if retry and self._retry_policy.allows(failures + 1):
+                                raise _TransientStatus(body)
+                            raise ServerErrorException(
+                                f"API returned status code {response.status} for "
+                                f"{endpoint}: {body}"
+                            )
+                        raise SessionExpiredException(
+                            f"API returned status code {response.status} for "
+                            f"{endpoint}: {body}"
+                        )
+
+                    body = await response.read()
+                    if not isinstance(length, int):
+                        nbytes = len(body)
+                    if self._payload_capture is not None:
+                        self._payload_capture.record(endpoint, response.status, body)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("getEndpoint %s: %s", endpoint, _preview(body))
+                    digest = body_digest(body)
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if cached is not None and cached.digest == digest:
+                        hit = True
+                        self._responses.hits += 1
+                        cached.etag = etag
+                        cached.last_modified = last_modified
+                        return cached.payload
+
+                    self._responses.misses += 1
+                    data = json_loads(body)
+                    self._responses.put(
+                        url, CachedResponse(digest, data, etag, last_modified)
                     )
+                    return data
+            except SessionExpiredException:
+                raise
+            except _TransientStatus:
+                pass
+            except Exception as ex:
+                error = type(ex).__name__
+                if not (
+                    retry
+                    and self._retry_policy.retryable_error(ex)
+                    and self._retry_policy.allows(failures + 1)
+                ):
+                    raise IOError(
+                        f"GET {url} failed: {type(ex).__name__}: {ex}"
+                    ) from ex
+            finally:
+                self.metrics.record_request(
+                    endpoint, time.perf_counter() - start, nbytes, error, hit
+                )
 
-                data = await response.json()
-                _LOGGER.debug("getEndpoint %s", json.dumps(data))
-                return data
-        except SessionExpiredException:
-            raise
-        except Exception as ex:
-            raise IOError(f"GET {url} failed: {type(ex).__name__}: {ex}") from ex
+            # Only reached for a transient failure that may be retried.
+            failures += 1
+            delay = self._retry_policy.delay(failures)
+            _LOGGER.debug(
+                "GET %s failed (%s), retry %d in %.1fs",
+                endpoint,
+                error,
+                failures,
+                delay,
+            )
+            await asyncio.sleep(delay)
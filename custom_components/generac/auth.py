@@ -23,12 +23,14 @@ import base64
 import hashlib
 import json
 import logging
+import random
 import re
 import secrets
 import time
 import urllib.parse
 import uuid
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Awaitable
 from typing import Callable
 from typing import Optional
@@ -78,6 +80,10 @@ _AUTH0_CLIENT_HEADER = (
 )
 
 
+# Stateless; shared by every proof instead of being rebuilt per signature.
+_ES256 = ec.ECDSA(hashes.SHA256())
+
+
 def _b64url(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
@@ -148,6 +154,14 @@ class DPoPKey:
     private_key: ec.EllipticCurvePrivateKey
     jwk: dict
     thumbprint: str
+    # base64url(JSON) of the proof header, which only depends on the key.
+    _header_segment: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        header = {"alg": "ES256", "typ": "dpop+jwt", "jwk": self.jwk}
+        self._header_segment = _b64url(
+            json.dumps(header, separators=(",", ":")).encode()
+        )
 
     @classmethod
     def generate(cls) -> "DPoPKey":
@@ -195,7 +209,6 @@ class DPoPKey:
         nonce: Optional[str] = None,
         access_token: Optional[str] = None,
     ) -> str:
-        header = {"alg": "ES256", "typ": "dpop+jwt", "jwk": self.jwk}
         payload: dict = {
             "jti": str(uuid.uuid4()),
             "htm": htm.upper(),
@@ -209,15 +222,15 @@ class DPoPKey:
             payload["ath"] = _b64url(ath)
 
         signing_input = (
-            _b64url(json.dumps(header, separators=(",", ":")).encode())
+            self._header_segment
             + "."
             + _b64url(json.dumps(payload, separators=(",", ":")).encode())
-        ).encode("ascii")
+        )
 
-        der_sig = self.private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+        der_sig = self.private_key.sign(signing_input.encode("ascii"), _ES256)
         r, s = decode_dss_signature(der_sig)
         raw_sig = r.to_bytes(32, "big") + s.to_bytes(32, "big")
-        return signing_input.decode("ascii") + "." + _b64url(raw_sig)
+        return signing_input + "." + _b64url(raw_sig)
 
 
 def _make_pkce() -> tuple[str, str]:
@@ -834,6 +847,14 @@ class GeneracAuth:
 
     # Refresh slightly before expiry so callers always see a fresh token.
     _ACCESS_TOKEN_LEEWAY = 60
+    # Background refresh (see `async_background_refresh`) renews this long
+    # before expiry — capped at a quarter of the token lifetime — plus up
+    # to half as much again of random jitter, so entries sharing an
+    # account don't all hit Auth0 at the same moment.
+    _PROACTIVE_LEAD = 300
+    # Retry delays after a failed background refresh (5xx / network).
+    _PROACTIVE_RETRY_MIN = 5
+    _PROACTIVE_RETRY_MAX = 300
 
     def __init__(
         self,
@@ -842,16 +863,27 @@ class GeneracAuth:
         key: DPoPKey,
         *,
         email: Optional[str] = None,
+        token_url: str = TOKEN_URL,
     ) -> None:
         self._session = session
         self._refresh_token = refresh_token
         self._key = key
         self._email = email
+        self._token_url = token_url
         self._access_token: Optional[str] = None
         self._access_token_exp: float = 0.0
+        self._access_token_ttl: float = 0.0
+        # Set once the first access token has been minted.
+        self._token_minted = asyncio.Event()
         self._dpop_nonce: Optional[str] = None
         self._refresh_lock = asyncio.Lock()
+        # Held by the running `async_background_refresh` loop; a shared
+        # instance gets one loop per entry, only one of which is active.
+        self._background_lock = asyncio.Lock()
         self._rt_persist_cb: Optional[Callable[[str], Awaitable[None]]] = None
+        self._token_persist_cb: Optional[
+            Callable[[Optional[dict]], Awaitable[None]]
+        ] = None
 
     def set_refresh_token_persist_callback(
         self, cb: Optional[Callable[[str], Awaitable[None]]]
@@ -863,6 +895,19 @@ class GeneracAuth:
         """
         self._rt_persist_cb = cb
 
+    def set_token_persist_callback(
+        self, cb: Optional[Callable[[Optional[dict]], Awaitable[None]]]
+    ) -> None:
+        """Register an async callback that persists `token_state()`.
+
+        Called after every successful refresh with the new state, and with
+        None when the grant is rejected so the stored token is dropped.
+        Restoring the state on the next start (`from_storage(...,
+        token_state=...)`) skips the startup token refresh and its
+        `use_dpop_nonce` round-trip.
+        """
+        self._token_persist_cb = cb
+
     @classmethod
     async def login(
         cls, session: aiohttp.ClientSession, email: str, password: str
@@ -905,9 +950,14 @@ class GeneracAuth:
         pem_str: str,
         *,
         email: Optional[str] = None,
+        token_url: str = TOKEN_URL,
+        token_state: Optional[dict] = None,
     ) -> "GeneracAuth":
         key = DPoPKey.from_pem_str(pem_str)
-        return cls(session, refresh_token, key, email=email)
+        auth = cls(session, refresh_token, key, email=email, token_url=token_url)
+        if token_state is not None:
+            auth.restore_token_state(token_state)
+        return auth
 
     @property
     def refresh_token(self) -> str:
@@ -921,6 +971,55 @@ class GeneracAuth:
     def email(self) -> Optional[str]:
         return self._email
 
+    def _credential_binding(self) -> str:
+        """Digest tying persisted token state to this RT + DPoP key pair."""
+        return _binding(self._key.thumbprint, self._refresh_token)
+
+    def token_state(self) -> dict:
+        """The short-lived auth state worth keeping across restarts."""
+        return {
+            "binding": self._credential_binding(),
+            "access_token": self._access_token,
+            "expires_at": self._access_token_exp,
+            "expires_in": self._access_token_ttl,
+            "dpop_nonce": self._dpop_nonce,
+        }
+
+    def restore_token_state(self, state: dict) -> bool:
+        """Adopt persisted token state; return True if the token was usable.
+
+        State saved for a different refresh token or DPoP key (e.g. before
+        a reauth) is ignored outright. The DPoP nonce is restored even if
+        the token has expired — at worst Auth0 challenges it again.
+        """
+        if not isinstance(state, dict):
+            return False
+        if state.get("binding") != self._credential_binding():
+            _LOGGER.debug("Ignoring stored token state for other credentials")
+            return False
+        self._dpop_nonce = state.get("dpop_nonce") or None
+        access_token = state.get("access_token")
+        try:
+            expires_at = float(state.get("expires_at") or 0)
+            ttl = float(state.get("expires_in") or 0)
+        except (TypeError, ValueError):
+            return False
+        if not access_token or time.time() >= expires_at - self._ACCESS_TOKEN_LEEWAY:
+            return False
+        self._access_token = access_token
+        self._access_token_exp = expires_at
+        self._access_token_ttl = ttl
+        self._token_minted.set()
+        return True
+
+    async def _persist_token_state(self, state: Optional[dict]) -> None:
+        if self._token_persist_cb is None:
+            return
+        try:
+            await self._token_persist_cb(state)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to persist access token state")
+
     async def ensure_access_token(self) -> str:
         """Return a non-expired access token, refreshing if necessary."""
         if (
@@ -941,6 +1040,66 @@ class GeneracAuth:
             assert self._access_token is not None
             return self._access_token
 
+    def _proactive_lead(self) -> float:
+        lead = min(self._PROACTIVE_LEAD, self._access_token_ttl / 4)
+        return max(lead, self._ACCESS_TOKEN_LEEWAY)
+
+    async def async_background_refresh(self) -> None:
+        """Keep the access token fresh ahead of expiry, forever.
+
+        Meant to run as a background task next to the poller so polls
+        never pay for token minting on their critical path; the lazy
+        refresh in `ensure_access_token` remains the fallback and mints
+        the first token, which this task waits for. Refreshes
+        go through `_refresh_lock`, so a concurrent lazy refresh is never
+        duplicated. Transient failures (5xx, network) are retried with
+        exponential backoff; an invalid grant ends the task and is left
+        for the next poll to surface as reauth.
+
+        When several entries share this instance (`acquire_shared_auth`)
+        each runs this task; they queue on `_background_lock` and the next
+        takes over when the active one is cancelled.
+        """
+        async with self._background_lock:
+            await self._background_refresh()
+
+    async def _background_refresh(self) -> None:
+        await self._token_minted.wait()
+        retry = self._PROACTIVE_RETRY_MIN
+        while True:
+            lead = self._proactive_lead()
+            delay = self._access_token_exp - lead - random.uniform(0, lead / 2)
+            delay -= time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with self._refresh_lock:
+                    # A lazy refresh may have won the race while we slept.
+                    if time.time() >= self._access_token_exp - self._proactive_lead():
+                        await self._refresh()
+            except InvalidGrantError as ex:
+                _LOGGER.warning("Background token refresh stopped: %s", ex)
+                return
+            except Exception as ex:  # noqa: BLE001
+                delay = random.uniform(retry / 2, retry)
+                _LOGGER.warning(
+                    "Background token refresh failed, retrying in %.0fs: %s",
+                    delay,
+                    ex,
+                )
+                await asyncio.sleep(delay)
+                retry = min(retry * 2, self._PROACTIVE_RETRY_MAX)
+            else:
+                retry = self._PROACTIVE_RETRY_MIN
+                if self._access_token_ttl <= self._proactive_lead():
+                    # Too short-lived to renew ahead of time without
+                    # spinning; leave it to the lazy path.
+                    _LOGGER.debug(
+                        "Access token lifetime %ss too short for background refresh",
+                        self._access_token_ttl,
+                    )
+                    return
+
     async def _refresh(self) -> None:
         body = {
             "grant_type": "refresh_token",
@@ -949,7 +1108,7 @@ class GeneracAuth:
         }
 
         async def _post(nonce: str | None) -> tuple[int, dict, str | None]:
-            proof = self._key.sign_proof("POST", TOKEN_URL, nonce=nonce)
+            proof = self._key.sign_proof("POST", self._token_url, nonce=nonce)
             headers = {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
@@ -957,7 +1116,7 @@ class GeneracAuth:
                 "User-Agent": USER_AGENT_API,
             }
             async with self._session.post(
-                TOKEN_URL, json=body, headers=headers
+                self._token_url, json=body, headers=headers
             ) as resp:
                 text = await resp.text()
                 try:
@@ -975,7 +1134,9 @@ class GeneracAuth:
 
         if status == 200:
             self._access_token = payload["access_token"]
-            self._access_token_exp = time.time() + int(payload.get("expires_in", 0))
+            self._access_token_ttl = int(payload.get("expires_in", 0))
+            self._access_token_exp = time.time() + self._access_token_ttl
+            self._token_minted.set()
             _LOGGER.info(
                 "Token refresh OK: expires_in=%s scope=%s token_type=%s",
                 payload.get("expires_in"),
@@ -1001,6 +1162,7 @@ class GeneracAuth:
                         "Refresh token rotated but no persist callback registered; "
                         "next HA restart will need reauth"
                     )
+            await self._persist_token_state(self.token_state())
             return
 
         # OAuth2 (RFC 6749 §5.2) mandates HTTP 400 for invalid_grant, but
@@ -1010,6 +1172,7 @@ class GeneracAuth:
         # falling through to a generic RuntimeError that silently freezes every
         # entity as "unavailable" with no user-facing prompt to re-login.
         if payload.get("error") == "invalid_grant":
+            await self._persist_token_state(None)
             raise InvalidGrantError(payload.get("error_description", "invalid_grant"))
 
         # Any other outright rejection from the token endpoint (401/403) means
@@ -1018,8 +1181,125 @@ class GeneracAuth:
         # UpdateFailed forever. Transient 5xx / network errors fall through to
         # RuntimeError below so the coordinator retries instead of prompting.
         if status in (401, 403):
+            await self._persist_token_state(None)
             raise InvalidGrantError(
                 f"token endpoint rejected credentials ({status}): {payload}"
             )
 
         raise RuntimeError(f"token refresh failed: {status} {payload}")
+
+
+# ---------------------------------------------------------------------------
+# Process-wide sharing of GeneracAuth between config entries
+# ---------------------------------------------------------------------------
+#
+# Entries holding the same credential (refresh token + DPoP key) share one
+# GeneracAuth, so they share its access token, nonce and `_refresh_lock`:
+# a refresh triggered by any of them serves all of them, and two entries
+# polling at the same moment never both hit the token endpoint.
+
+_SHARED: dict[str, "_SharedAuth"] = {}
+
+
+def _binding(thumbprint: str, refresh_token: str) -> str:
+    material = f"{thumbprint}:{refresh_token}".encode()
+    return hashlib.sha256(material).hexdigest()
+
+
+class _SharedAuth:
+    """One GeneracAuth plus the persist callbacks of every entry using it."""
+
+    def __init__(self, key: str, auth: GeneracAuth) -> None:
+        self.key = key
+        self.auth = auth
+        self.rt_callbacks: dict[str, Callable[[str], Awaitable[None]]] = {}
+        self.token_callbacks: dict[
+            str, Callable[[Optional[dict]], Awaitable[None]]
+        ] = {}
+        self.owners: set[str] = set()
+        # Each holder's session; refreshes use one that is still open.
+        self.sessions: dict[str, aiohttp.ClientSession] = {}
+        auth.set_refresh_token_persist_callback(self._persist_rt)
+        auth.set_token_persist_callback(self._persist_token)
+
+    async def _persist_rt(self, new_rt: str) -> None:
+        # Follow the rotation before the holders store the new token: an
+        # entry reloaded with it (persisting can trigger that) must find
+        # this instance, not start a second one on the same token lineage.
+        if _SHARED.get(self.key) is self:
+            del _SHARED[self.key]
+        self.key = _binding(self.auth._key.thumbprint, new_rt)
+        _SHARED[self.key] = self
+        for owner, cb in list(self.rt_callbacks.items()):
+            try:
+                await cb(new_rt)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Failed to persist refresh token for %s", owner)
+
+    async def _persist_token(self, state: Optional[dict]) -> None:
+        for owner, cb in list(self.token_callbacks.items()):
+            try:
+                await cb(state)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Failed to persist token state for %s", owner)
+
+
+def acquire_shared_auth(
+    owner: str,
+    session: aiohttp.ClientSession,
+    refresh_token: str,
+    pem_str: str,
+    *,
+    email: Optional[str] = None,
+    token_url: str = TOKEN_URL,
+    token_state: Optional[dict] = None,
+    refresh_token_persist_cb: Optional[Callable[[str], Awaitable[None]]] = None,
+    token_persist_cb: Optional[Callable[[Optional[dict]], Awaitable[None]]] = None,
+) -> GeneracAuth:
+    """Return the process-wide GeneracAuth for this credential.
+
+    `owner` (the config entry id) is registered as a holder until
+    `release_shared_auth`; its persist callbacks are called alongside
+    those of every other holder. The first holder's `session` is used for
+    token refreshes until that holder is released. `token_state` is only
+    consulted when the shared instance has no access token yet.
+    """
+    key = _binding(DPoPKey.from_pem_str(pem_str).thumbprint, refresh_token)
+    shared = _SHARED.get(key)
+    if shared is None:
+        auth = GeneracAuth.from_storage(
+            session,
+            refresh_token,
+            pem_str,
+            email=email,
+            token_url=token_url,
+            token_state=token_state,
+        )
+        shared = _SHARED[key] = _SharedAuth(key, auth)
+    elif token_state is not None and not shared.auth._token_minted.is_set():
+        shared.auth.restore_token_state(token_state)
+    if shared.owners - {owner}:
+        _LOGGER.debug("Sharing access token with %s", sorted(shared.owners))
+    shared.owners.add(owner)
+    shared.sessions[owner] = session
+    if refresh_token_persist_cb is not None:
+        shared.rt_callbacks[owner] = refresh_token_persist_cb
+    if token_persist_cb is not None:
+        shared.token_callbacks[owner] = token_persist_cb
+    return shared.auth
+
+
+def release_shared_auth(owner: str, auth: GeneracAuth) -> None:
+    """Drop `owner`'s hold on `auth`; the last holder out discards it."""
+    for shared in list(_SHARED.values()):
+        if shared.auth is not auth:
+            continue
+        shared.owners.discard(owner)
+        shared.rt_callbacks.pop(owner, None)
+        shared.token_callbacks.pop(owner, None)
+        session = shared.sessions.pop(owner, None)
+        if not shared.owners:
+            del _SHARED[shared.key]
+        elif shared.auth._session is session:
+            # The leaving entry closes its session when it unloads.
+            shared.auth._session = next(iter(shared.sessions.values()))
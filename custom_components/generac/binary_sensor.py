@@ -7,9 +7,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEFAULT_NAME
 from .const import DOMAIN
 from .coordinator import GeneracDataUpdateCoordinator
+from .entity import async_add_device_entities
 from .entity import GeneracEntity
 
 
@@ -18,13 +18,14 @@ async def async_setup_entry(
 ):
     """Setup binary_sensor platform."""
     coordinator: GeneracDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    data = coordinator.data
-    if isinstance(data, dict):
-        async_add_entities(
-            sensor(coordinator, entry, device_id, item)
-            for device_id, item in data.items()
-            for sensor in sensors()
-        )
+    async_add_device_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        lambda device_id, item: (
+            sensor(coordinator, entry, device_id, item) for sensor in sensors()
+        ),
+    )
 
 
 def sensors() -> Type[GeneracEntity]:
@@ -36,22 +37,11 @@ def sensors() -> Type[GeneracEntity]:
     ]
 
 
-def sensor_name(self, name_label):
-    return f"{DEFAULT_NAME}_{self.device_id}_{name_label}"
-
-
 class GeneracConnectedSensor(GeneracEntity, BinarySensorEntity):
     """generac binary_sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the binary_sensor."""
-        return sensor_name(self, "is_connected")
-
-    @property
-    def device_class(self):
-        """Return the class of this binary_sensor."""
-        return BinarySensorDeviceClass.CONNECTIVITY
+    name_suffix = "is_connected"
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
     @property
     def is_on(self):
@@ -62,15 +52,8 @@ class GeneracConnectedSensor(GeneracEntity, BinarySensorEntity):
 class GeneracConnectingSensor(GeneracEntity, BinarySensorEntity):
     """generac binary_sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the binary_sensor."""
-        return sensor_name(self, "is_connecting")
-
-    @property
-    def device_class(self):
-        """Return the class of this binary_sensor."""
-        return BinarySensorDeviceClass.CONNECTIVITY
+    name_suffix = "is_connecting"
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
     @property
     def is_on(self):
@@ -81,15 +64,8 @@ class GeneracConnectingSensor(GeneracEntity, BinarySensorEntity):
 class GeneracMaintenanceAlertSensor(GeneracEntity, BinarySensorEntity):
     """generac binary_sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the binary_sensor."""
-        return sensor_name(self, "has_maintenance_alert")
-
-    @property
-    def device_class(self):
-        """Return the class of this binary_sensor."""
-        return BinarySensorDeviceClass.SAFETY
+    name_suffix = "has_maintenance_alert"
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
 
     @property
     def is_on(self):
@@ -100,15 +76,8 @@ class GeneracMaintenanceAlertSensor(GeneracEntity, BinarySensorEntity):
 class GeneracWarningSensor(GeneracEntity, BinarySensorEntity):
     """generac binary_sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the binary_sensor."""
-        return sensor_name(self, "show_warning")
-
-    @property
-    def device_class(self):
-        """Return the class of this binary_sensor."""
-        return BinarySensorDeviceClass.SAFETY
+    name_suffix = "show_warning"
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
 
     @property
     def is_on(self):
@@ -0,0 +1,96 @@
+"""Circuit breaker around the MobileLink cloud.
+
+After `failure_threshold` consecutive polls fail with an outage-class
+error (transport failure or 5xx), the breaker opens: polls fail at once
+with `CircuitOpenError`, without touching the network, until
+`reset_timeout` has passed. The next poll is then a half-open probe —
+its /Apparatus/list call is made without retries, and only if that
+succeeds does the rest of the poll go ahead. A successful probe closes
+the breaker; a failed one re-opens it for twice as long, up to
+`max_reset_timeout`.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+from typing import Optional
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+STATES = [STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN]
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 300.0
+DEFAULT_MAX_RESET_TIMEOUT = 3600.0
+
+
+class CircuitOpenError(IOError):
+    """The breaker is open; the poll was skipped without any request."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        max_reset_timeout: float = DEFAULT_MAX_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max(reset_timeout, max_reset_timeout)
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.short_circuited = 0
+
+    def retry_in(self, now: Optional[float] = None) -> float:
+        """Seconds until the next half-open probe (0 unless open)."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.opened_at + self.reset_timeout - now)
+
+    def before_poll(self, now: Optional[float] = None) -> bool:
+        """Gate a poll; return True if it is a half-open probe.
+
+        Raises `CircuitOpenError` while the breaker is open.
+        """
+        if self.state == STATE_CLOSED:
+            return False
+        if self.state == STATE_OPEN:
+            remaining = self.retry_in(now)
+            if remaining > 0:
+                self.short_circuited += 1
+                raise CircuitOpenError(
+                    f"MobileLink unreachable; next attempt in {remaining:.0f}s"
+                )
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.reset_timeout = self.base_reset_timeout
+
+    def record_failure(self, now: Optional[float] = None) -> None:
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+        elif self.failures < self.failure_threshold:
+            return
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic() if now is None else now
+        self.times_opened += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in": round(self.retry_in(), 1),
+            "reset_timeout": self.reset_timeout,
+            "times_opened": self.times_opened,
+            "short_circuited_polls": self.short_circuited,
+        }
@@ -0,0 +1,59 @@
+"""Opt-in capture of raw MobileLink responses for troubleshooting.
+
+With the `capture_payloads` option on, every response body the API
+client receives is appended to a size-capped, rotating file in the HA
+config directory instead of the HA log. Records are handed to a
+`QueueHandler`; a `QueueListener` thread does the file I/O, so the event
+loop never blocks on disk.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
+
+CAPTURE_FILENAME = "generac_payloads.log"
+CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+CAPTURE_BACKUPS = 3
+
+
+class PayloadCapture:
+    """Writes `endpoint status body` lines to a rotating file."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        backups: int = CAPTURE_BACKUPS,
+    ) -> None:
+        self.path = path
+        self.captured = 0
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        # delay=True: the file is first opened by the listener thread.
+        self._handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True
+        )
+        self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self._listener = QueueListener(records, self._handler)
+        # Deliberately not from logging.getLogger(): payloads must never
+        # reach the HA log through propagation or a root handler.
+        self._logger = logging.Logger(f"{__package__}.payloads", logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(QueueHandler(records))
+
+    def start(self) -> None:
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Flush pending records and close the file. Blocks; run off-loop."""
+        self._listener.stop()
+        self._handler.close()
+
+    def record(self, endpoint: str, status: int, body: bytes | str) -> None:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        self._logger.info("%s %s %s", endpoint, status, body)
+        self.captured += 1
@@ -31,6 +31,38 @@ DEFAULT_NAME = DOMAIN
 # faster than this provides little benefit and risks hitting their
 # throttles.
 DEFAULT_SCAN_INTERVAL = 900
+# Upper bound on concurrent /Apparatus/details requests per poll. Large
+# dealer-managed fleets are polled in roughly the time of the slowest few
+# requests instead of the sum of all of them. 1 restores the old
+# one-at-a-time behaviour.
+DEFAULT_MAX_CONCURRENCY = 4
+# Incremental polling: /Apparatus/details is only re-fetched for devices
+# whose /Apparatus/list entry changed since the previous poll, and every
+# N-th poll refreshes everything regardless. 1 = refresh every device on
+# every poll (incremental polling off).
+DEFAULT_FULL_REFRESH_POLLS = 1
+# Client-side token bucket shared by every entry on the same account:
+# sustained requests per minute (0 = unlimited) and how many may be
+# spent back-to-back. Off by default so it doesn't cap the detail
+# fan-out on large fleets; a 429's Retry-After still pauses the account.
+DEFAULT_RATE_LIMIT = 0
+DEFAULT_RATE_BURST = 20
+# Adaptive polling: each device gets its own detail cadence. Running,
+# exercising, warning or connecting units are re-fetched every
+# DEFAULT_ACTIVE_SCAN_INTERVAL seconds, idle ones every scan_interval, and
+# the whole thing stays under DEFAULT_REQUEST_BUDGET requests per hour.
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_ACTIVE_SCAN_INTERVAL = 60
+DEFAULT_REQUEST_BUDGET = 240
+# Renew the access token in the background shortly before it expires so
+# polls never wait on Auth0.
+DEFAULT_BACKGROUND_TOKEN_REFRESH = True
+# Attempts per API request: timeouts, connection errors and 5xx answers
+# are retried with exponential, jittered backoff. 1 = no retries.
+DEFAULT_RETRY_ATTEMPTS = 3
+# Troubleshooting: append every raw API response to a rotating file in
+# the config directory (see capture.py).
+DEFAULT_CAPTURE_PAYLOADS = False
 
 # Platforms
 BINARY_SENSOR = "binary_sensor"
@@ -52,6 +84,16 @@ CONF_MFA_CODE = "mfa_code"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_DPOP_PEM = "dpop_pem"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_FULL_REFRESH_POLLS = "full_refresh_polls"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_ACTIVE_SCAN_INTERVAL = "active_scan_interval"
+CONF_REQUEST_BUDGET = "request_budget"
+CONF_BACKGROUND_TOKEN_REFRESH = "background_token_refresh"
+CONF_CAPTURE_PAYLOADS = "capture_payloads"
+CONF_RETRY_ATTEMPTS = "retry_attempts"
 
 # Options
 bool_opts = {}
@@ -60,6 +102,19 @@ for p in PLATFORMS:
 CONF_OPTIONS = {
     **bool_opts,
     CONF_SCAN_INTERVAL: {"type": int, "default": DEFAULT_SCAN_INTERVAL},
+    CONF_MAX_CONCURRENCY: {"type": int, "default": DEFAULT_MAX_CONCURRENCY},
+    CONF_FULL_REFRESH_POLLS: {"type": int, "default": DEFAULT_FULL_REFRESH_POLLS},
+    CONF_RATE_LIMIT: {"type": int, "default": DEFAULT_RATE_LIMIT},
+    CONF_RATE_BURST: {"type": int, "default": DEFAULT_RATE_BURST},
+    CONF_ADAPTIVE_POLLING: {"type": bool, "default": DEFAULT_ADAPTIVE_POLLING},
+    CONF_ACTIVE_SCAN_INTERVAL: {"type": int, "default": DEFAULT_ACTIVE_SCAN_INTERVAL},
+    CONF_REQUEST_BUDGET: {"type": int, "default": DEFAULT_REQUEST_BUDGET},
+    CONF_BACKGROUND_TOKEN_REFRESH: {
+        "type": bool,
+        "default": DEFAULT_BACKGROUND_TOKEN_REFRESH,
+    },
+    CONF_CAPTURE_PAYLOADS: {"type": bool, "default": DEFAULT_CAPTURE_PAYLOADS},
+    CONF_RETRY_ATTEMPTS: {"type": int, "default": DEFAULT_RETRY_ATTEMPTS},
 }
 
 STARTUP_MESSAGE = f"""
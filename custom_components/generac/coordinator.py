@@ -1,9 +1,16 @@
 import logging
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
@@ -11,13 +18,234 @@ from .api import GeneracApiClient
 from .api import InvalidCredentialsException
 from .api import SessionExpiredException
 from .auth import InvalidGrantError
+from .breaker import CircuitOpenError
+from .const import CONF_ACTIVE_SCAN_INTERVAL
+from .const import CONF_ADAPTIVE_POLLING
+from .const import CONF_REQUEST_BUDGET
 from .const import CONF_SCAN_INTERVAL
+from .const import DEFAULT_ACTIVE_SCAN_INTERVAL
+from .const import DEFAULT_ADAPTIVE_POLLING
+from .const import DEFAULT_REQUEST_BUDGET
 from .const import DEFAULT_SCAN_INTERVAL
+from .const import DEVICE_TYPE_PROPANE_MONITOR
 from .const import DOMAIN
+from .diff import diff_fleet
+from .diff import FleetDiff
+from .models import Apparatus
+from .models import ApparatusDetail
+from .models import decode
 from .models import Item
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Last good poll, persisted so entities can come up from cache on restart
+# instead of waiting for a token refresh plus 1+N HTTP calls.
+SNAPSHOT_VERSION = 1
+# Coalesce snapshot writes; a pending write is flushed on HA shutdown.
+SNAPSHOT_SAVE_DELAY = 60
+# A device missing from /Apparatus/list keeps its (unavailable) entities
+# this long before it is removed, so a flaky list doesn't churn entities.
+DEVICE_REMOVAL_GRACE = 3600
+# Item fields shown in the device registry; a change to either is pushed
+# to the registry entry, and entities' cached device_info, on that poll.
+DEVICE_INFO_FIELDS = ("apparatus.name", "apparatus.modelNumber")
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def _compact(value: Any) -> Any:
+    """Drop None-valued keys recursively; decoding restores them as None."""
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_compact(v) for v in value]
+    return value
+
+
+def dump_snapshot(items: dict[str, Item]) -> dict[str, Any]:
+    return {
+        "devices": {
+            device_id: [
+                _compact(asdict(item.apparatus)),
+                _compact(asdict(item.apparatusDetail)),
+            ]
+            for device_id, item in items.items()
+        }
+    }
+
+
+def load_snapshot(data: dict[str, Any]) -> dict[str, Item]:
+    return {
+        device_id: Item(decode(Apparatus, apparatus), decode(ApparatusDetail, detail))
+        for device_id, (apparatus, detail) in data["devices"].items()
+    }
+
+
+# Adaptive polling. apparatusStatus values worth watching closely:
+# 2 = Running, 3 = Exercising, 4 = Warning.
+ACTIVE_STATUSES = frozenset({2, 3, 4})
+# tuProperties type code of a tank monitor's last reading date.
+TANK_READING_DATE = 11
+# Tank monitors whose reading hasn't advanced back off, doubling up to
+# this many times the normal scan interval.
+MAX_IDLE_BACKOFF = 4
+# A device counts as due this many seconds early, so timer jitter doesn't
+# push it back by a whole tick.
+_DUE_SLACK = 5.0
+
+
+def is_active(apparatus: Apparatus) -> bool:
+    return apparatus.apparatusStatus in ACTIVE_STATUSES or bool(apparatus.isConnecting)
+
+
+@dataclass
+class _DeviceSchedule:
+    last_fetch: float
+    active: bool = False
+    backoff: int = 1
+    reading: Any = None
+
+
+class PollScheduler:
+    """Per-device /Apparatus/details cadence under an hourly request budget.
+
+    /Apparatus/list is still fetched on every coordinator tick (it is what
+    tells us a device became active); the scheduler picks which devices
+    also get their details re-fetched on that tick and how long to wait
+    until the next one:
+
+    * active devices (running, exercising, warning or connecting) every
+      `active_interval` seconds;
+    * propane monitors whose reading date didn't move since the previous
+      fetch back off, doubling up to `MAX_IDLE_BACKOFF` x `interval`;
+    * everything else every `interval` seconds.
+
+    Every request, the list call included, is charged against an
+    allowance that refills at `budget` requests per hour. When more
+    devices are due than the allowance covers, active ones go first and
+    the rest wait. Devices seen for the first time are always fetched; a
+    fetch that returns no detail still counts, so such a device is tried
+    again once due, like any other.
+    """
+
+    def __init__(self, interval: float, active_interval: float, budget: int) -> None:
+        self.interval = float(max(1, interval))
+        self.active_interval = float(min(max(1, active_interval), self.interval))
+        self.budget = max(1, int(budget))
+        self._allowance = float(self.budget)
+        self._updated: float | None = None
+        self._devices: dict[str, _DeviceSchedule] = {}
+        self._listed: set[str] = set()
+        self._pending: set[str] = set()
+        self._deferred = 0
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._allowance = min(
+                float(self.budget),
+                self._allowance + (now - self._updated) * self.budget / 3600,
+            )
+        self._updated = now
+
+    def _period(self, state: _DeviceSchedule) -> float:
+        if state.active:
+            return self.active_interval
+        return self.interval * state.backoff
+
+    def select(
+        self, apparatuses: list[Apparatus], now: float | None = None
+    ) -> set[str]:
+        """IDs of the devices whose details should be fetched this tick."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        # The /Apparatus/list call that produced `apparatuses`.
+        self._allowance -= 1
+        chosen: set[str] = set()
+        due = []
+        self._listed = set()
+        for apparatus in apparatuses:
+            device_id = str(apparatus.apparatusId)
+            self._listed.add(device_id)
+            state = self._devices.get(device_id)
+            if state is None:
+                chosen.add(device_id)
+                continue
+            # Use the fresh list status so a unit that just started is
+            # picked up on this tick rather than after its idle period.
+            state.active = is_active(apparatus)
+            overdue = now - state.last_fetch - self._period(state)
+            if overdue + _DUE_SLACK >= 0:
+                due.append((not state.active, -overdue, device_id))
+        self._allowance -= len(chosen)
+        due.sort()
+        spend = min(len(due), max(0, int(self._allowance)))
+        chosen.update(device_id for _, _, device_id in due[:spend])
+        self._allowance -= spend
+        self._deferred = len(due) - spend
+        if self._deferred:
+            _LOGGER.debug(
+                "Request budget exhausted; deferring %d device(s)", self._deferred
+            )
+        self._pending = chosen
+        return chosen
+
+    def commit(self, items: dict[str, Item], now: float | None = None) -> None:
+        """Record the devices fetched by the last successful poll."""
+        now = time.monotonic() if now is None else now
+        for device_id in self._devices.keys() - self._listed:
+            del self._devices[device_id]
+        for device_id in self._pending:
+            state = self._devices.get(device_id)
+            if state is None:
+                state = self._devices[device_id] = _DeviceSchedule(now)
+            state.last_fetch = now
+            item = items.get(device_id)
+            if item is None:
+                # Listed, but its details were skipped: keep the cadence
+                # so it is retried when due, within the budget.
+                continue
+            state.active = is_active(item.apparatus)
+            reading = None
+            if item.apparatus.type == DEVICE_TYPE_PROPANE_MONITOR:
+                reading = item.apparatusDetail.tu_property_value(TANK_READING_DATE)
+            if reading is not None and reading == state.reading:
+                state.backoff = min(state.backoff * 2, MAX_IDLE_BACKOFF)
+            else:
+                state.backoff = 1
+            state.reading = reading
+        self._pending = set()
+
+    def next_interval(self, now: float | None = None) -> float:
+        """Seconds until the next tick: when the next device falls due."""
+        now = time.monotonic() if now is None else now
+        delay = min(
+            (
+                state.last_fetch + self._period(state) - now
+                for state in self._devices.values()
+            ),
+            default=self.interval,
+        )
+        if self._deferred:
+            # Devices are waiting on the budget: come back once the
+            # allowance covers the list call plus one detail request.
+            refill = max(0.0, 2 - self._allowance) * 3600 / self.budget
+            delay = max(delay, refill)
+        return min(self.interval, max(self.active_interval, delay))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Snapshot of the scheduler state for diagnostics."""
+        return {
+            "interval": self.interval,
+            "active_interval": self.active_interval,
+            "budget_per_hour": self.budget,
+            "allowance": round(self._allowance, 2),
+            "deferred": self._deferred,
+            "active_devices": sum(s.active for s in self._devices.values()),
+            "backed_off_devices": sum(s.backoff > 1 for s in self._devices.values()),
+        }
+
 
 class GeneracDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Item]]):
     """Class to manage fetching data from the API."""
@@ -30,9 +258,36 @@ class GeneracDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Item]]):
         self.api = client
         self._config_entry = config_entry
         self.is_online = False
+        # True while `data` came from the persisted snapshot and no live
+        # poll has succeeded yet.
+        self.from_snapshot = False
+        self._snapshot_store: Store | None = None
+        self._snapshot_pending = False
+        # What the last poll changed, per device and field. Entities use it
+        # to skip state writes when nothing they show has changed.
+        self.changes = FleetDiff()
+        # Devices removed from HA by the last poll (see DEVICE_REMOVAL_GRACE),
+        # and since when each device still registered has been missing.
+        self.purged: set[str] = set()
+        # Every device the last successful poll's /Apparatus/list reported,
+        # including those whose details it skipped.
+        self.listed: frozenset[str] = frozenset()
+        # Devices whose DEVICE_INFO_FIELDS changed in the last poll.
+        self.renamed: set[str] = set()
+        self._missing_since: dict[str, float] | None = None
         scan_interval = timedelta(
             seconds=config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         )
+        self._scan_interval = scan_interval
+        self.scheduler: PollScheduler | None = None
+        if config_entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            self.scheduler = PollScheduler(
+                scan_interval.total_seconds(),
+                config_entry.options.get(
+                    CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+                ),
+                config_entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET),
+            )
         super().__init__(
             hass,
             _LOGGER,
@@ -41,26 +296,170 @@ class GeneracDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Item]]):
             config_entry=config_entry,
         )
 
+    async def async_load_snapshot(self) -> bool:
+        """Seed `data` from the persisted snapshot and enable saving it.
+
+        Returns True when cached devices were loaded, in which case the
+        caller can set up entities right away and run the first live
+        refresh in the background.
+        """
+        self._snapshot_store = snapshot_store(self.hass, self._config_entry.entry_id)
+        try:
+            stored = await self._snapshot_store.async_load()
+            if not stored:
+                return False
+            items = load_snapshot(stored)
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.warning("Ignoring unreadable Generac snapshot: %s", ex)
+            return False
+        if not items:
+            return False
+        _LOGGER.info("Loaded %d device(s) from the Generac snapshot", len(items))
+        self.data = items
+        # Last known state was online; the first live poll corrects it.
+        self.is_online = True
+        self.from_snapshot = True
+        return True
+
+    @callback
+    def _purge_missing_devices(
+        self, listed: frozenset[str], previous: frozenset[str]
+    ) -> set[str]:
+        """Remove devices missing for DEVICE_REMOVAL_GRACE; return their IDs.
+
+        Only devices absent from /Apparatus/list itself (`listed`) count as
+        missing: one whose details were skipped this poll stays, showing
+        unavailable. A device leaves the list either from the last poll's
+        items or, if its details were already being skipped, from the last
+        poll's list (`previous`), so both seed the grace period. Removing the device from the device registry removes
+        its entities on every platform.
+        """
+        registry = dr.async_get(self.hass)
+        entry_id = self._config_entry.entry_id
+        now = time.monotonic()
+        if self._missing_since is None:
+            # First live poll: also catch devices that vanished while HA
+            # was down, or whose grace period a restart interrupted. Set
+            # only once the sweep has succeeded, so a failure retries it.
+            missing_since = {}
+            for device in dr.async_entries_for_config_entry(registry, entry_id):
+                for domain, device_id in device.identifiers:
+                    if domain == DOMAIN and device_id not in listed:
+                        missing_since[device_id] = now
+            self._missing_since = missing_since
+        for device_id in (previous | self.changes.removed) - listed:
+            self._missing_since.setdefault(device_id, now)
+        purged = set()
+        for device_id, since in list(self._missing_since.items()):
+            if device_id in listed:
+                del self._missing_since[device_id]
+            elif now - since >= DEVICE_REMOVAL_GRACE:
+                del self._missing_since[device_id]
+                purged.add(device_id)
+                device = registry.async_get_device(identifiers={(DOMAIN, device_id)})
+                if device is not None:
+                    _LOGGER.info("Removing device %s, gone from MobileLink", device_id)
+                    registry.async_update_device(
+                        device.id, remove_config_entry_id=entry_id
+                    )
+        return purged
+
+    @callback
+    def _update_device_info(self, items: dict[str, Item]) -> set[str]:
+        """Rename or re-model registry devices whose apparatus changed.
+
+        Returns the IDs of those devices, worked out once per poll so each
+        entity only needs a set lookup to know its device_info is stale.
+        """
+        registry = dr.async_get(self.hass)
+        renamed = set()
+        for device_id, diff in self.changes.devices.items():
+            if not diff.touches(*DEVICE_INFO_FIELDS):
+                continue
+            renamed.add(device_id)
+            device = registry.async_get_device(identifiers={(DOMAIN, device_id)})
+            if device is not None:
+                apparatus = items[device_id].apparatus
+                registry.async_update_device(
+                    device.id, name=apparatus.name, model=apparatus.modelNumber
+                )
+        return renamed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the entity state writes."""
+        start = time.perf_counter()
+        super().async_update_listeners()
+        self.api.metrics.record_entity_writes(time.perf_counter() - start)
+
+    @callback
+    def _schedule_snapshot_save(self) -> None:
+        # Store.async_delay_save restarts its delay on every call, so with
+        # polls closer together than SNAPSHOT_SAVE_DELAY the write would
+        # only happen on shutdown. The pending write dumps `data` as of
+        # when it runs, so later polls are still saved.
+        if self._snapshot_pending:
+            return
+        self._snapshot_pending = True
+
+        def _dump() -> dict[str, Any]:
+            self._snapshot_pending = False
+            return dump_snapshot(self.data)
+
+        self._snapshot_store.async_delay_save(_dump, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _poll_failed(self) -> None:
+        self.changes = FleetDiff()
+        self.is_online = False
+        # Retry at the base cadence: the active one only applies while
+        # polls succeed and show a device running.
+        self.update_interval = self._scan_interval
+
     async def _async_update_data(self):
         """Update data via library."""
+        self.purged = set()
+        self.renamed = set()
         try:
             _LOGGER.info("Polling Generac cloud for device data")
-            items = await self.api.async_get_data()
+            if self.scheduler is None:
+                items, listed = await self.api.async_get_data()
+            else:
+                items, listed = await self.api.async_get_data(
+                    select=self.scheduler.select
+                )
             self.is_online = items is not None
+            if self.scheduler is not None and items is not None:
+                self.scheduler.commit(items)
+                # Applies to the tick scheduled once this refresh returns.
+                self.update_interval = timedelta(seconds=self.scheduler.next_interval())
             _LOGGER.info("Generac poll OK: %d device(s)", len(items) if items else 0)
+            self.changes = diff_fleet(self.data, items)
+            if items is not None:
+                self.purged = self._purge_missing_devices(listed, self.listed)
+                self.listed = listed
+                self.renamed = self._update_device_info(items)
+            self.from_snapshot = False
+            if self._snapshot_store is not None and items:
+                self._schedule_snapshot_save()
             return items
         except (InvalidCredentialsException, InvalidGrantError) as ex:
             # Refresh token / login no longer valid — trigger HA reauth flow.
             _LOGGER.warning("Generac auth rejected, requesting reauth: %s", ex)
-            self.is_online = False
+            self._poll_failed()
             raise ConfigEntryAuthFailed(str(ex)) from ex
+        except CircuitOpenError as ex:
+            # Expected while the cloud is down; no traceback per poll.
+            _LOGGER.debug("Generac poll skipped: %s", ex)
+            self._poll_failed()
+            raise UpdateFailed(str(ex)) from ex
         except SessionExpiredException as ex:
             # 401 / non-200 from the API. Surface it loudly so it shows up
             # in HA logs instead of silently freezing entities.
             _LOGGER.warning("Generac API session error: %s", ex)
-            self.is_online = False
+            self._poll_failed()
             raise UpdateFailed(f"API session error: {ex}") from ex
         except Exception as exception:
             _LOGGER.exception("Unexpected error refreshing Generac data")
-            self.is_online = False
+            self._poll_failed()
             raise UpdateFailed(str(exception)) from exception
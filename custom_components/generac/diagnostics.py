@@ -24,6 +24,15 @@ async def async_get_config_entry_diagnostics(
             {gen_id: asdict(item) for gen_id, item in coordinator.data.items()}, False
         ),
     }
+    diagnostics_data["metrics"] = coordinator.api.metrics.as_dict()
+    diagnostics_data["response_cache"] = coordinator.api.response_cache.as_dict()
+    diagnostics_data["circuit_breaker"] = coordinator.api.breaker.as_dict()
+    diagnostics_data["last_changes"] = coordinator.changes.as_dict()
+    rate_limiter = coordinator.api.rate_limiter
+    if rate_limiter is not None:
+        diagnostics_data["rate_limiter"] = rate_limiter.as_dict()
+    if coordinator.scheduler is not None:
+        diagnostics_data["scheduler"] = coordinator.scheduler.as_dict()
 
     return diagnostics_data
 
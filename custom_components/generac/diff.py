@@ -0,0 +1,173 @@
+"""Structural diff between consecutive fleet snapshots.
+
+`diff_fleet` compares the previous poll's `dict[str, Item]` with the new
+one and reports, per device, which fields were added (None before, set
+now), removed (set before, None now) or changed. Fields are named by
+their path from the Item, e.g. `apparatusDetail.weather.temperature.value`.
+Property lists (`properties`, `tuProperties`) are compared by type code
+with the same first-entry-wins rule as `property_value`, so reordering a
+list is not a change and a single property shows up as
+`apparatusDetail.properties[70]`.
+
+Parts that compare equal are not walked — objects reused from the
+previous poll (see `httpcache`) already on identity — so an unchanged
+device costs one equality check.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import is_dataclass
+from functools import cache
+from typing import Any
+
+from .models import Item
+
+
+@dataclass(slots=True)
+class DeviceDiff:
+    """Field paths that differ between two snapshots of one device."""
+
+    added: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
+    changed: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def paths(self) -> frozenset[str]:
+        return self.added | self.removed | self.changed
+
+    def touches(self, *prefixes: str) -> bool:
+        """Whether any differing path is one of `prefixes` or lies below one."""
+        for path in self.paths:
+            for prefix in prefixes:
+                if path == prefix or (
+                    path.startswith(prefix) and path[len(prefix)] in ".["
+                ):
+                    return True
+        return False
+
+    def as_dict(self) -> dict[str, list[str]]:
+        return {
+            "added": sorted(self.added),
+            "removed": sorted(self.removed),
+            "changed": sorted(self.changed),
+        }
+
+
+@dataclass(slots=True)
+class FleetDiff:
+    """Devices that appeared, disappeared or changed since the last poll."""
+
+    added: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
+    devices: dict[str, DeviceDiff] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.devices)
+
+    def __contains__(self, device_id: object) -> bool:
+        return (
+            device_id in self.devices
+            or device_id in self.added
+            or device_id in self.removed
+        )
+
+    def device_ids(self) -> set[str]:
+        return set(self.added | self.removed | self.devices.keys())
+
+    def get(self, device_id: str) -> DeviceDiff | None:
+        return self.devices.get(device_id)
+
+    def touches(self, device_id: str, *prefixes: str) -> bool:
+        """Whether `device_id` came, went, or changed under any of `prefixes`.
+
+        Without `prefixes`, any change to the device counts.
+        """
+        if device_id in self.added or device_id in self.removed:
+            return True
+        diff = self.devices.get(device_id)
+        if diff is None:
+            return False
+        return not prefixes or diff.touches(*prefixes)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "added": sorted(self.added),
+            "removed": sorted(self.removed),
+            "changed": {
+                device_id: diff.as_dict() for device_id, diff in self.devices.items()
+            },
+        }
+
+
+def diff_fleet(
+    previous: dict[str, Item] | None, current: dict[str, Item] | None
+) -> FleetDiff:
+    previous = previous or {}
+    current = current or {}
+    devices = {}
+    for device_id, item in current.items():
+        old = previous.get(device_id)
+        if old is None or old is item or old == item:
+            continue
+        diff = diff_item(old, item)
+        if diff:
+            devices[device_id] = diff
+    return FleetDiff(
+        added=frozenset(current.keys() - previous.keys()),
+        removed=frozenset(previous.keys() - current.keys()),
+        devices=devices,
+    )
+
+
+def diff_item(old: Item, new: Item) -> DeviceDiff:
+    changes: tuple[set[str], set[str], set[str]] = (set(), set(), set())
+    _diff_model(old, new, "", changes)
+    added, removed, changed = changes
+    return DeviceDiff(frozenset(added), frozenset(removed), frozenset(changed))
+
+
+@cache
+def _plan(cls: type) -> tuple[tuple[str, bool], ...]:
+    """(field name, compared by type code) for each field of `cls`."""
+    indexed = getattr(cls, "_INDEXED", ())
+    return tuple((f.name, f.name in indexed) for f in fields(cls))
+
+
+def _diff_model(old: Any, new: Any, prefix: str, changes: tuple) -> None:
+    for name, indexed in _plan(type(new)):
+        before = getattr(old, name)
+        after = getattr(new, name)
+        if before is after or before == after:
+            continue
+        path = prefix + name
+        if indexed:
+            _diff_keyed(
+                old.indexed_values(name), new.indexed_values(name), path, changes
+            )
+        elif type(before) is type(after) and is_dataclass(after):
+            _diff_model(before, after, path + ".", changes)
+        else:
+            _record(before, after, path, changes)
+
+
+def _diff_keyed(before: dict, after: dict, path: str, changes: tuple) -> None:
+    for code in before.keys() | after.keys():
+        old = before.get(code)
+        new = after.get(code)
+        if old is not new and old != new:
+            _record(old, new, f"{path}[{code}]", changes)
+
+
+def _record(before: Any, after: Any, path: str, changes: tuple) -> None:
+    added, removed, changed = changes
+    if before is None:
+        added.add(path)
+    elif after is None:
+        removed.add(path)
+    else:
+        changed.add(path)
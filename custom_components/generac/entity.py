@@ -1,12 +1,17 @@
 """GeneracEntity class"""
 import logging
+from collections.abc import Callable
+from collections.abc import Iterable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
+from .const import DEFAULT_NAME
 from .const import DOMAIN
 from .coordinator import GeneracDataUpdateCoordinator
 from .models import Apparatus
@@ -19,7 +24,55 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 _EMPTY_ITEM = Item(apparatus=Apparatus(), apparatusDetail=ApparatusDetail(), empty=True)
 
 
+@callback
+def async_add_device_entities(
+    coordinator: GeneracDataUpdateCoordinator,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    build: Callable[[str, Item], Iterable[Entity]],
+) -> None:
+    """Add `build(device_id, item)`'s entities for every device, as it appears.
+
+    Devices in the coordinator's data now get their entities right away;
+    devices that show up in a later poll get them on that poll, without
+    reloading the entry. Removal is the coordinator's job: it drops a
+    device that stays gone (and with it its entities) from the device
+    registry, after which the device is treated as new if it returns.
+    """
+    known: set[str] = set()
+
+    @callback
+    def _add(device_ids: Iterable[str]) -> None:
+        entities: list[Entity] = []
+        for device_id in device_ids:
+            item = coordinator.data.get(device_id)
+            if item is None or device_id in known:
+                continue
+            known.add(device_id)
+            entities.extend(build(device_id, item))
+        if entities:
+            async_add_entities(entities)
+
+    @callback
+    def _handle_coordinator_update() -> None:
+        known.difference_update(coordinator.purged)
+        if coordinator.changes.added:
+            _add(coordinator.changes.added)
+
+    if isinstance(coordinator.data, dict):
+        _add(coordinator.data)
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_handle_coordinator_update)
+    )
+
+
 class GeneracEntity(CoordinatorEntity[GeneracDataUpdateCoordinator]):
+    # Item field paths the state depends on (see `DeviceDiff.touches`);
+    # empty means any change to the device.
+    watched_fields: tuple[str, ...] = ()
+    # Names the entity `generac_<device_id>_<name_suffix>`.
+    name_suffix: str = ""
+
     def __init__(
         self,
         coordinator: GeneracDataUpdateCoordinator,
@@ -31,14 +84,21 @@ class GeneracEntity(CoordinatorEntity[GeneracDataUpdateCoordinator]):
         self.config_entry = config_entry
         self.device_id = device_id
         self.item = item
+        self._last_available: bool | None = None
+        # Identity is fixed for the entity's lifetime, so it is worked out
+        # once here rather than on every state write; only device_info
+        # follows the device (see `_handle_coordinator_update`).
+        if self.name_suffix:
+            self._attr_name = f"{DEFAULT_NAME}_{device_id}_{self.name_suffix}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{device_id}_{self.name}"
+        self._attr_device_info = self._device_info()
+        self._attr_extra_state_attributes = {
+            "attribution": ATTRIBUTION,
+            "id": str(device_id),
+            "integration": DOMAIN,
+        }
 
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this entity."""
-        return f"{self.config_entry.entry_id}_{self.device_id}_{self.name}"
-
-    @property
-    def device_info(self):
+    def _device_info(self) -> DeviceInfo:
         return DeviceInfo(
             identifiers={(DOMAIN, self.device_id)},
             name=self.aparatus.name,
@@ -46,15 +106,6 @@ class GeneracEntity(CoordinatorEntity[GeneracDataUpdateCoordinator]):
             manufacturer="Generac",
         )
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {
-            "attribution": ATTRIBUTION,
-            "id": str(self.device_id),
-            "integration": DOMAIN,
-        }
-
     @property
     def available(self):
         """Return True if entity is available."""
@@ -76,5 +127,15 @@ class GeneracEntity(CoordinatorEntity[GeneracDataUpdateCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self.item = self.coordinator.data.get(self.device_id, _EMPTY_ITEM)
-        _LOGGER.debug(f"Updated data for {self.unique_id}: {self.item}")
+        if self.device_id in self.coordinator.renamed:
+            self._attr_device_info = self._device_info()
+        available = self.available
+        if available == self._last_available and not self.coordinator.changes.touches(
+            self.device_id, *self.watched_fields
+        ):
+            # Nothing shown changed, nor did availability: skip the state
+            # write (and its recorder row / websocket push).
+            return
+        self._last_available = available
+        _LOGGER.debug("Updated data for %s: %s", self.unique_id, self.item)
         self.async_write_ha_state()
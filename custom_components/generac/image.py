@@ -7,9 +7,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEFAULT_NAME
 from .const import DOMAIN
 from .coordinator import GeneracDataUpdateCoordinator
+from .entity import async_add_device_entities
 from .entity import GeneracEntity
 from .models import Item
 
@@ -19,18 +19,23 @@ async def async_setup_entry(
 ):
     """Setup binary_sensor platform."""
     coordinator: GeneracDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    data = coordinator.data
-    if isinstance(data, dict):
-        async_add_entities(
-            HeroImageSensor(coordinator, entry, device_id, item, hass)
-            for device_id, item in data.items()
+    async_add_device_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        lambda device_id, item: (
+            [HeroImageSensor(coordinator, entry, device_id, item, hass)]
             if item.apparatusDetail.heroImageUrl is not None
-        )
+            else []
+        ),
+    )
 
 
 class HeroImageSensor(GeneracEntity, ImageEntity):
     """generac Image class."""
 
+    name_suffix = "hero_image"
+
     def __init__(
         self,
         coordinator: GeneracDataUpdateCoordinator,
@@ -43,11 +48,6 @@ class HeroImageSensor(GeneracEntity, ImageEntity):
         super().__init__(coordinator, config_entry, device_id, item)
         ImageEntity.__init__(self, hass)
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{DEFAULT_NAME}_{self.device_id}_hero_image"
-
     @property
     def image_url(self):
         return self.aparatus_detail.heroImageUrl
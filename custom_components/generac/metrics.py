@@ -0,0 +1,180 @@
+"""Poll-path instrumentation.
+
+`GeneracApiClient` owns one `PollMetrics` and feeds it per-request
+samples (endpoint, latency, payload size, error class); the client and
+the coordinator time the phases of each poll — token refresh, the list
+call, the detail fan-out, payload decoding and entity state writes. The
+result is exposed through diagnostic sensors and the diagnostics dump so
+a slow poll can be attributed to one of those phases.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any
+from typing import Iterator
+
+# Upper bucket bounds, in seconds. Everything slower lands in "+Inf".
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASE_TOKEN = "token"
+PHASE_LIST = "list"
+PHASE_DETAILS = "details"
+PHASE_DECODE = "decode"
+PHASE_ENTITY_WRITES = "entity_writes"
+PHASE_TOTAL = "total"
+
+# /Apparatus/details/123 -> /Apparatus/details/{id}
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Collapse numeric path segments so all devices share one series."""
+    return _ID_SEGMENT.sub("/{id}", endpoint)
+
+
+class Histogram:
+    """Latency histogram; per-bucket (not cumulative) counts."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "max": round(self.max, 4),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class EndpointStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes = 0
+        # Answered from the response cache (304 or unchanged body).
+        self.cached = 0
+        self.errors: Counter[str] = Counter()
+        self.latency = Histogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "cached": self.cached,
+            "errors": dict(self.errors),
+            "latency": self.latency.as_dict(),
+        }
+
+
+class PollMetrics:
+    """Counters and timings for the requests and phases of each poll."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.phases: dict[str, Histogram] = {}
+        # Phase durations of the most recent poll, in seconds. Summed
+        # phases (token, decode) add up work done across the fan-out.
+        self.last_poll: dict[str, float] = {}
+        self.polls = 0
+        self.failures: Counter[str] = Counter()
+        self._current: dict[str, float] = {}
+
+    @property
+    def requests(self) -> int:
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(sum(stats.errors.values()) for stats in self.endpoints.values())
+
+    def record_request(
+        self,
+        endpoint: str,
+        seconds: float,
+        nbytes: int = 0,
+        error: str | None = None,
+        cached: bool = False,
+    ) -> None:
+        key = endpoint_key(endpoint)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointStats()
+        stats.requests += 1
+        stats.bytes += nbytes
+        stats.latency.observe(seconds)
+        if cached:
+            stats.cached += 1
+        if error is not None:
+            stats.errors[error] += 1
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Add `seconds` to `phase` of the poll in progress."""
+        self._current[phase] = self._current.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    @contextmanager
+    def poll(self) -> Iterator[None]:
+        """Wrap one poll; its phases are published when it finishes."""
+        self._current = {}
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as ex:
+            self.failures[type(ex).__name__] += 1
+            raise
+        finally:
+            self._current[PHASE_TOTAL] = time.perf_counter() - start
+            self.polls += 1
+            self._publish()
+
+    def record_entity_writes(self, seconds: float) -> None:
+        """Entity writes happen after the poll returned; amend its record."""
+        self.last_poll[PHASE_ENTITY_WRITES] = seconds
+        self._observe(PHASE_ENTITY_WRITES, seconds)
+
+    def _publish(self) -> None:
+        self.last_poll = self._current
+        self._current = {}
+        for phase, seconds in self.last_poll.items():
+            self._observe(phase, seconds)
+
+    def _observe(self, phase: str, seconds: float) -> None:
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram()
+        histogram.observe(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Snapshot for diagnostics / sensor attributes."""
+        return {
+            "polls": self.polls,
+            "failed_polls": dict(self.failures),
+            "last_poll": {k: round(v, 4) for k, v in self.last_poll.items()},
+            "phases": {k: h.as_dict() for k, h in self.phases.items()},
+            "endpoints": {k: s.as_dict() for k, s in self.endpoints.items()},
+        }
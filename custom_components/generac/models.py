@@ -1,5 +1,26 @@
+import sys
 from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import is_dataclass
+from dataclasses import MISSING
+from functools import cache
+from types import NoneType
+from types import UnionType
+from typing import Any
+from typing import Callable
+from typing import get_args
+from typing import get_origin
 from typing import Optional
+from typing import TypeVar
+from typing import Union
+
+T = TypeVar("T")
+
+# Field metadata for strings that repeat across devices and polls (names,
+# units, labels): `decode` interns them, so every device shares one copy
+# instead of holding the one its JSON body was parsed into.
+INTERN = {"intern": True}
 
 
 @dataclass
@@ -66,74 +87,119 @@ class ApparatusInfo:
     attributes: Optional[list[ApparatusAttribute]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Weather:
-    @dataclass
+    @dataclass(slots=True)
     class Temperature:
         value: Optional[float]
-        unit: Optional[str]
+        unit: Optional[str] = field(metadata=INTERN)
         unitType: Optional[int]
 
     temperature: Optional[Temperature]
     iconCode: Optional[int]
 
 
-@dataclass()
-class Apparatus:
+class _PropertyIndex:
+    """Type-code -> value index over a model's property lists.
+
+    Built once when the model is constructed (i.e. at decode time) so
+    sensors look properties up by type code instead of scanning the list
+    on every state read. Like the old linear scan, the first property
+    with a given type code wins. Property lists are treated as immutable;
+    assigning a new list is picked up on the next lookup.
+    """
+
+    # Subclasses are slotted dataclasses; this keeps them `__dict__`-free.
+    __slots__ = ("_prop_index",)
+
+    _INDEXED: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        self._prop_index = {}
+        for list_name in self._INDEXED:
+            self._index(list_name)
+
+    def _index(self, list_name: str) -> dict:
+        props = getattr(self, list_name)
+        index: dict = {}
+        for prop in props or ():
+            index.setdefault(prop.type, prop.value)
+        self._prop_index[list_name] = (props, index)
+        return index
+
+    def indexed_values(self, list_name: str) -> dict:
+        """Type code -> value for `list_name`; treat as read-only."""
+        props, index = self._prop_index[list_name]
+        if props is not getattr(self, list_name):
+            index = self._index(list_name)
+        return index
+
+    def _lookup(self, list_name: str, type_code, default):
+        return self.indexed_values(list_name).get(type_code, default)
+
+
+@dataclass(slots=True)
+class Apparatus(_PropertyIndex):
     apparatusId: Optional[int] = None
     serialNumber: Optional[str] = None
     name: Optional[str] = None
     type: Optional[int] = None
     localizedAddress: Optional[str] = None
-    materialDescription: Optional[str] = None
+    materialDescription: Optional[str] = field(default=None, metadata=INTERN)
     heroImageUrl: Optional[str] = None
     apparatusStatus: Optional[int] = None
     isConnected: Optional[bool] = None
     isConnecting: Optional[bool] = None
     showWarning: Optional[bool] = None
     weather: Optional[Weather] = None
-    preferredDealerName: Optional[str] = None
-    preferredDealerPhone: Optional[str] = None
-    preferredDealerEmail: Optional[str] = None
+    preferredDealerName: Optional[str] = field(default=None, metadata=INTERN)
+    preferredDealerPhone: Optional[str] = field(default=None, metadata=INTERN)
+    preferredDealerEmail: Optional[str] = field(default=None, metadata=INTERN)
     isDealerManaged: Optional[bool] = None
     isDealerUnmonitored: Optional[bool] = None
-    modelNumber: Optional[str] = None
+    modelNumber: Optional[str] = field(default=None, metadata=INTERN)
     panelId: Optional[str] = None
 
-    @dataclass
+    @dataclass(slots=True)
     class Property:
-        name: Optional[str]
+        name: Optional[str] = field(metadata=INTERN)
 
-        @dataclass
+        @dataclass(slots=True)
         class Value:
             type: Optional[int]
-            status: Optional[int | str]
+            status: Optional[int | str] = field(metadata=INTERN)
             isLegacy: Optional[bool]
             isRunning: Optional[bool]
             deviceId: Optional[str]
-            deviceType: Optional[str]
+            deviceType: Optional[str] = field(metadata=INTERN)
             signalStrength: Optional[str]
-            batteryLevel: Optional[str]
+            batteryLevel: Optional[str] = field(metadata=INTERN)
 
         value: Optional[Value | list | str | int]
         type: Optional[int]
 
     properties: Optional[list[Property]] = None
 
+    _INDEXED = ("properties",)
 
-@dataclass
+    def property_value(self, type_code: int, default=None):
+        """Value of the first `properties` entry with `type_code`."""
+        return self._lookup("properties", type_code, default)
+
+
+@dataclass(slots=True)
 class Address:
     """generated source for class Address"""
 
     line1: Optional[str]
     line2: Optional[str]
-    city: Optional[str]
-    region: Optional[str]
-    country: Optional[str]
+    city: Optional[str] = field(metadata=INTERN)
+    region: Optional[str] = field(metadata=INTERN)
+    country: Optional[str] = field(metadata=INTERN)
     postalCode: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """generated source for class Subscription"""
 
@@ -143,17 +209,17 @@ class Subscription:
     isDunning: Optional[bool]
 
 
-@dataclass
-class ApparatusDetail:
-    @dataclass
+@dataclass(slots=True)
+class ApparatusDetail(_PropertyIndex):
+    @dataclass(slots=True)
     class Property:
-        name: Optional[str]
+        name: Optional[str] = field(metadata=INTERN)
         value: Optional[str | int | float | dict]
         type: Optional[int | str]
 
-    @dataclass
+    @dataclass(slots=True)
     class ProductInfo:
-        name: Optional[str]
+        name: Optional[str] = field(metadata=INTERN)
         value: Optional[str]
         type: Optional[int]
 
@@ -163,14 +229,14 @@ class ApparatusDetail:
     apparatusClassification: Optional[int] = None
     panelId: Optional[str] = None
     activationDate: Optional[str] = None
-    deviceType: Optional[str] = None
+    deviceType: Optional[str] = field(default=None, metadata=INTERN)
     deviceSsid: Optional[str] = None
     shortDeviceId: Optional[str] = None
     apparatusStatus: Optional[int] = None
     heroImageUrl: Optional[str] = None
-    statusLabel: Optional[str] = None
-    statusText: Optional[str] = None
-    eCodeLabel: Optional[str] = None
+    statusLabel: Optional[str] = field(default=None, metadata=INTERN)
+    statusText: Optional[str] = field(default=None, metadata=INTERN)
+    eCodeLabel: Optional[str] = field(default=None, metadata=INTERN)
     weather: Optional[Weather] = None
     isConnected: Optional[bool] = None
     isConnecting: Optional[bool] = None
@@ -187,9 +253,192 @@ class ApparatusDetail:
     productInfo: Optional[list[Property]] = None
     hasDisconnectedNotificationsOn: Optional[bool] = None
 
+    _INDEXED = ("properties", "tuProperties")
 
-@dataclass
+    def property_value(self, type_code: int, default=None):
+        """Value of the first `properties` entry with `type_code`."""
+        return self._lookup("properties", type_code, default)
+
+    def tu_property_value(self, type_code: int, default=None):
+        """Value of the first `tuProperties` (tank monitor) entry with `type_code`."""
+        return self._lookup("tuProperties", type_code, default)
+
+
+@dataclass(slots=True)
 class Item:
     apparatus: Apparatus
     apparatusDetail: ApparatusDetail
     empty: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Payload decoding
+# ---------------------------------------------------------------------------
+#
+# Drop-in replacement for `dacite.from_dict` on the poll hot path. dacite
+# re-inspects type hints and re-resolves every Union on every call; here
+# each dataclass gets a converter built once (on first use) out of small
+# per-field closures, so decoding a device is a straight walk over its
+# payload. Semantics match dacite's defaults: missing keys fall back to
+# the field default (or None for Optional fields), unknown keys are
+# ignored, values are type-checked, ints are accepted for floats, and
+# Union members are tried in declaration order. String values of `INTERN`
+# fields are interned.
+
+
+class DecodeError(ValueError):
+    """Payload does not match the model it is being decoded into."""
+
+
+def decode(cls: type[T], data: Any) -> T:
+    """Build a `cls` instance from a decoded JSON object."""
+    return _decoder(cls)(data)
+
+
+@cache
+def _decoder(cls: type) -> Callable[[Any], Any]:
+    plan = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            default = f.default
+            has_default = True
+        elif f.default_factory is not MISSING:
+            # Rare in these models; fall back to the constructor default.
+            default = MISSING
+            has_default = True
+        else:
+            default = None
+            has_default = _is_optional(f.type)
+        # Most fields are (Optional) scalars: those only need an isinstance
+        # check, done inline below instead of through a converter call.
+        accepted = _scalar_types(f.type)
+        convert = None if accepted is not None else _converter(f.type)
+        intern = accepted is not None and bool(f.metadata.get("intern"))
+        plan.append((f.name, accepted, convert, intern, has_default, default))
+    name = cls.__qualname__
+
+    def decode_dataclass(data: Any) -> Any:
+        if not isinstance(data, dict):
+            raise DecodeError(f"{name}: expected object, got {type(data).__name__}")
+        kwargs = {}
+        for key, accepted, convert, intern, has_default, default in plan:
+            if key in data:
+                value = data[key]
+                if accepted is not None:
+                    if not isinstance(value, accepted):
+                        raise DecodeError(
+                            f"{name}.{key}: unexpected {type(value).__name__} "
+                            f"{value!r:.50}"
+                        )
+                    if intern and value.__class__ is str:
+                        value = sys.intern(value)
+                    kwargs[key] = value
+                    continue
+                try:
+                    kwargs[key] = convert(value)
+                except DecodeError as ex:
+                    raise DecodeError(f"{name}.{key}: {ex}") from None
+            elif not has_default:
+                raise DecodeError(f"{name}.{key}: missing value")
+            elif default is not MISSING:
+                kwargs[key] = default
+        return cls(**kwargs)
+
+    return decode_dataclass
+
+
+def _is_optional(tp: Any) -> bool:
+    return _is_union(tp) and NoneType in get_args(tp)
+
+
+def _is_union(tp: Any) -> bool:
+    return get_origin(tp) in (Union, UnionType)
+
+
+def _scalar_types(tp: Any) -> tuple[type, ...] | None:
+    """isinstance() tuple for a scalar / union-of-scalars type, else None.
+
+    Scalars are kept as-is when valid, so trying union members in order
+    is the same as one isinstance check against all of them.
+    """
+    members = get_args(tp) if _is_union(tp) else (tp,)
+    accepted: list[type] = []
+    for member in members:
+        if not isinstance(member, type) or is_dataclass(member):
+            return None
+        if get_origin(member) is not None:
+            return None
+        # PEP 484 numeric tower, as dacite does: ints are valid floats.
+        accepted.extend((int, float) if member is float else (member,))
+    return tuple(accepted)
+
+
+def _converter(tp: Any) -> Callable[[Any], Any]:
+    if tp is Any:
+        return lambda value: value
+
+    if _is_union(tp):
+        members = [t for t in get_args(tp) if t is not NoneType]
+        nullable = len(members) != len(get_args(tp))
+        if len(members) == 1:
+            inner = _converter(members[0])
+        else:
+            inner = _union_converter(members)
+        if not nullable:
+            return inner
+        return lambda value: None if value is None else inner(value)
+
+    if is_dataclass(tp):
+        return _decoder(tp)
+
+    origin = get_origin(tp)
+    if origin is list:
+        (item_tp,) = get_args(tp) or (Any,)
+        convert_item = _converter(item_tp)
+
+        def convert_list(value: Any) -> list:
+            if not isinstance(value, list):
+                raise DecodeError(f"expected list, got {type(value).__name__}")
+            return [convert_item(v) for v in value]
+
+        return convert_list
+
+    if origin is dict:
+        _, value_tp = get_args(tp) or (Any, Any)
+        convert_value = _converter(value_tp)
+
+        def convert_dict(value: Any) -> dict:
+            if not isinstance(value, dict):
+                raise DecodeError(f"expected object, got {type(value).__name__}")
+            return {k: convert_value(v) for k, v in value.items()}
+
+        return convert_dict
+
+    # PEP 484 numeric tower, as dacite does: ints are valid floats.
+    accepted = (int, float) if tp is float else tp
+
+    def check(value: Any) -> Any:
+        if not isinstance(value, accepted):
+            raise DecodeError(
+                f"expected {tp.__name__}, got {type(value).__name__} {value!r:.50}"
+            )
+        return value
+
+    return check
+
+
+def _union_converter(members: list) -> Callable[[Any], Any]:
+    converters = [_converter(t) for t in members]
+    names = " | ".join(getattr(t, "__name__", str(t)) for t in members)
+
+    def convert_union(value: Any) -> Any:
+        for convert in converters:
+            try:
+                return convert(value)
+            except DecodeError:
+                continue
+        raise DecodeError(f"{value!r:.50} matches none of {names}")
+
+    return convert_union
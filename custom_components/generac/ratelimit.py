@@ -0,0 +1,157 @@
+"""Client-side rate limiting for the MobileLink API.
+
+Generac throttles per account, so every config entry logged in to the
+same account shares one `TokenBucket` (see `get_rate_limiter`). The
+bucket smooths the burst produced by the concurrent detail fan-out and,
+when the server answers 429, blocks every caller until its `Retry-After`
+has elapsed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Used when a 429 arrives without a usable Retry-After header.
+DEFAULT_RETRY_AFTER = 30.0
+# Longest Retry-After honoured; a bogus far-future value would otherwise
+# stall every request on the account.
+MAX_RETRY_AFTER = 3600.0
+
+_LIMITERS: dict[str, "TokenBucket"] = {}
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, at most `burst` saved.
+
+    A rate of 0 disables limiting (but 429 back-off is still honoured).
+    Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = 0.0
+        self._burst = 1
+        self.configure(rate, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.total_wait = 0.0
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Change rate/burst in place (e.g. after an options update)."""
+        self._rate = max(0.0, float(rate))
+        self._burst = max(1, int(burst))
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+        return self._waiting
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self._rate:
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+
+    async def acquire(self) -> float:
+        """Wait for a token and return how long the caller waited."""
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._blocked_until - now
+                    if delay <= 0:
+                        if not self._rate:
+                            break
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+                        delay = (1 - self._tokens) / self._rate
+                    await asyncio.sleep(delay)
+        finally:
+            self._waiting -= 1
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.last_wait = waited
+        self.max_wait = max(self.max_wait, waited)
+        self.total_wait += waited
+        return waited
+
+    def penalize(self, retry_after: float) -> None:
+        """Block all callers for `retry_after` seconds (server sent 429)."""
+        self.throttled += 1
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + max(0.0, retry_after))
+        # Start from an empty bucket once the block lifts so we don't
+        # immediately burst back into the throttle.
+        self._tokens = 0.0
+        self._updated = now
+
+    def as_dict(self) -> dict[str, Any]:
+        """Snapshot of the limiter state for diagnostics."""
+        return {
+            "rate_per_minute": self._rate * 60,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self._waiting,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "last_wait": round(self.last_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "avg_wait": round(self.total_wait / self.acquired, 3)
+            if self.acquired
+            else 0.0,
+        }
+
+
+def get_rate_limiter(account: str, rate_per_minute: float, burst: int) -> TokenBucket:
+    """Return the process-wide limiter for `account`, creating it if needed.
+
+    Config entries for the same account share one bucket; the most recent
+    caller's rate/burst wins.
+    """
+    key = account.lower()
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        limiter = _LIMITERS[key] = TokenBucket(rate_per_minute / 60, burst)
+    else:
+        limiter.configure(rate_per_minute / 60, burst)
+    return limiter
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    The result is clamped to [0, MAX_RETRY_AFTER]; non-finite values
+    ("inf", "nan") count as unusable.
+    """
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            _LOGGER.debug("Unparseable Retry-After header %r", value)
+            return DEFAULT_RETRY_AFTER
+    if not math.isfinite(seconds):
+        _LOGGER.debug("Unparseable Retry-After header %r", value)
+        return DEFAULT_RETRY_AFTER
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
@@ -0,0 +1,61 @@
+"""Retry policy for transient MobileLink request failures.
+
+Only failures that say nothing about the request itself are retried:
+timeouts, dropped or refused connections and 5xx answers. Every API
+call is an idempotent GET, so repeating one is always safe. 401s and
+other 4xx answers, undecodable bodies and auth failures are never
+retried; 429s are handled separately by the rate limiter.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+
+import aiohttp
+
+from .const import DEFAULT_RETRY_ATTEMPTS
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+_RETRY_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+
+
+class RetryPolicy:
+    """Bounded attempts with exponential, jittered backoff.
+
+    The n-th retry waits a random time between half and all of
+    `base_delay * 2**(n-1)`, capped at `max_delay`, so clients hitting
+    the same hiccup don't retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        *,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+    ) -> None:
+        self.attempts = max(1, int(attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def allows(self, failures: int) -> bool:
+        """Whether another attempt may follow `failures` failed ones."""
+        return failures < self.attempts
+
+    def delay(self, failures: int) -> float:
+        """Seconds to wait before the retry following `failures` failures."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (failures - 1))
+        return random.uniform(cap / 2, cap)
+
+    @staticmethod
+    def retryable_status(status: int) -> bool:
+        return status in RETRY_STATUSES
+
+    @staticmethod
+    def retryable_error(ex: BaseException) -> bool:
+        return isinstance(ex, _RETRY_EXCEPTIONS)
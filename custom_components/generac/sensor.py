@@ -1,23 +1,35 @@
 """Sensor platform for generac."""
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Type
+from operator import attrgetter
+from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.const import PERCENTAGE
 from homeassistant.const import UnitOfElectricPotential
 from homeassistant.const import UnitOfTemperature
+from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .breaker import STATES
 from .const import DEFAULT_NAME
 from .const import DEVICE_TYPE_GENERATOR
 from .const import DEVICE_TYPE_PROPANE_MONITOR
 from .const import DOMAIN
 from .coordinator import GeneracDataUpdateCoordinator
+from .entity import async_add_device_entities
 from .entity import GeneracEntity
+from .metrics import PHASE_TOTAL
+from .metrics import PollMetrics
 from .models import Item
 
 
@@ -26,64 +38,24 @@ async def async_setup_entry(
 ):
     """Setup binary_sensor platform."""
     coordinator: GeneracDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    data = coordinator.data
-    if isinstance(data, dict):
-        async_add_entities(
-            sensor(coordinator, entry, device_id, item)
-            for device_id, item in data.items()
-            for sensor in sensors(item)
+    async_add_device_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        lambda device_id, item: (
+            GeneracSensor(coordinator, entry, device_id, item, description)
+            for description in descriptions(item)
+        ),
+    )
+    async_add_entities(
+        sensor(coordinator, entry)
+        for sensor in (
+            PollDurationSensor,
+            ApiRequestsSensor,
+            ApiErrorsSensor,
+            CircuitBreakerSensor,
         )
-
-
-def sensors(item: Item) -> list[Type[GeneracEntity]]:
-    """Decide what sensors to use based on device type.
-
-    Presence of `tuProperties` indicates a propane tank monitor.
-    Presence of `properties` indicates a generator
-    """
-    if item.apparatus.type == DEVICE_TYPE_GENERATOR:
-        lst = [
-            StatusSensor,
-            RunTimeSensor,
-            ProtectionTimeSensor,
-            ActivationDateSensor,
-            LastSeenSensor,
-            ConnectionTimeSensor,
-            BatteryVoltageSensor,
-            DeviceTypeSensor,
-            DealerEmailSensor,
-            DealerNameSensor,
-            DealerPhoneSensor,
-            AddressSensor,
-            StatusTextSensor,
-            StatusLabelSensor,
-            SerialNumberSensor,
-            ModelNumberSensor,
-            DeviceSsidSensor,
-            PanelIDSensor,
-            SignalStrengthSensor,
-        ]
-    elif item.apparatus.type == DEVICE_TYPE_PROPANE_MONITOR:
-        lst = [
-            StatusSensor,
-            CapacitySensor,
-            FuelLevelSensor,
-            FuelTypeSensor,
-            OrientationSensor,
-            LastReadingDateSensor,
-            BatteryLevelSensor,
-            AddressSensor,
-            DeviceTypeSensor,
-        ]
-    else:
-        lst = []
-    if (
-        item.apparatusDetail.weather is not None
-        and item.apparatusDetail.weather.temperature is not None
-        and item.apparatusDetail.weather.temperature.value is not None
-    ):
-        lst.append(OutdoorTemperatureSensor)
-    return lst
+    )
 
 
 def format_timestamp(time_string: str) -> datetime:
@@ -95,21 +67,6 @@ def format_timestamp(time_string: str) -> datetime:
     return datetime.strptime(time_string, time_format)
 
 
-def get_prop_value(props, type_num: int, default_val):
-    """Return the value of a property based on type code."""
-    if props is None:
-        return default_val
-    val = next(
-        (prop.value for prop in props if prop.type == type_num),
-        default_val,
-    )
-    return val
-
-
-def sensor_name(self, name_label):
-    return f"{DEFAULT_NAME}_{self.device_id}_{name_label}"
-
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -129,451 +86,513 @@ def _safe_float(val, label: str = ""):
         return None
 
 
-class StatusSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    options = [
-        "Ready",
-        "Running",
-        "Exercising",
-        "Warning",
-        "Stopped",
-        "Communication Issue",
-        "Unknown",
-        "Online",
-        "Offline",
-    ]
-    device_class = SensorDeviceClass.ENUM
-    icon = "mdi:power"
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "status")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.aparatus.type == DEVICE_TYPE_GENERATOR:
-            if self.aparatus_detail.apparatusStatus is None:
-                return self.options[-1]
-            index = self.aparatus_detail.apparatusStatus - 1
-            if index < 0 or index > len(self.options) - 1:
-                index = len(self.options) - 1
-            return self.options[index]
-        else:
-            val = get_prop_value(self.aparatus.properties, 3, None)
-            if val is None:
-                return None
-            return val.status
-
-
-class DeviceTypeSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    options = [
-        "Wifi",
-        "Ethernet",
-        "MobileData",
-        "lte-tankutility-v2",
-        "Unknown",
-    ]
-    device_class = SensorDeviceClass.ENUM
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "device_type")
+ALL_DEVICE_TYPES = frozenset({DEVICE_TYPE_GENERATOR, DEVICE_TYPE_PROPANE_MONITOR})
+GENERATOR = frozenset({DEVICE_TYPE_GENERATOR})
+PROPANE_MONITOR = frozenset({DEVICE_TYPE_PROPANE_MONITOR})
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.aparatus_detail.deviceType is None:
-            return self.options[-1]
-        if self.aparatus_detail.deviceType == "wifi":
-            return self.options[0]
-        if self.aparatus_detail.deviceType == "eth":
-            return self.options[1]
-        if self.aparatus_detail.deviceType == "lte":
-            return self.options[2]
-        if self.aparatus_detail.deviceType == "cdma":
-            return self.options[2]
-        if self.aparatus_detail.deviceType == "lte-tankutility-v2":
-            return self.options[3]
-        return self.options[-1]
-
-
-class RunTimeSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
 
-    device_class = SensorDeviceClass.DURATION
-    native_unit_of_measurement = "h"
+@dataclass(frozen=True, kw_only=True)
+class GeneracSensorEntityDescription(SensorEntityDescription):
+    """A device sensor and where its value comes from.
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "run_time")
+    The raw value is the Item attribute at dotted `path`, or with
+    `type_code` the value of that code in the property list at `path`
+    (first entry wins, as with `property_value`). `default` stands in for
+    a missing value and `convert` is applied to anything not None.
+    `value_fn` replaces all of that for values derived from several
+    fields; `watched_fields` then names what it reads.
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        val = get_prop_value(self.aparatus_detail.properties, 71, 0)
-        return _safe_float(val, "run_time")
-
-
-class ProtectionTimeSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    device_class = SensorDeviceClass.DURATION
-    native_unit_of_measurement = "h"
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "protection_time")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        val = get_prop_value(self.aparatus_detail.properties, 32, 0)
-        return _safe_float(val, "protection_time")
-
-
-class ActivationDateSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    device_class = SensorDeviceClass.TIMESTAMP
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "activation_date")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.aparatus_detail.activationDate is None:
-            return None
-
-        return format_timestamp(self.aparatus_detail.activationDate)
-
-
-class LastSeenSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    device_class = SensorDeviceClass.TIMESTAMP
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "last_seen")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.aparatus_detail.lastSeen is None:
-            return None
-
-        return format_timestamp(self.aparatus_detail.lastSeen)
-
-
-class ConnectionTimeSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    device_class = SensorDeviceClass.TIMESTAMP
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "connection_time")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.aparatus_detail.connectionTimestamp is None:
-            return None
-
-        return format_timestamp(self.aparatus_detail.connectionTimestamp)
+    `device_types` limits the sensor to those apparatus types (None: any
+    type) and `exists_fn`, if set, to devices that report the value.
 
+    The key doubles as the name suffix, so it must not change: it is part
+    of the entity's unique_id.
+    """
 
-class BatteryVoltageSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
+    device_types: frozenset[int] | None = ALL_DEVICE_TYPES
+    path: str | None = None
+    type_code: int | None = None
+    default: Any = None
+    convert: Callable[[Any], Any] | None = None
+    value_fn: Callable[[Item], Any] | None = None
+    watched_fields: tuple[str, ...] = ()
+    unit_fn: Callable[[Item], str] | None = None
+    exists_fn: Callable[[Item], bool] | None = None
+
+
+_STATUS_OPTIONS = [
+    "Ready",
+    "Running",
+    "Exercising",
+    "Warning",
+    "Stopped",
+    "Communication Issue",
+    "Unknown",
+    "Online",
+    "Offline",
+]
+
+_DEVICE_TYPE_OPTIONS = [
+    "Wifi",
+    "Ethernet",
+    "MobileData",
+    "lte-tankutility-v2",
+    "Unknown",
+]
+_DEVICE_TYPES = {
+    "wifi": "Wifi",
+    "eth": "Ethernet",
+    "lte": "MobileData",
+    "cdma": "MobileData",
+    "lte-tankutility-v2": "lte-tankutility-v2",
+}
+
+
+def _status(item: Item) -> str | None:
+    if item.apparatus.type == DEVICE_TYPE_GENERATOR:
+        status = item.apparatusDetail.apparatusStatus
+        if status is None:
+            return _STATUS_OPTIONS[-1]
+        index = status - 1
+        if index < 0 or index > len(_STATUS_OPTIONS) - 1:
+            index = len(_STATUS_OPTIONS) - 1
+        return _STATUS_OPTIONS[index]
+    val = item.apparatus.property_value(3, None)
+    if val is None:
+        return None
+    return val.status
 
-    device_class = SensorDeviceClass.VOLTAGE
-    native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    suggested_display_precision = 1
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "battery_voltage")
+def _signal_strength(item: Item) -> str | None:
+    wifi_signal_data = item.apparatus.property_value(3, None)
+    if wifi_signal_data is None:
+        return "0%"
+    return wifi_signal_data.signalStrength
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        val = get_prop_value(self.aparatus_detail.properties, 70, 0)
-        return _safe_float(val, "battery_voltage")
 
+def _has_outdoor_temperature(item: Item) -> bool:
+    weather = item.apparatusDetail.weather
+    return (
+        weather is not None
+        and weather.temperature is not None
+        and weather.temperature.value is not None
+    )
 
-class OutdoorTemperatureSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
 
-    device_class = SensorDeviceClass.TEMPERATURE
+def _outdoor_temperature(item: Item) -> float:
+    if not _has_outdoor_temperature(item):
+        return 0
+    return item.apparatusDetail.weather.temperature.value
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "outdoor_temperature")
 
-    @property
-    def native_unit_of_measurement(self):
-        if (
-            self.aparatus_detail.weather is None
-            or self.aparatus_detail.weather.temperature is None
-            or self.aparatus_detail.weather.temperature.unit is None
-        ):
-            return UnitOfTemperature.CELSIUS
-        if "f" in self.aparatus_detail.weather.temperature.unit.lower():
-            return UnitOfTemperature.FAHRENHEIT
+def _outdoor_temperature_unit(item: Item) -> str:
+    weather = item.apparatusDetail.weather
+    if weather is None or weather.temperature is None or not weather.temperature.unit:
         return UnitOfTemperature.CELSIUS
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
+    if "f" in weather.temperature.unit.lower():
+        return UnitOfTemperature.FAHRENHEIT
+    return UnitOfTemperature.CELSIUS
+
+
+SENSORS: tuple[GeneracSensorEntityDescription, ...] = (
+    GeneracSensorEntityDescription(
+        key="status",
+        device_class=SensorDeviceClass.ENUM,
+        options=_STATUS_OPTIONS,
+        icon="mdi:power",
+        value_fn=_status,
+        watched_fields=(
+            "apparatus.type",
+            "apparatus.properties[3]",
+            "apparatusDetail.apparatusStatus",
+        ),
+    ),
+    GeneracSensorEntityDescription(
+        key="run_time",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="h",
+        path="apparatusDetail.properties",
+        type_code=71,
+        default=0,
+        convert=_safe_float,
+    ),
+    GeneracSensorEntityDescription(
+        key="protection_time",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="h",
+        path="apparatusDetail.properties",
+        type_code=32,
+        default=0,
+        convert=_safe_float,
+    ),
+    GeneracSensorEntityDescription(
+        key="activation_date",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        path="apparatusDetail.activationDate",
+        convert=format_timestamp,
+    ),
+    GeneracSensorEntityDescription(
+        key="last_seen",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        path="apparatusDetail.lastSeen",
+        convert=format_timestamp,
+    ),
+    GeneracSensorEntityDescription(
+        key="connection_time",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        path="apparatusDetail.connectionTimestamp",
+        convert=format_timestamp,
+    ),
+    GeneracSensorEntityDescription(
+        key="battery_voltage",
+        device_types=GENERATOR,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        suggested_display_precision=1,
+        path="apparatusDetail.properties",
+        type_code=70,
+        default=0,
+        convert=_safe_float,
+    ),
+    GeneracSensorEntityDescription(
+        key="device_type",
+        device_class=SensorDeviceClass.ENUM,
+        options=_DEVICE_TYPE_OPTIONS,
+        path="apparatusDetail.deviceType",
+        default="",
+        convert=lambda value: _DEVICE_TYPES.get(value, _DEVICE_TYPE_OPTIONS[-1]),
+    ),
+    GeneracSensorEntityDescription(
+        key="dealer_email",
+        device_types=GENERATOR,
+        path="apparatus.preferredDealerEmail",
+    ),
+    GeneracSensorEntityDescription(
+        key="dealer_name",
+        device_types=GENERATOR,
+        path="apparatus.preferredDealerName",
+    ),
+    GeneracSensorEntityDescription(
+        key="dealer_phone",
+        device_types=GENERATOR,
+        path="apparatus.preferredDealerPhone",
+    ),
+    GeneracSensorEntityDescription(key="address", path="apparatus.localizedAddress"),
+    GeneracSensorEntityDescription(
+        key="status_text",
+        device_types=GENERATOR,
+        path="apparatusDetail.statusText",
+    ),
+    GeneracSensorEntityDescription(
+        key="status_label",
+        device_types=GENERATOR,
+        path="apparatusDetail.statusLabel",
+    ),
+    GeneracSensorEntityDescription(
+        key="serial_number",
+        device_types=GENERATOR,
+        path="apparatus.serialNumber",
+    ),
+    GeneracSensorEntityDescription(
+        key="model_number",
+        device_types=GENERATOR,
+        path="apparatus.modelNumber",
+    ),
+    GeneracSensorEntityDescription(
+        key="device_ssid",
+        device_types=GENERATOR,
+        path="apparatusDetail.deviceSsid",
+    ),
+    GeneracSensorEntityDescription(
+        key="panel_id",
+        device_types=GENERATOR,
+        path="apparatus.panelId",
+    ),
+    GeneracSensorEntityDescription(
+        key="signal_strength",
+        device_types=GENERATOR,
+        value_fn=_signal_strength,
+        watched_fields=("apparatus.properties[3]",),
+    ),
+    # Propane tank monitors
+    GeneracSensorEntityDescription(
+        key="capacity",
+        device_types=PROPANE_MONITOR,
+        path="apparatusDetail.tuProperties",
+        type_code=1,
+        default=0,
+    ),
+    GeneracSensorEntityDescription(
+        key="fuel_level",
+        device_types=PROPANE_MONITOR,
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+        path="apparatusDetail.tuProperties",
+        type_code=9,
+    ),
+    GeneracSensorEntityDescription(
+        key="fuel_type",
+        device_types=PROPANE_MONITOR,
+        path="apparatusDetail.tuProperties",
+        type_code=0,
+        default="Propane",
+    ),
+    GeneracSensorEntityDescription(
+        key="orientation",
+        device_types=PROPANE_MONITOR,
+        path="apparatusDetail.tuProperties",
+        type_code=2,
+    ),
+    GeneracSensorEntityDescription(
+        key="last_reading",
+        device_types=PROPANE_MONITOR,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        path="apparatusDetail.tuProperties",
+        type_code=11,
+        convert=format_timestamp,
+    ),
+    GeneracSensorEntityDescription(
+        key="battery_level",
+        device_types=PROPANE_MONITOR,
+        path="apparatusDetail.tuProperties",
+        type_code=17,
+    ),
+    # Any device that reports it.
+    GeneracSensorEntityDescription(
+        key="outdoor_temperature",
+        device_types=None,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        value_fn=_outdoor_temperature,
+        unit_fn=_outdoor_temperature_unit,
+        exists_fn=_has_outdoor_temperature,
+        watched_fields=("apparatusDetail.weather",),
+    ),
+)
+
+
+def descriptions(item: Item) -> list[GeneracSensorEntityDescription]:
+    """The sensors a device gets, by its type and what it reports."""
+    return [
+        description
+        for description in SENSORS
         if (
-            self.aparatus_detail.weather is None
-            or self.aparatus_detail.weather.temperature is None
-            or self.aparatus_detail.weather.temperature.value is None
-        ):
-            return 0
-        return self.aparatus_detail.weather.temperature.value
-
-
-class SerialNumberSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "serial_number")
+            description.device_types is None
+            or item.apparatus.type in description.device_types
+        )
+        and (description.exists_fn is None or description.exists_fn(item))
+    ]
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.serialNumber
 
+def _extractor(
+    description: GeneracSensorEntityDescription,
+) -> Callable[[Item], Any]:
+    """Compile `description` into a function of the Item."""
+    if description.value_fn is not None:
+        return description.value_fn
+    default = description.default
+    convert = description.convert
+    if description.type_code is not None:
+        model_path, list_name = description.path.rsplit(".", 1)
+        get_model = attrgetter(model_path)
+        type_code = description.type_code
 
-class ModelNumberSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "model_number")
+        def raw(item: Item) -> Any:
+            values = get_model(item).indexed_values(list_name)
+            return values.get(type_code, default)
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.modelNumber
-
-
-class DeviceSsidSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "device_ssid")
+    else:
+        get_value = attrgetter(description.path)
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus_detail.deviceSsid
+        def raw(item: Item) -> Any:
+            value = get_value(item)
+            return default if value is None else value
 
+    if convert is None:
+        return raw
 
-class StatusLabelSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "status_label")
+    def extract(item: Item) -> Any:
+        value = raw(item)
+        return None if value is None else convert(value)
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus_detail.statusLabel
+    return extract
 
 
-class StatusTextSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "status_text")
+def _watched_fields(description: GeneracSensorEntityDescription) -> tuple[str, ...]:
+    if description.value_fn is not None:
+        return description.watched_fields
+    if description.type_code is not None:
+        return (f"{description.path}[{description.type_code}]",)
+    return (description.path,)
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus_detail.statusText
 
+# Built once at import: (value extractor, diff paths it depends on).
+_COMPILED = {
+    description.key: (_extractor(description), _watched_fields(description))
+    for description in SENSORS
+}
 
-class AddressSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "address")
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.localizedAddress
+class GeneracSensor(GeneracEntity, SensorEntity):
+    """A device sensor defined by a `GeneracSensorEntityDescription`."""
 
+    entity_description: GeneracSensorEntityDescription
 
-class DealerNameSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "dealer_name")
+    def __init__(
+        self,
+        coordinator: GeneracDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+        device_id: str,
+        item: Item,
+        description: GeneracSensorEntityDescription,
+    ):
+        self.name_suffix = description.key
+        super().__init__(coordinator, config_entry, device_id, item)
+        self.entity_description = description
+        self._value, self.watched_fields = _COMPILED[description.key]
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.aparatus.preferredDealerName
-
+        return self._value(self.item)
 
-class DealerEmailSensor(GeneracEntity, SensorEntity):
     @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "dealer_email")
+    def native_unit_of_measurement(self):
+        unit_fn = self.entity_description.unit_fn
+        if unit_fn is not None:
+            return unit_fn(self.item)
+        return super().native_unit_of_measurement
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.preferredDealerEmail
 
+class GeneracMetricsSensor(
+    CoordinatorEntity[GeneracDataUpdateCoordinator], SensorEntity
+):
+    """Per-entry diagnostic sensor over the poll-path metrics.
 
-class DealerPhoneSensor(GeneracEntity, SensorEntity):
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "dealer_phone")
+    Disabled by default: they change on every poll and are only useful
+    when chasing a slow or failing poll.
+    """
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.preferredDealerPhone
+    entity_category = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default = False
+    key: str
 
+    def __init__(
+        self, coordinator: GeneracDataUpdateCoordinator, config_entry: ConfigEntry
+    ):
+        super().__init__(coordinator)
+        self.config_entry = config_entry
+        # One set per entry: the entry title (the account's email) keeps
+        # the names, and so the entity IDs, of several accounts apart.
+        self._attr_name = f"{DEFAULT_NAME}_{config_entry.title}_{self.key}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{self.key}"
 
-class PanelIDSensor(GeneracEntity, SensorEntity):
     @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "panel_id")
+    def available(self):
+        """Metrics are most interesting exactly when polls fail."""
+        return True
 
     @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self.aparatus.panelId
+    def metrics(self) -> PollMetrics:
+        return self.coordinator.api.metrics
 
 
-# Propane Tank Monitor-specific Sensors
-class CapacitySensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
+class PollDurationSensor(GeneracMetricsSensor):
+    """Wall time of the last poll, broken down by phase in the attributes."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "capacity")
+    key = "poll_duration"
+    device_class = SensorDeviceClass.DURATION
+    state_class = SensorStateClass.MEASUREMENT
+    native_unit_of_measurement = UnitOfTime.SECONDS
+    icon = "mdi:timer-outline"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return get_prop_value(self.aparatus_detail.tuProperties, 1, 0)
-
-
-class FuelTypeSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
+        total = self.metrics.last_poll.get(PHASE_TOTAL)
+        return None if total is None else round(total, 3)
 
     @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "fuel_type")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return get_prop_value(self.aparatus_detail.tuProperties, 0, "Propane")
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            "last_poll": {k: round(v, 4) for k, v in self.metrics.last_poll.items()},
+            "phases": {k: h.as_dict() for k, h in self.metrics.phases.items()},
+        }
 
 
-class OrientationSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
+class ApiRequestsSensor(GeneracMetricsSensor):
+    """Requests made to the MobileLink API, per endpoint in the attributes."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "orientation")
+    key = "api_requests"
+    state_class = SensorStateClass.TOTAL_INCREASING
+    icon = "mdi:cloud-download-outline"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return get_prop_value(self.aparatus_detail.tuProperties, 2, None)
-
-
-class BatteryLevelSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
+        return self.metrics.requests
 
     @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "battery_level")
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return get_prop_value(self.aparatus_detail.tuProperties, 17, None)
-
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            endpoint: {
+                "requests": stats.requests,
+                "bytes": stats.bytes,
+                "latency": stats.latency.as_dict(),
+            }
+            for endpoint, stats in self.metrics.endpoints.items()
+        }
 
-class LastReadingDateSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
 
-    device_class = SensorDeviceClass.TIMESTAMP
+class ApiErrorsSensor(GeneracMetricsSensor):
+    """Failed MobileLink API requests, by endpoint and error class."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "last_reading")
+    key = "api_errors"
+    state_class = SensorStateClass.TOTAL_INCREASING
+    icon = "mdi:cloud-alert"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        val = get_prop_value(self.aparatus_detail.tuProperties, 11, None)
-        if val is None:
-            return None
-        return format_timestamp(val)
+        return self.metrics.errors
 
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            "failed_polls": dict(self.metrics.failures),
+            **{
+                endpoint: dict(stats.errors)
+                for endpoint, stats in self.metrics.endpoints.items()
+                if stats.errors
+            },
+        }
 
-class FuelLevelSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
 
-    device_class = SensorDeviceClass.BATTERY
-    native_unit_of_measurement = PERCENTAGE
+class CircuitBreakerSensor(GeneracMetricsSensor):
+    """State of the circuit breaker around the MobileLink cloud."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "fuel_level")
+    key = "circuit_breaker"
+    device_class = SensorDeviceClass.ENUM
+    options = STATES
+    icon = "mdi:electric-switch"
+    # Unlike the metrics, worth having on: it explains why polls stopped.
+    entity_registry_enabled_default = True
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return get_prop_value(self.aparatus_detail.tuProperties, 9, None)
-
-
-class SignalStrengthSensor(GeneracEntity, SensorEntity):
-    """generac Sensor class."""
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return sensor_name(self, "signal_strength")
+        return self.coordinator.api.breaker.state
 
     @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        wifi_signal_data = get_prop_value(self.aparatus.properties, 3, None)
-        if wifi_signal_data is None:
-            return "0%"
-        return wifi_signal_data.signalStrength
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        attributes = self.coordinator.api.breaker.as_dict()
+        del attributes["state"]
+        return attributes
@@ -1,8 +1,14 @@
 """Helper to create an aiohttp client session for the Generac API."""
 from aiohttp import ClientSession
 from aiohttp import CookieJar
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import aiohttp_client
+from homeassistant.util.ssl import get_default_context
+
+from .api import create_api_session
 
 
 async def async_client_session(hass: HomeAssistant) -> ClientSession:
@@ -10,3 +16,27 @@ async def async_client_session(hass: HomeAssistant) -> ClientSession:
     return aiohttp_client.async_create_clientsession(
         hass, cookie_jar=CookieJar(unsafe=True, quote_cookie=False)
     )
+
+
+async def async_api_session(
+    hass: HomeAssistant, entry: ConfigEntry, max_concurrency: int
+) -> ClientSession:
+    """Return a session with its own connection pool for `entry`.
+
+    HA's shared sessions use HA's shared connector, whose limits can't be
+    tuned per integration. This one is closed when the entry unloads or
+    HA shuts down.
+    """
+    session = create_api_session(
+        max_concurrency,
+        ssl=get_default_context(),
+        cookie_jar=CookieJar(unsafe=True, quote_cookie=False),
+    )
+
+    async def _close(_event: Event | None = None) -> None:
+        if not session.closed:
+            await session.close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close))
+    entry.async_on_unload(_close)
+    return session
@@ -7,9 +7,9 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEFAULT_NAME
 from .const import DOMAIN
 from .coordinator import GeneracDataUpdateCoordinator
+from .entity import async_add_device_entities
 from .entity import GeneracEntity
 from .models import Item
 
@@ -19,15 +19,17 @@ async def async_setup_entry(
 ):
     """Setup binary_sensor platform."""
     coordinator: GeneracDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    data = coordinator.data
-    if isinstance(data, dict):
-        async_add_entities(
+    async_add_device_entities(
+        coordinator,
+        entry,
+        async_add_entities,
+        lambda device_id, item: (
             sensor(coordinator, entry, device_id, item)
-            for device_id, item in data.items()
             for sensor in sensors(item)
             if item.apparatus.weather is not None
             and item.apparatus.weather.iconCode is not None
-        )
+        ),
+    )
 
 
 def sensors(item: Item) -> list[Type[GeneracEntity]]:
@@ -37,10 +39,7 @@ def sensors(item: Item) -> list[Type[GeneracEntity]]:
 class WeatherSensor(GeneracEntity, WeatherEntity):
     """generac Weather class."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{DEFAULT_NAME}_{self.device_id}_weather"
+    name_suffix = "weather"
 
     @property
     def condition(self):
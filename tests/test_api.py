@@ -1,17 +1,30 @@
 """Tests for Generac API Client."""
 import asyncio
 import json
+import logging
 from unittest.mock import AsyncMock
+from unittest.mock import call
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
+import aiohttp
 import pytest
+from custom_components.generac.api import _fingerprint
+from custom_components.generac.api import create_api_session
 from custom_components.generac.api import GeneracApiClient
 from custom_components.generac.api import InvalidCredentialsException
+from custom_components.generac.api import REQUEST_TIMEOUT
 from custom_components.generac.api import SessionExpiredException
 from custom_components.generac.auth import InvalidGrantError
+from custom_components.generac.breaker import CircuitBreaker
+from custom_components.generac.breaker import CircuitOpenError
+from custom_components.generac.breaker import STATE_CLOSED
+from custom_components.generac.breaker import STATE_OPEN
 from custom_components.generac.const import ALLOWED_DEVICES
 from custom_components.generac.const import API_BASE
 from custom_components.generac.const import DEVICE_TYPE_UNKNOWN
+from custom_components.generac.ratelimit import TokenBucket
+from custom_components.generac.retry import RetryPolicy
 
 
 def _acm(response):
@@ -30,6 +43,13 @@ def _acm(response):
     return cm
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    """Retry transient failures without actually waiting."""
+    with patch("custom_components.generac.retry.RetryPolicy.delay", return_value=0):
+        yield
+
+
 @pytest.fixture
 def mock_session():
     """Fixture for aiohttp ClientSession."""
@@ -63,7 +83,7 @@ async def test_get_endpoint_uses_bearer_and_v5_base(client, mock_session, mock_a
     """The Bearer token from auth.ensure_access_token() is on every request."""
     response = AsyncMock(status=200)
     response.headers = {"Content-Type": "application/json"}
-    response.json = AsyncMock(return_value={"key": "value"})
+    response.read = AsyncMock(return_value=json.dumps({"key": "value"}).encode())
     mock_session.get.return_value = _acm(response)
 
     result = await client.get_endpoint("/test")
@@ -74,6 +94,31 @@ async def test_get_endpoint_uses_bearer_and_v5_base(client, mock_session, mock_a
     assert args[0] == f"{API_BASE}/test"
     assert kwargs["headers"]["Authorization"] == "Bearer fake-at"
     assert kwargs["headers"]["Accept"] == "application/json"
+    assert kwargs["timeout"] is REQUEST_TIMEOUT
+
+
+async def test_get_endpoint_custom_timeout(mock_session, mock_auth):
+    timeout = aiohttp.ClientTimeout(total=3)
+    mock_session.get.return_value = _acm(AsyncMock(status=204))
+    client = GeneracApiClient(mock_session, mock_auth, timeout=timeout)
+
+    await client.get_endpoint("/test")
+    assert mock_session.get.call_args.kwargs["timeout"] is timeout
+
+
+async def test_create_api_session_pool():
+    """The pool is sized to the fan-out and keeps connections alive."""
+    session = create_api_session(7)
+    try:
+        connector = session.connector
+        assert connector.limit_per_host == 7
+        assert connector.limit == 8
+        assert connector.use_dns_cache
+        assert connector._keepalive_timeout > 15
+        # Also bounds requests made outside get_endpoint (token refresh).
+        assert session.timeout is REQUEST_TIMEOUT
+    finally:
+        await session.close()
 
 
 async def test_get_endpoint_no_content(client, mock_session):
@@ -108,7 +153,7 @@ async def test_get_endpoint_json_decode_error(client, mock_session):
     """Bad JSON becomes IOError."""
     response = AsyncMock(status=200)
     response.headers = {"Content-Type": "application/json"}
-    response.json = AsyncMock(side_effect=json.JSONDecodeError("msg", "doc", 0))
+    response.read = AsyncMock(return_value=b"{not json")
     mock_session.get.return_value = _acm(response)
     with pytest.raises(IOError):
         await client.get_endpoint("/test")
@@ -142,11 +187,11 @@ async def test_get_device_data_success(client, mock_session):
 
     list_resp = AsyncMock(status=200)
     list_resp.headers = {"Content-Type": "application/json"}
-    list_resp.json = AsyncMock(return_value=apparatus_list)
+    list_resp.read = AsyncMock(return_value=json.dumps(apparatus_list).encode())
 
     detail_resp = AsyncMock(status=200)
     detail_resp.headers = {"Content-Type": "application/json"}
-    detail_resp.json = AsyncMock(return_value=apparatus_detail)
+    detail_resp.read = AsyncMock(return_value=json.dumps(apparatus_detail).encode())
 
     mock_session.get.side_effect = [_acm(list_resp), _acm(detail_resp)]
 
@@ -162,7 +207,7 @@ async def test_get_device_data_no_apparatuses(client, mock_session):
     """Empty list -> empty dict."""
     resp = AsyncMock(status=200)
     resp.headers = {"Content-Type": "application/json"}
-    resp.json = AsyncMock(return_value=[])
+    resp.read = AsyncMock(return_value=json.dumps([]).encode())
     mock_session.get.return_value = _acm(resp)
     result = await client.get_device_data()
     assert result == {}
@@ -179,7 +224,7 @@ async def test_get_device_data_apparatus_not_a_list(client, mock_session):
     """Unexpected dict instead of list surfaces as IOError (poll failure)."""
     resp = AsyncMock(status=200)
     resp.headers = {"Content-Type": "application/json"}
-    resp.json = AsyncMock(return_value={"key": "value"})
+    resp.read = AsyncMock(return_value=json.dumps({"key": "value"}).encode())
     mock_session.get.return_value = _acm(resp)
     with pytest.raises(IOError, match="Expected list from /Apparatus/list"):
         await client.get_device_data()
@@ -192,8 +237,467 @@ async def test_get_device_data_no_detail(client, mock_session):
     ]
     list_resp = AsyncMock(status=200)
     list_resp.headers = {"Content-Type": "application/json"}
-    list_resp.json = AsyncMock(return_value=apparatus_list)
+    list_resp.read = AsyncMock(return_value=json.dumps(apparatus_list).encode())
 
     mock_session.get.side_effect = [_acm(list_resp), _acm(AsyncMock(status=204))]
     result = await client.get_device_data()
     assert result == {}
+
+
+def _json_resp(payload):
+    resp = AsyncMock(status=200)
+    resp.headers = {"Content-Type": "application/json"}
+    resp.read = AsyncMock(return_value=json.dumps(payload).encode())
+    return resp
+
+
+async def test_get_device_data_bounded_concurrency(mock_session, mock_auth):
+    """Detail fetches fan out, but never beyond max_concurrency in flight."""
+    apparatus_list = [
+        {"apparatusId": i, "name": f"Generator {i}", "type": ALLOWED_DEVICES[0]}
+        for i in range(1, 9)
+    ]
+    in_flight = 0
+    peak = 0
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+
+        async def enter():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _json_resp({"name": url.rsplit("/", 1)[-1]})
+
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(side_effect=enter)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth, max_concurrency=3)
+
+    result = await client.get_device_data()
+
+    assert list(result) == [str(i) for i in range(1, 9)]
+    assert result["5"].apparatusDetail.name == "5"
+    assert peak == 3
+
+
+async def test_get_device_data_detail_failure_fails_poll(mock_session, mock_auth):
+    """A transport error on one detail fetch still fails the whole poll."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 2, "name": "Generator 2", "type": ALLOWED_DEVICES[0]},
+    ]
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        if url.endswith("/2"):
+            raise asyncio.TimeoutError
+        return _acm(_json_resp({"name": "Generator 1"}))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth, max_concurrency=2)
+
+    with pytest.raises(IOError):
+        await client.get_device_data()
+    assert client.metrics.failures == {"OSError": 1}
+    # Timeouts are retried (three attempts by default) before failing.
+    assert client.metrics.endpoints["/Apparatus/details/{id}"].errors == {
+        "TimeoutError": 3
+    }
+
+
+async def test_get_device_data_records_metrics(mock_session, mock_auth):
+    """Each request and each phase of the poll is recorded."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 2, "name": "Generator 2", "type": ALLOWED_DEVICES[0]},
+    ]
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            resp = _json_resp(apparatus_list)
+            resp.content_length = 123
+            return _acm(resp)
+        return _acm(_json_resp({"name": "Generator"}))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth)
+    await client.get_device_data()
+
+    metrics = client.metrics
+    assert metrics.polls == 1
+    assert metrics.endpoints["/Apparatus/list"].requests == 1
+    assert metrics.endpoints["/Apparatus/list"].bytes == 123
+    assert metrics.endpoints["/Apparatus/details/{id}"].requests == 2
+    assert set(metrics.last_poll) == {"token", "list", "decode", "details", "total"}
+
+
+async def test_get_device_data_malformed_detail_skips_device(mock_session, mock_auth):
+    """A malformed detail payload or list entry skips that device only."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 2, "name": "Generator 2", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 3, "name": "Generator 3", "type": "not-an-int"},
+    ]
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        if url.endswith("/2"):
+            return _acm(_json_resp({"apparatusId": "not-an-int"}))
+        return _acm(_json_resp({"name": "Generator 1"}))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth, max_concurrency=2)
+
+    result = await client.get_device_data()
+    assert list(result) == ["1"]
+
+    # Still listed, so not reported as gone.
+    result, listed = await client.async_get_data()
+    assert list(result) == ["1"]
+    assert listed == {"1", "2", "3"}
+
+
+async def test_get_device_data_incremental_reuses_unchanged_details(
+    mock_session, mock_auth
+):
+    """Unchanged list entries reuse the cached detail; every N-th poll is full."""
+    entry = {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]}
+    apparatus_list = [dict(entry)]
+    detail_urls = []
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        detail_urls.append(url)
+        return _acm(_json_resp({"name": "Generator 1"}))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth, full_refresh_polls=3)
+
+    first = await client.get_device_data()
+    second = await client.get_device_data()
+    assert len(detail_urls) == 1
+    assert second["1"].apparatusDetail is first["1"].apparatusDetail
+
+    # A changed list entry forces a re-fetch for that device.
+    apparatus_list[0] = {**entry, "apparatusStatus": 2}
+    await client.get_device_data()
+    assert len(detail_urls) == 2
+
+    # Poll #4 is a forced full refresh even though nothing changed.
+    await client.get_device_data()
+    assert len(detail_urls) == 3
+
+
+async def test_get_device_data_full_refresh_every_poll_by_default(
+    mock_session, mock_auth
+):
+    """Without incremental polling every poll re-fetches every detail."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]}
+    ]
+    detail_urls = []
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        detail_urls.append(url)
+        return _acm(_json_resp({"name": "Generator 1"}))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    await client.get_device_data()
+    await client.get_device_data()
+    assert len(detail_urls) == 2
+
+
+async def test_get_device_data_select_picks_details_to_refresh(mock_session, mock_auth):
+    """With a scheduler hook, unselected devices reuse their cached detail."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 2, "name": "Generator 2", "type": ALLOWED_DEVICES[0]},
+    ]
+    detail_urls = []
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        detail_urls.append(url)
+        detail = {"name": url.rsplit("/", 1)[-1], "lastSeen": str(len(detail_urls))}
+        return _acm(_json_resp(detail))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    # Nothing cached yet: everything is fetched whatever the hook says.
+    first = await client.get_device_data(select=lambda apparatuses: set())
+    assert len(detail_urls) == 2
+
+    seen = []
+
+    def select(apparatuses):
+        seen.append([a.apparatusId for a in apparatuses])
+        return {"2"}
+
+    second = await client.get_device_data(select=select)
+    assert seen == [[1, 2]]
+    assert detail_urls[2:] == [f"{API_BASE}/Apparatus/details/2"]
+    assert second["1"].apparatusDetail is first["1"].apparatusDetail
+    assert second["2"].apparatusDetail is not first["2"].apparatusDetail
+
+
+async def test_get_endpoint_429_backs_off_and_retries(mock_session, mock_auth):
+    """A 429 penalizes the shared bucket and the request is retried once."""
+    throttled = AsyncMock(status=429)
+    throttled.headers = {"Retry-After": "0"}
+    mock_session.get.side_effect = [_acm(throttled), _acm(_json_resp({"ok": True}))]
+    limiter = TokenBucket(rate=0, burst=1)
+    client = GeneracApiClient(mock_session, mock_auth, rate_limiter=limiter)
+
+    assert await client.get_endpoint("/test") == {"ok": True}
+    assert limiter.throttled == 1
+    assert limiter.acquired == 2
+
+
+async def test_get_endpoint_repeated_429_fails(mock_session, mock_auth):
+    """A second consecutive 429 surfaces as a poll failure."""
+    throttled = AsyncMock(status=429)
+    throttled.headers = {"Retry-After": "0"}
+    mock_session.get.side_effect = [_acm(throttled), _acm(throttled)]
+    client = GeneracApiClient(
+        mock_session, mock_auth, rate_limiter=TokenBucket(rate=0, burst=1)
+    )
+
+    with pytest.raises(SessionExpiredException):
+        await client.get_endpoint("/test")
+
+
+async def test_get_endpoint_unchanged_body_returns_cached_payload(
+    mock_session, mock_auth
+):
+    """An identical body is not parsed again; the same object comes back."""
+    mock_session.get.side_effect = lambda url, **kwargs: _acm(
+        _json_resp({"key": "value"})
+    )
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    first = await client.get_endpoint("/test")
+    second = await client.get_endpoint("/test")
+    assert second is first
+    assert client.response_cache.as_dict()["hits"] == 1
+    assert client.metrics.endpoints["/test"].cached == 1
+
+
+async def test_get_endpoint_conditional_request_304(mock_session, mock_auth):
+    """Validators are sent back and a 304 serves the cached payload."""
+    fresh = _json_resp({"key": "value"})
+    fresh.headers = {
+        "ETag": '"v1"',
+        "Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT",
+    }
+    not_modified = AsyncMock(status=304)
+    mock_session.get.side_effect = [_acm(fresh), _acm(not_modified)]
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    first = await client.get_endpoint("/test")
+    assert await client.get_endpoint("/test") is first
+
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+    not_modified.read.assert_not_called()
+    assert client.metrics.errors == 0
+
+
+async def test_get_device_data_unchanged_detail_skips_decode(mock_session, mock_auth):
+    """Unchanged bodies reuse the decoded models; changed ones are decoded."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]},
+        {"apparatusId": 2, "name": "Generator 2", "type": ALLOWED_DEVICES[0]},
+    ]
+    details = {"1": {"name": "one"}, "2": {"name": "two"}}
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        return _acm(_json_resp(details[url.rsplit("/", 1)[-1]]))
+
+    mock_session.get.side_effect = fake_get
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    first = await client.get_device_data()
+    details["2"] = {"name": "two", "statusText": "Running"}
+    second = await client.get_device_data()
+
+    assert second["1"].apparatus is first["1"].apparatus
+    assert second["1"].apparatusDetail is first["1"].apparatusDetail
+    assert second["2"].apparatusDetail is not first["2"].apparatusDetail
+    assert second["2"].apparatusDetail.statusText == "Running"
+    assert mock_session.get.call_count == 6
+
+
+async def test_get_endpoint_debug_log_is_lazy_and_bounded(
+    mock_session, mock_auth, caplog
+):
+    """Payloads are only rendered for the debug log when it is enabled."""
+    payload = {"blob": "x" * 5000}
+    mock_session.get.side_effect = lambda url, **kwargs: _acm(_json_resp(payload))
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    with patch("custom_components.generac.api._preview") as preview:
+        caplog.set_level(logging.INFO, logger="custom_components.generac")
+        await client.get_endpoint("/quiet")
+        preview.assert_not_called()
+
+    caplog.set_level(logging.DEBUG, logger="custom_components.generac")
+    await client.get_endpoint("/loud")
+    (message,) = [r.getMessage() for r in caplog.records if "/loud" in r.getMessage()]
+    assert len(message) < 1100
+    assert message.endswith(f"({len(json.dumps(payload))} bytes)")
+
+
+async def test_get_endpoint_captures_payloads(mock_session, mock_auth):
+    """With capture on, raw bodies (including error bodies) are recorded."""
+    error = AsyncMock(status=500)
+    error.text = AsyncMock(return_value="boom")
+    mock_session.get.side_effect = [_acm(_json_resp({"ok": True})), _acm(error)]
+    capture = MagicMock()
+    client = GeneracApiClient(
+        mock_session,
+        mock_auth,
+        payload_capture=capture,
+        retry_policy=RetryPolicy(attempts=1),
+    )
+
+    await client.get_endpoint("/test")
+    with pytest.raises(SessionExpiredException):
+        await client.get_endpoint("/test")
+
+    assert capture.record.call_args_list == [
+        call("/test", 200, b'{"ok": true}'),
+        call("/test", 500, "boom"),
+    ]
+
+
+def test_fingerprint_ignores_key_order():
+    """List-entry fingerprints are canonical whichever JSON backend is used."""
+    first = {"apparatusId": 1, "name": "Generator 1", "weather": {"b": 1, "a": 2}}
+    second = {"weather": {"a": 2, "b": 1}, "name": "Generator 1", "apparatusId": 1}
+    assert _fingerprint(first) == _fingerprint(second)
+    assert _fingerprint(first) != _fingerprint({**first, "name": "Generator 2"})
+
+
+async def test_get_endpoint_retries_transient_failures(mock_session, mock_auth):
+    """Timeouts, dropped connections and 5xx are retried, then succeed."""
+    mock_session.get.side_effect = [
+        asyncio.TimeoutError,
+        aiohttp.ServerDisconnectedError(),
+        _acm(AsyncMock(status=503)),
+        _acm(_json_resp({"ok": True})),
+    ]
+    client = GeneracApiClient(
+        mock_session, mock_auth, retry_policy=RetryPolicy(attempts=4)
+    )
+
+    assert await client.get_endpoint("/test") == {"ok": True}
+    assert mock_session.get.call_count == 4
+    assert client.metrics.endpoints["/test"].errors == {
+        "TimeoutError": 1,
+        "ServerDisconnectedError": 1,
+        "http_503": 1,
+    }
+
+
+async def test_get_endpoint_gives_up_after_attempts(mock_session, mock_auth):
+    mock_session.get.return_value = _acm(AsyncMock(status=502))
+    client = GeneracApiClient(
+        mock_session, mock_auth, retry_policy=RetryPolicy(attempts=2)
+    )
+
+    with pytest.raises(SessionExpiredException):
+        await client.get_endpoint("/test")
+    assert mock_session.get.call_count == 2
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+async def test_get_endpoint_does_not_retry_client_errors(
+    mock_session, mock_auth, status
+):
+    mock_session.get.return_value = _acm(AsyncMock(status=status))
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    with pytest.raises(SessionExpiredException):
+        await client.get_endpoint("/test")
+    assert mock_session.get.call_count == 1
+
+
+async def test_get_endpoint_does_not_retry_bad_json(mock_session, mock_auth):
+    response = AsyncMock(status=200)
+    response.headers = {}
+    response.read = AsyncMock(return_value=b"{not json")
+    mock_session.get.return_value = _acm(response)
+    client = GeneracApiClient(mock_session, mock_auth)
+
+    with pytest.raises(IOError):
+        await client.get_endpoint("/test")
+    assert mock_session.get.call_count == 1
+
+
+async def test_get_device_data_circuit_breaker(mock_session, mock_auth):
+    """Repeated outages open the breaker; polls then skip the network."""
+    apparatus_list = [
+        {"apparatusId": 1, "name": "Generator 1", "type": ALLOWED_DEVICES[0]}
+    ]
+    mock_session.get.side_effect = asyncio.TimeoutError
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    client = GeneracApiClient(mock_session, mock_auth, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(IOError):
+            await client.get_device_data()
+    assert breaker.state == STATE_OPEN
+    calls = mock_session.get.call_count
+    assert calls == 6
+
+    with pytest.raises(CircuitOpenError):
+        await client.get_device_data()
+    assert mock_session.get.call_count == calls
+
+    # Half-open: a single probe of the list, no retries.
+    await asyncio.sleep(0.05)
+    with pytest.raises(IOError):
+        await client.get_device_data()
+    assert mock_session.get.call_count == calls + 1
+    assert breaker.state == STATE_OPEN
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/Apparatus/list"):
+            return _acm(_json_resp(apparatus_list))
+        return _acm(_json_resp({"name": "Generator 1"}))
+
+    mock_session.get.side_effect = fake_get
+    await asyncio.sleep(0.1)
+    assert list(await client.get_device_data()) == ["1"]
+    assert breaker.state == STATE_CLOSED
+
+
+async def test_get_device_data_client_errors_do_not_trip_breaker(
+    mock_session, mock_auth
+):
+    mock_session.get.return_value = _acm(AsyncMock(status=401))
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = GeneracApiClient(mock_session, mock_auth, breaker=breaker)
+
+    with pytest.raises(SessionExpiredException):
+        await client.get_device_data()
+    assert breaker.state == STATE_CLOSED
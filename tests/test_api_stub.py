@@ -0,0 +1,89 @@
+"""End-to-end polls against the local MobileLink stub server."""
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from benchmarks.mobilelink_stub import MobileLinkStub
+from benchmarks.mobilelink_stub import REFRESH_TOKEN
+from custom_components.generac.api import GeneracApiClient
+from custom_components.generac.api import InvalidCredentialsException
+from custom_components.generac.api import SessionExpiredException
+from custom_components.generac.auth import DPoPKey
+from custom_components.generac.auth import GeneracAuth
+from custom_components.generac.ratelimit import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    with patch("custom_components.generac.retry.RetryPolicy.delay", return_value=0):
+        yield
+
+
+@pytest.fixture
+async def stub(socket_enabled):
+    server = MobileLinkStub(devices=8)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _client(session, stub, refresh_token=REFRESH_TOKEN, **kwargs):
+    auth = GeneracAuth(
+        session, refresh_token, DPoPKey.generate(), token_url=stub.token_url
+    )
+    return GeneracApiClient(session, auth, base_url=stub.api_base, **kwargs)
+
+
+async def test_poll_through_stub(stub):
+    """Token refresh answers the DPoP nonce challenge, then the fleet is polled."""
+    async with aiohttp.ClientSession() as session:
+        client = _client(session, stub)
+        data, listed = await client.async_get_data()
+        await client.async_get_data()
+
+    assert len(data) == 8
+    assert listed == set(data)
+    assert data["4"].apparatus.type == 2
+    assert data["4"].apparatusDetail.tu_property_value(9) is not None
+    assert stub.stats["nonce_challenge"] == 1
+    assert stub.stats["token"] == 2
+    assert stub.stats["list"] == 2
+    assert stub.stats["details"] == 16
+
+
+async def test_stub_rejects_unknown_refresh_token(stub):
+    async with aiohttp.ClientSession() as session:
+        client = _client(session, stub, refresh_token="revoked")
+        with pytest.raises(InvalidCredentialsException):
+            await client.async_get_data()
+
+
+async def test_stub_server_errors_fail_the_poll(stub):
+    stub.error_rate = 1.0
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(SessionExpiredException):
+            await _client(session, stub).async_get_data()
+    # The list call was attempted three times before giving up.
+    assert stub.stats["500"] == 3
+
+
+async def test_stub_sporadic_server_errors_are_retried(stub):
+    stub.error_rate = 0.3
+    async with aiohttp.ClientSession() as session:
+        data, _ = await _client(session, stub).async_get_data()
+
+    assert len(data) == 8
+    assert stub.stats["500"] > 0
+
+
+async def test_stub_throttling_penalizes_the_limiter(stub):
+    stub.rate_limit = 1
+    stub.retry_after = 0
+    limiter = TokenBucket(rate=0, burst=1)
+    async with aiohttp.ClientSession() as session:
+        client = _client(session, stub, rate_limiter=limiter, max_concurrency=8)
+        with pytest.raises(SessionExpiredException):
+            await client.async_get_data()
+
+    assert stub.stats["429"] > 0
+    assert limiter.throttled > 0
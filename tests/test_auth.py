@@ -1,16 +1,25 @@
 """Tests for GeneracAuth refresh + Auth0 ULP form-parser error handling."""
 from __future__ import annotations
 
+import asyncio
+import base64
 import json
+import time
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
 from custom_components.generac.auth import _post_login_form
+from custom_components.generac.auth import acquire_shared_auth
 from custom_components.generac.auth import DPoPKey
 from custom_components.generac.auth import GeneracAuth
 from custom_components.generac.auth import InvalidCredentialsError
 from custom_components.generac.auth import InvalidGrantError
+from custom_components.generac.auth import release_shared_auth
 
 
 def _acm(resp):
@@ -185,6 +194,324 @@ async def test_refresh_transient_5xx_raises_runtime_error():
         await auth._refresh()
 
 
+async def _run_background_refresh(auth: GeneracAuth, sleeps: list, max_sleeps: int):
+    """Run the background loop, recording sleeps, until it returns or is cut off."""
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) >= max_sleeps:
+            raise asyncio.CancelledError
+
+    with patch("custom_components.generac.auth.asyncio.sleep", fake_sleep):
+        try:
+            await auth.async_background_refresh()
+        except asyncio.CancelledError:
+            return False
+    return True
+
+
+def _minted(auth: GeneracAuth, responses: list) -> None:
+    """Give `auth` an already-expired token; the session then serves `responses`."""
+    auth._access_token = "AT-OLD"
+    auth._access_token_ttl = 3600
+    auth._access_token_exp = 0.0
+    auth._token_minted.set()
+    auth._session.post = MagicMock(side_effect=[_acm(r) for r in responses])
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_renews_ahead_of_expiry():
+    """Once a token exists it is renewed 300-450s before it expires."""
+    auth = _make_auth()
+    auth._session.post = MagicMock(
+        return_value=_acm(_token_resp(200, {"access_token": "AT", "expires_in": 3600}))
+    )
+    await auth.ensure_access_token()
+
+    sleeps: list = []
+    assert not await _run_background_refresh(auth, sleeps, max_sleeps=1)
+    assert 3600 - 450 - 1 <= sleeps[0] <= 3600 - 300
+    assert auth._session.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_waits_for_first_token():
+    """The first token is left to the first poll."""
+    auth = _make_auth()
+    auth._session.post = MagicMock()
+    task = asyncio.ensure_future(auth.async_background_refresh())
+    await asyncio.sleep(0)
+    assert not task.done()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    auth._session.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_backs_off_on_5xx():
+    """Transient failures are retried with growing, jittered delays."""
+    auth = _make_auth()
+    _minted(
+        auth,
+        [
+            _token_resp(503, {"error": "server_error"}),
+            _token_resp(503, {"error": "server_error"}),
+            _token_resp(200, {"access_token": "AT", "expires_in": 3600}),
+        ],
+    )
+
+    sleeps: list = []
+    assert not await _run_background_refresh(auth, sleeps, max_sleeps=3)
+    assert 2.5 <= sleeps[0] <= 5
+    assert 5 <= sleeps[1] <= 10
+    assert sleeps[2] > 3000
+    assert auth._access_token == "AT"
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_stops_on_invalid_grant():
+    auth = _make_auth()
+    _minted(auth, [_token_resp(403, {"error": "invalid_grant"})])
+
+    sleeps: list = []
+    assert await _run_background_refresh(auth, sleeps, max_sleeps=5)
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_skips_when_lazy_refresh_won():
+    """A token refreshed by a poll in the meantime isn't refreshed again."""
+    auth = _make_auth()
+    auth._session.post = MagicMock(
+        return_value=_acm(_token_resp(200, {"access_token": "AT", "expires_in": 3600}))
+    )
+    await auth.ensure_access_token()
+
+    # The fake sleep returns at once: the timer "fires" while the token
+    # the poll just minted is still far from expiry.
+    sleeps: list = []
+    assert not await _run_background_refresh(auth, sleeps, max_sleeps=2)
+    assert auth._session.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_gives_up_on_short_lived_tokens():
+    auth = _make_auth()
+    _minted(auth, [_token_resp(200, {"access_token": "AT", "expires_in": 30})])
+
+    sleeps: list = []
+    assert await _run_background_refresh(auth, sleeps, max_sleeps=5)
+    assert auth._session.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_token_state_persisted_and_restored():
+    """A refreshed token survives a restart via token_state()."""
+    auth = _make_auth()
+    auth._session.post = MagicMock(
+        side_effect=[
+            _acm(_token_resp(400, {"error": "use_dpop_nonce"}, dpop_nonce="N1")),
+            _acm(_token_resp(200, {"access_token": "AT", "expires_in": 3600})),
+        ]
+    )
+    saved = []
+    auth.set_token_persist_callback(AsyncMock(side_effect=saved.append))
+    await auth.ensure_access_token()
+    assert saved[-1]["access_token"] == "AT"
+    assert saved[-1]["dpop_nonce"] == "N1"
+
+    restored = GeneracAuth.from_storage(
+        MagicMock(), auth.refresh_token, auth.pem_str, token_state=saved[-1]
+    )
+    restored._session.post = MagicMock()
+    assert await restored.ensure_access_token() == "AT"
+    assert restored._dpop_nonce == "N1"
+    restored._session.post.assert_not_called()
+
+
+def test_token_state_ignored_for_other_credentials_or_when_expired():
+    auth = _make_auth()
+    auth._access_token = "AT"
+    auth._access_token_exp = time.time() + 3600
+    auth._dpop_nonce = "N1"
+    state = auth.token_state()
+
+    # Different refresh token (e.g. after reauth): nothing is restored.
+    other = GeneracAuth.from_storage(
+        MagicMock(), "rt-NEW", auth.pem_str, token_state=state
+    )
+    assert other._access_token is None
+    assert other._dpop_nonce is None
+
+    # Expired token: only the nonce is worth keeping.
+    fresh = _make_auth()
+    fresh._key = auth._key
+    assert not fresh.restore_token_state({**state, "expires_at": time.time()})
+    assert fresh._access_token is None
+    assert fresh._dpop_nonce == "N1"
+
+
+@pytest.mark.asyncio
+async def test_token_state_cleared_on_invalid_grant():
+    auth = _make_auth()
+    auth._session.post = MagicMock(
+        return_value=_acm(_token_resp(403, {"error": "invalid_grant"}))
+    )
+    persist = AsyncMock()
+    auth.set_token_persist_callback(persist)
+
+    with pytest.raises(InvalidGrantError):
+        await auth._refresh()
+    persist.assert_awaited_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_shared_auth_dedupes_refresh_across_entries():
+    """Entries holding the same credential share one token and one refresh."""
+    pem = DPoPKey.generate().to_pem_str()
+    session = MagicMock()
+    session.post = MagicMock(
+        return_value=_acm(_token_resp(200, {"access_token": "AT", "expires_in": 3600}))
+    )
+    saved_a, saved_b = [], []
+    persist_a = AsyncMock(side_effect=saved_a.append)
+    persist_b = AsyncMock(side_effect=saved_b.append)
+    auth_a = acquire_shared_auth("a", session, "rt", pem, token_persist_cb=persist_a)
+    auth_b = acquire_shared_auth(
+        "b", MagicMock(), "rt", pem, token_persist_cb=persist_b
+    )
+    assert auth_a is auth_b
+
+    tokens = await asyncio.gather(
+        auth_a.ensure_access_token(), auth_b.ensure_access_token()
+    )
+    assert tokens == ["AT", "AT"]
+    assert session.post.call_count == 1
+    # Both entries' token stores are kept current.
+    assert saved_a[-1]["access_token"] == saved_b[-1]["access_token"] == "AT"
+
+    # Another credential for the same key gets its own instance.
+    other = acquire_shared_auth("c", session, "rt-other", pem)
+    assert other is not auth_a
+    release_shared_auth("c", other)
+
+    release_shared_auth("a", auth_a)
+    assert acquire_shared_auth("d", session, "rt", pem) is auth_a
+    release_shared_auth("b", auth_a)
+    release_shared_auth("d", auth_a)
+    assert acquire_shared_auth("a", session, "rt", pem) is not auth_a
+
+
+@pytest.mark.asyncio
+async def test_shared_auth_follows_refresh_token_rotation():
+    """An entry reloaded with the rotated token rejoins the same instance."""
+    pem = DPoPKey.generate().to_pem_str()
+    session = MagicMock()
+    session.post = MagicMock(
+        return_value=_acm(
+            _token_resp(
+                200,
+                {"access_token": "AT", "expires_in": 3600, "refresh_token": "rt2"},
+            )
+        )
+    )
+    saved = []
+    auth = acquire_shared_auth(
+        "a", session, "rt", pem, refresh_token_persist_cb=AsyncMock()
+    )
+    acquire_shared_auth(
+        "b",
+        session,
+        "rt",
+        pem,
+        refresh_token_persist_cb=AsyncMock(side_effect=saved.append),
+    )
+
+    await auth.ensure_access_token()
+    assert saved == ["rt2"]
+
+    # Entry "b" reloads with what it persisted.
+    release_shared_auth("b", auth)
+    assert acquire_shared_auth("b", session, saved[-1], pem) is auth
+    other = acquire_shared_auth("c", session, "rt", pem)
+    assert other is not auth
+    release_shared_auth("c", other)
+    release_shared_auth("a", auth)
+    release_shared_auth("b", auth)
+
+
+def test_shared_auth_hands_over_session_on_release():
+    """Refreshes move off the session of an entry that is released."""
+    pem = DPoPKey.generate().to_pem_str()
+    session_a, session_b = MagicMock(), MagicMock()
+    auth = acquire_shared_auth("a", session_a, "rt", pem)
+    acquire_shared_auth("b", session_b, "rt", pem)
+    assert auth._session is session_a
+
+    release_shared_auth("a", auth)
+    assert auth._session is session_b
+    release_shared_auth("b", auth)
+
+
+@pytest.mark.asyncio
+async def test_shared_auth_runs_one_background_refresh():
+    """A second entry's refresh loop waits until the first is cancelled."""
+    auth = _make_auth()
+    auth._session.post = MagicMock(
+        return_value=_acm(_token_resp(200, {"access_token": "AT", "expires_in": 3600}))
+    )
+    await auth.ensure_access_token()
+
+    first = asyncio.ensure_future(auth.async_background_refresh())
+    second = asyncio.ensure_future(auth.async_background_refresh())
+    await asyncio.sleep(0)
+    assert auth._background_lock.locked()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.sleep(0)
+    assert not second.done()
+    assert auth._background_lock.locked()
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert not auth._background_lock.locked()
+
+
+def test_sign_proof_header_and_signature():
+    """Proofs carry the key's JWK header and verify against its public key."""
+    key = DPoPKey.generate()
+    proof = key.sign_proof("post", "https://example.com/token", nonce="N1")
+    header_seg, payload_seg, sig_seg = proof.split(".")
+
+    def b64decode(segment: str) -> bytes:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+    assert json.loads(b64decode(header_seg)) == {
+        "alg": "ES256",
+        "typ": "dpop+jwt",
+        "jwk": key.jwk,
+    }
+    payload = json.loads(b64decode(payload_seg))
+    assert payload["htm"] == "POST"
+    assert payload["nonce"] == "N1"
+
+    raw = b64decode(sig_seg)
+    signature = encode_dss_signature(
+        int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:], "big")
+    )
+    key.private_key.public_key().verify(
+        signature,
+        f"{header_seg}.{payload_seg}".encode(),
+        ec.ECDSA(hashes.SHA256()),
+    )
+    # Same key, same header segment; fresh jti per proof.
+    assert key.sign_proof("POST", "https://example.com/token") != proof
+    reloaded = DPoPKey.from_pem_str(key.to_pem_str())
+    assert reloaded._header_segment == header_seg
+
+
 def _ulp_error_resp(status: int, code: str | None):
     """Build a fake Auth0 ULP HTML response advertising a data-error-code."""
     resp = MagicMock()
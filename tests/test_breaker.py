@@ -0,0 +1,47 @@
+"""Tests for the MobileLink circuit breaker."""
+import pytest
+from custom_components.generac.breaker import CircuitBreaker
+from custom_components.generac.breaker import CircuitOpenError
+from custom_components.generac.breaker import STATE_CLOSED
+from custom_components.generac.breaker import STATE_HALF_OPEN
+from custom_components.generac.breaker import STATE_OPEN
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure(now=0)
+    breaker.record_failure(now=0)
+    breaker.record_success()
+    breaker.record_failure(now=0)
+    breaker.record_failure(now=0)
+    assert breaker.state == STATE_CLOSED
+    assert not breaker.before_poll(now=0)
+
+    breaker.record_failure(now=0)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_poll(now=59)
+    assert breaker.short_circuited == 1
+
+
+def test_half_open_probe_closes_or_reopens_with_backoff():
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=60, max_reset_timeout=200
+    )
+    breaker.record_failure(now=0)
+
+    assert breaker.before_poll(now=60)
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.record_failure(now=60)
+    assert breaker.state == STATE_OPEN
+    assert breaker.retry_in(now=60) == 120
+
+    assert breaker.before_poll(now=180)
+    breaker.record_failure(now=180)
+    assert breaker.retry_in(now=180) == 200
+
+    assert breaker.before_poll(now=380)
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.reset_timeout == 60
+    assert breaker.as_dict()["times_opened"] == 3
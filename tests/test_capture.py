@@ -0,0 +1,33 @@
+"""Tests for the opt-in raw payload capture."""
+import logging
+
+from custom_components.generac.capture import PayloadCapture
+
+
+def test_capture_writes_rotating_file(tmp_path):
+    path = tmp_path / "payloads.log"
+    capture = PayloadCapture(str(path), max_bytes=200, backups=1)
+    capture.start()
+    capture.record("/Apparatus/list", 200, b'[{"apparatusId": 1}]')
+    capture.record("/Apparatus/details/1", 500, "oops")
+    for _ in range(5):
+        capture.record("/Apparatus/details/2", 200, b"x" * 100)
+    capture.stop()
+
+    assert capture.captured == 7
+    assert (tmp_path / "payloads.log.1").exists()
+    assert not (tmp_path / "payloads.log.2").exists()
+    assert path.stat().st_size <= 200
+
+
+def test_capture_stays_out_of_the_log(tmp_path, caplog):
+    caplog.set_level(logging.DEBUG)
+    capture = PayloadCapture(str(tmp_path / "payloads.log"))
+    capture.start()
+    capture.record("/Apparatus/list", 200, b"secret-payload")
+    capture.stop()
+
+    assert "secret-payload" not in caplog.text
+    assert (
+        "/Apparatus/list 200 secret-payload" in (tmp_path / "payloads.log").read_text()
+    )
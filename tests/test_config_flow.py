@@ -7,6 +7,7 @@ import pytest
 from custom_components.generac.auth import DPoPKey
 from custom_components.generac.auth import InvalidCredentialsError
 from custom_components.generac.const import CONF_DPOP_PEM
+from custom_components.generac.const import CONF_OPTIONS
 from custom_components.generac.const import CONF_PASSWORD
 from custom_components.generac.const import CONF_REFRESH_TOKEN
 from custom_components.generac.const import CONF_USERNAME
@@ -156,7 +157,9 @@ async def test_options_flow(hass: HomeAssistant) -> None:
     )
 
     assert result["type"] == "create_entry"
+    # Options the entry didn't have yet are saved with their defaults.
     assert entry.options == {
+        **{key: opt["default"] for key, opt in CONF_OPTIONS.items()},
         "binary_sensor": False,
         "sensor": True,
         "weather": True,
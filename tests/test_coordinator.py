@@ -2,15 +2,36 @@
 from datetime import timedelta
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 from custom_components.generac.api import InvalidCredentialsException
 from custom_components.generac.auth import InvalidGrantError
+from custom_components.generac.breaker import CircuitOpenError
+from custom_components.generac.const import CONF_ACTIVE_SCAN_INTERVAL
+from custom_components.generac.const import CONF_ADAPTIVE_POLLING
+from custom_components.generac.const import CONF_REQUEST_BUDGET
 from custom_components.generac.const import CONF_SCAN_INTERVAL
 from custom_components.generac.const import DEFAULT_SCAN_INTERVAL
+from custom_components.generac.const import DEVICE_TYPE_GENERATOR
+from custom_components.generac.const import DEVICE_TYPE_PROPANE_MONITOR
+from custom_components.generac.const import DOMAIN
+from custom_components.generac.coordinator import DEVICE_REMOVAL_GRACE
+from custom_components.generac.coordinator import dump_snapshot
 from custom_components.generac.coordinator import GeneracDataUpdateCoordinator
+from custom_components.generac.coordinator import load_snapshot
+from custom_components.generac.coordinator import MAX_IDLE_BACKOFF
+from custom_components.generac.coordinator import PollScheduler
+from custom_components.generac.coordinator import SNAPSHOT_SAVE_DELAY
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import Item
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
 async def test_coordinator_init(hass):
@@ -30,7 +51,7 @@ async def test_coordinator_update_data(hass):
     config_entry = MagicMock()
     config_entry.options = {}
     client = MagicMock()
-    client.async_get_data = AsyncMock(return_value={"foo": "bar"})
+    client.async_get_data = AsyncMock(return_value=({"foo": "bar"}, frozenset({"foo"})))
     coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
     coordinator.data = await coordinator._async_update_data()
     assert coordinator.data == {"foo": "bar"}
@@ -49,6 +70,19 @@ async def test_coordinator_update_data_fails(hass):
     assert not coordinator.is_online
 
 
+async def test_coordinator_circuit_open_fails_quietly(hass, caplog):
+    """A short-circuited poll is an UpdateFailed without a traceback."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    client = MagicMock()
+    client.async_get_data = AsyncMock(side_effect=CircuitOpenError("open"))
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert not coordinator.is_online
+    assert "Traceback" not in caplog.text
+
+
 async def test_coordinator_uses_default_scan_interval(hass):
     """Without a scan_interval option, coordinator picks DEFAULT_SCAN_INTERVAL."""
     config_entry = MagicMock()
@@ -87,3 +121,386 @@ async def test_coordinator_invalid_grant_raises_auth_failed(hass):
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
     assert not coordinator.is_online
+
+
+def test_snapshot_round_trip():
+    """dump_snapshot/load_snapshot preserve the items and drop None fields."""
+    items = {
+        "1": Item(
+            apparatus=Apparatus(apparatusId=1, name="Gen", type=0),
+            apparatusDetail=ApparatusDetail(
+                name="Gen",
+                properties=[ApparatusDetail.Property(name="Hours", value=12, type=71)],
+            ),
+        )
+    }
+    dumped = dump_snapshot(items)
+    assert dumped["devices"]["1"][0] == {"apparatusId": 1, "name": "Gen", "type": 0}
+    assert load_snapshot(dumped) == items
+
+
+async def test_coordinator_load_snapshot(hass, hass_storage):
+    """async_load_snapshot seeds data from storage and marks it as cached."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    config_entry.entry_id = "abc"
+    hass_storage["generac.abc.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "generac.abc.snapshot",
+        "data": {"devices": {"1": [{"apparatusId": 1}, {"name": "Gen"}]}},
+    }
+    coordinator = GeneracDataUpdateCoordinator(hass, MagicMock(), config_entry)
+
+    assert await coordinator.async_load_snapshot()
+    assert coordinator.from_snapshot
+    assert coordinator.is_online
+    assert coordinator.data["1"].apparatusDetail.name == "Gen"
+
+
+async def test_coordinator_load_snapshot_missing_or_corrupt(hass, hass_storage):
+    """No snapshot, or an unreadable one, falls back to a blocking refresh."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    config_entry.entry_id = "abc"
+    coordinator = GeneracDataUpdateCoordinator(hass, MagicMock(), config_entry)
+    assert not await coordinator.async_load_snapshot()
+
+    hass_storage["generac.abc.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "generac.abc.snapshot",
+        "data": {"devices": {"1": "garbage"}},
+    }
+    coordinator = GeneracDataUpdateCoordinator(hass, MagicMock(), config_entry)
+    assert not await coordinator.async_load_snapshot()
+    assert not coordinator.from_snapshot
+
+
+async def test_coordinator_saves_snapshot_despite_frequent_polls(hass, hass_storage):
+    """Polls closer together than the save delay don't postpone the write."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    config_entry.entry_id = "abc"
+    item = Item(Apparatus(apparatusId=1), ApparatusDetail(name="A"))
+    client = MagicMock()
+    client.async_get_data = AsyncMock(return_value=({"1": item}, frozenset({"1"})))
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    await coordinator.async_load_snapshot()
+    start = dt_util.utcnow()
+
+    for elapsed in (0, SNAPSHOT_SAVE_DELAY - 5):
+        async_fire_time_changed(hass, start + timedelta(seconds=elapsed))
+        coordinator.data = await coordinator._async_update_data()
+    assert "generac.abc.snapshot" not in hass_storage
+
+    async_fire_time_changed(hass, start + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    assert hass_storage["generac.abc.snapshot"]["data"] == dump_snapshot({"1": item})
+
+
+async def test_coordinator_tracks_changes(hass):
+    """Only devices whose Item changed (or came/went) are reported."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    unchanged = Item(Apparatus(apparatusId=1), ApparatusDetail(name="A"))
+    before = Item(Apparatus(apparatusId=2), ApparatusDetail(name="B"))
+    after = Item(Apparatus(apparatusId=2), ApparatusDetail(name="B2"))
+    client = MagicMock()
+    client.async_get_data = AsyncMock(
+        return_value=(
+            {"1": unchanged, "2": after, "3": unchanged},
+            frozenset({"1", "2", "3"}),
+        )
+    )
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    coordinator.data = {"1": unchanged, "2": before, "4": unchanged}
+
+    await coordinator._async_update_data()
+    assert coordinator.changes.device_ids() == {"2", "3", "4"}
+    assert coordinator.changes.added == {"3"}
+    assert coordinator.changes.removed == {"4"}
+    assert coordinator.changes.get("2").changed == {"apparatusDetail.name"}
+
+    client.async_get_data = AsyncMock(side_effect=Exception)
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert not coordinator.changes
+
+
+async def test_coordinator_purges_devices_missing_since_restart(hass):
+    """Registered devices absent from the first live poll start their grace."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="abc")
+    config_entry.add_to_hass(hass)
+    devices = dr.async_get(hass)
+    for device_id in ("1", "9"):
+        devices.async_get_or_create(
+            config_entry_id="abc", identifiers={(DOMAIN, device_id)}
+        )
+    client = MagicMock()
+    client.async_get_data = AsyncMock(
+        return_value=(
+            {"1": Item(Apparatus(apparatusId=1), ApparatusDetail())},
+            frozenset({"1"}),
+        )
+    )
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+
+    await coordinator._async_update_data()
+    assert coordinator.purged == set()
+    assert set(coordinator._missing_since) == {"9"}
+
+    coordinator._missing_since["9"] -= DEVICE_REMOVAL_GRACE
+    await coordinator._async_update_data()
+    assert coordinator.purged == {"9"}
+    assert devices.async_get_device(identifiers={(DOMAIN, "9")}) is None
+    assert devices.async_get_device(identifiers={(DOMAIN, "1")}) is not None
+    assert coordinator._missing_since == {}
+
+
+async def test_coordinator_pushes_renamed_devices_to_registry(hass):
+    """A new apparatus name or model updates the registry device once."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="abc")
+    config_entry.add_to_hass(hass)
+    devices = dr.async_get(hass)
+    device = devices.async_get_or_create(
+        config_entry_id="abc", identifiers={(DOMAIN, "1")}, name="Gen", model="A"
+    )
+    before = Item(
+        Apparatus(apparatusId=1, name="Gen", modelNumber="A"), ApparatusDetail()
+    )
+    renamed = Item(
+        Apparatus(apparatusId=1, name="Home", modelNumber="B"), ApparatusDetail()
+    )
+    client = MagicMock()
+    client.async_get_data = AsyncMock(return_value=({"1": renamed}, frozenset({"1"})))
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    coordinator.data = {"1": before}
+
+    await coordinator._async_update_data()
+    assert coordinator.renamed == {"1"}
+    device = devices.async_get(device.id)
+    assert (device.name, device.model) == ("Home", "B")
+
+    coordinator.data = {"1": renamed}
+    await coordinator._async_update_data()
+    assert coordinator.renamed == set()
+
+
+async def test_coordinator_keeps_listed_devices_with_skipped_details(hass):
+    """Only devices the list itself leaves out start their removal grace."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="abc")
+    config_entry.add_to_hass(hass)
+    item = Item(Apparatus(apparatusId=1), ApparatusDetail())
+    client = MagicMock()
+    # Device 2's details were skipped; device 3 is no longer listed.
+    client.async_get_data = AsyncMock(return_value=({"1": item}, frozenset({"1", "2"})))
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    coordinator.data = {"1": item, "2": item, "3": item}
+
+    await coordinator._async_update_data()
+    assert coordinator.changes.removed == {"2", "3"}
+    assert set(coordinator._missing_since) == {"3"}
+
+    coordinator._missing_since["3"] -= DEVICE_REMOVAL_GRACE
+    await coordinator._async_update_data()
+    assert coordinator.purged == {"3"}
+
+    # A failed refresh reports nothing purged.
+    client.async_get_data = AsyncMock(side_effect=Exception)
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.purged == set()
+
+
+async def test_coordinator_purges_devices_delisted_after_skipped_details(hass):
+    """A device already skipped still starts its grace once it is delisted."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="abc")
+    config_entry.add_to_hass(hass)
+    one = Item(Apparatus(apparatusId=1), ApparatusDetail())
+    two = Item(Apparatus(apparatusId=2), ApparatusDetail())
+    client = MagicMock()
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    polls = [
+        ({"1": one, "2": two}, frozenset({"1", "2"})),
+        ({"1": one}, frozenset({"1", "2"})),
+        ({"1": one}, frozenset({"1"})),
+    ]
+    for poll in polls:
+        client.async_get_data = AsyncMock(return_value=poll)
+        coordinator.data = await coordinator._async_update_data()
+    assert set(coordinator._missing_since) == {"2"}
+
+
+async def test_coordinator_retries_failed_startup_sweep(hass):
+    """If the registry sweep fails, the next poll runs it again."""
+    config_entry = MockConfigEntry(domain=DOMAIN, entry_id="abc")
+    config_entry.add_to_hass(hass)
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id="abc", identifiers={(DOMAIN, "9")}
+    )
+    client = MagicMock()
+    client.async_get_data = AsyncMock(return_value=({}, frozenset()))
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+
+    with patch(
+        "custom_components.generac.coordinator.dr.async_entries_for_config_entry",
+        side_effect=RuntimeError,
+    ), pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator._missing_since is None
+
+    await coordinator._async_update_data()
+    assert set(coordinator._missing_since) == {"9"}
+
+
+def _generator(device_id: int, status: int = 1, connecting: bool = False) -> Item:
+    return Item(
+        Apparatus(
+            apparatusId=device_id,
+            type=DEVICE_TYPE_GENERATOR,
+            apparatusStatus=status,
+            isConnecting=connecting,
+        ),
+        ApparatusDetail(),
+    )
+
+
+def _tank(device_id: int, reading_date: str) -> Item:
+    return Item(
+        Apparatus(apparatusId=device_id, type=DEVICE_TYPE_PROPANE_MONITOR),
+        ApparatusDetail(
+            tuProperties=[ApparatusDetail.Property("date", reading_date, 11)]
+        ),
+    )
+
+
+def _tick(scheduler: PollScheduler, items: dict[str, Item], now: float) -> set[str]:
+    chosen = scheduler.select([item.apparatus for item in items.values()], now)
+    scheduler.commit(items, now)
+    return chosen
+
+
+def test_scheduler_fetches_active_devices_faster():
+    """Running/exercising/warning/connecting units use the active cadence."""
+    scheduler = PollScheduler(interval=900, active_interval=60, budget=1000)
+    items = {
+        "1": _generator(1, status=1),
+        "2": _generator(2, status=2),
+        "3": _generator(3, status=1, connecting=True),
+    }
+    assert _tick(scheduler, items, 0) == {"1", "2", "3"}
+    assert scheduler.next_interval(0) == 60
+
+    assert _tick(scheduler, items, 60) == {"2", "3"}
+    assert _tick(scheduler, items, 900) == {"1", "2", "3"}
+
+    # A unit that starts running is picked up on the next list poll.
+    items["1"] = _generator(1, status=3)
+    assert _tick(scheduler, items, 960) == {"1", "2", "3"}
+
+
+def test_scheduler_idles_at_scan_interval():
+    """With nothing active the tick stays at the normal scan interval."""
+    scheduler = PollScheduler(interval=900, active_interval=60, budget=1000)
+    items = {"1": _generator(1)}
+    _tick(scheduler, items, 0)
+    assert scheduler.next_interval(0) == 900
+    assert _tick(scheduler, items, 300) == set()
+
+
+def test_scheduler_backs_off_stale_tank_monitors():
+    """A tank whose reading date doesn't advance is fetched less often."""
+    scheduler = PollScheduler(interval=900, active_interval=60, budget=1000)
+    items = {"1": _tank(1, "2026-01-01T00:00:00")}
+    now = 0
+    _tick(scheduler, items, now)
+    for backoff in (2, 4):
+        now += 900
+        assert _tick(scheduler, items, now) == {"1"}
+        assert scheduler.as_dict()["backed_off_devices"] == 1
+        # Not due again until the backed-off period has passed.
+        assert _tick(scheduler, items, now + 900 * (backoff - 1)) == set()
+        now += 900 * (backoff - 1)
+    assert backoff == MAX_IDLE_BACKOFF
+
+    # A new reading resets the cadence.
+    items = {"1": _tank(1, "2026-01-02T00:00:00")}
+    now += 900 * MAX_IDLE_BACKOFF
+    assert _tick(scheduler, items, now) == {"1"}
+    assert scheduler.as_dict()["backed_off_devices"] == 0
+
+
+def test_scheduler_respects_request_budget():
+    """Due devices beyond the hourly budget wait, active ones first."""
+    scheduler = PollScheduler(interval=900, active_interval=60, budget=12)
+    items = {str(i): _generator(i) for i in range(1, 11)}
+    items["11"] = _generator(11, status=2)
+    # Unscheduled devices are always fetched, even over budget.
+    assert len(_tick(scheduler, items, 0)) == 11
+    assert scheduler.as_dict()["allowance"] == 0
+
+    # 900 s refill 3 requests: the list call plus two details.
+    assert _tick(scheduler, items, 900) == {"11", "1"}
+    assert scheduler.as_dict()["deferred"] == 9
+    # The next tick waits until one more detail fits in the budget.
+    assert scheduler.next_interval(900) == pytest.approx(600)
+
+
+def test_scheduler_retries_skipped_devices_when_due():
+    """A listed device whose details were skipped isn't refetched every tick."""
+    scheduler = PollScheduler(interval=900, active_interval=60, budget=1000)
+    items = {"1": _generator(1, status=2), "2": _generator(2)}
+    apparatuses = [item.apparatus for item in items.values()]
+    for now in (0, 60, 120):
+        chosen = scheduler.select(apparatuses, now)
+        # Device 2's details never decode.
+        scheduler.commit({"1": items["1"]}, now)
+        assert chosen == ({"1", "2"} if now == 0 else {"1"})
+    assert scheduler.select(apparatuses, 900) == {"1", "2"}
+
+
+async def test_coordinator_adaptive_polling(hass):
+    """The scheduler picks the details to fetch and sets the next tick."""
+    config_entry = MagicMock()
+    config_entry.options = {
+        CONF_ADAPTIVE_POLLING: True,
+        CONF_ACTIVE_SCAN_INTERVAL: 30,
+        CONF_REQUEST_BUDGET: 1000,
+    }
+    items = {"1": _generator(1, status=2)}
+
+    async def get_data(select):
+        assert select([item.apparatus for item in items.values()]) == {"1"}
+        return items, frozenset(items)
+
+    client = MagicMock()
+    client.async_get_data = AsyncMock(side_effect=get_data)
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+    await coordinator._async_update_data()
+    client.async_get_data.assert_awaited_once_with(select=coordinator.scheduler.select)
+    assert coordinator.update_interval.total_seconds() == pytest.approx(30, abs=1)
+
+    # A failing cloud is retried at the base cadence, not the active one.
+    client.async_get_data = AsyncMock(side_effect=Exception)
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+async def test_coordinator_adaptive_polling_off_by_default(hass):
+    """Without the option every tick polls the whole fleet as before."""
+    config_entry = MagicMock()
+    config_entry.options = {}
+    client = MagicMock()
+    client.async_get_data = AsyncMock(
+        return_value=({"1": _generator(1, status=2)}, frozenset({"1"}))
+    )
+    coordinator = GeneracDataUpdateCoordinator(hass, client, config_entry)
+    assert coordinator.scheduler is None
+
+    await coordinator._async_update_data()
+    client.async_get_data.assert_awaited_once_with()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
@@ -0,0 +1,112 @@
+"""Test the fleet snapshot diff."""
+from custom_components.generac.diff import DeviceDiff
+from custom_components.generac.diff import diff_fleet
+from custom_components.generac.diff import diff_item
+from custom_components.generac.diff import FleetDiff
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import Item
+from custom_components.generac.models import Weather
+
+
+def _detail(**kwargs) -> ApparatusDetail:
+    return ApparatusDetail(
+        name="Generator",
+        weather=Weather(Weather.Temperature(70, "°F", 1), 3),
+        properties=[
+            ApparatusDetail.Property(name="Battery", value=13.4, type=70),
+            ApparatusDetail.Property(name="Hours", value=100, type=71),
+        ],
+        **kwargs,
+    )
+
+
+def test_diff_item_reports_field_paths():
+    old = Item(Apparatus(apparatusId=1, name="Gen"), _detail())
+    new = Item(Apparatus(apparatusId=1, name="Gen 2"), _detail(statusLabel="Ready"))
+    new.apparatusDetail.weather.temperature.value = 71
+    # Property lists are immutable; a poll brings a new list.
+    new.apparatusDetail.properties = [
+        new.apparatusDetail.properties[0],
+        ApparatusDetail.Property(name="Hours", value=101, type=71),
+    ]
+
+    diff = diff_item(old, new)
+    assert diff.added == {"apparatusDetail.statusLabel"}
+    assert diff.removed == frozenset()
+    assert diff.changed == {
+        "apparatus.name",
+        "apparatusDetail.weather.temperature.value",
+        "apparatusDetail.properties[71]",
+    }
+
+
+def test_diff_item_keys_property_lists_by_type_code():
+    """Reordering is no change; only the first entry per code counts."""
+    old = Item(Apparatus(), _detail())
+    new = Item(Apparatus(), _detail())
+    new.apparatusDetail.properties.reverse()
+    new.apparatusDetail.properties.append(
+        ApparatusDetail.Property(name="Battery (dup)", value=0.0, type=70)
+    )
+    assert not diff_item(old, new)
+
+    new.apparatusDetail.properties = new.apparatusDetail.properties[1:]
+    new.apparatusDetail.tuProperties = [
+        ApparatusDetail.Property(name="Fuel Level", value=50, type=9)
+    ]
+    diff = diff_item(old, new)
+    assert diff.added == {"apparatusDetail.tuProperties[9]"}
+    assert diff.removed == {"apparatusDetail.properties[71]"}
+    assert diff.changed == frozenset()
+
+
+def test_diff_fleet_added_removed_and_unchanged_devices():
+    same = Item(Apparatus(apparatusId=1), _detail())
+    previous = {"1": same, "2": Item(Apparatus(), _detail()), "3": same}
+    current = {
+        "1": same,
+        "2": Item(Apparatus(), _detail(eCodeLabel="E1")),
+        "4": Item(Apparatus(), _detail()),
+    }
+
+    changes = diff_fleet(previous, current)
+    assert changes.added == {"4"}
+    assert changes.removed == {"3"}
+    assert changes.devices == {
+        "2": DeviceDiff(added=frozenset({"apparatusDetail.eCodeLabel"}))
+    }
+    assert changes.device_ids() == {"2", "3", "4"}
+    assert "1" not in changes
+    assert changes.get("1") is None
+
+    assert diff_fleet(None, {"1": same}).added == {"1"}
+    assert diff_fleet({"1": same}, None).removed == {"1"}
+    assert not diff_fleet(previous, previous)
+
+
+def test_fleet_diff_touches():
+    changes = FleetDiff(
+        added=frozenset({"new"}),
+        devices={
+            "1": DeviceDiff(changed=frozenset({"apparatusDetail.properties[70]"}))
+        },
+    )
+    assert changes.touches("new", "apparatus.name")
+    assert changes.touches("1")
+    assert changes.touches("1", "apparatusDetail.properties")
+    assert changes.touches("1", "apparatusDetail.properties[70]")
+    assert not changes.touches("1", "apparatusDetail.properties[7]")
+    assert not changes.touches("1", "apparatusDetail.prop")
+    assert not changes.touches("2")
+    assert changes.as_dict() == {
+        "added": ["new"],
+        "removed": [],
+        "changed": {
+            "1": {
+                "added": [],
+                "removed": [],
+                "changed": ["apparatusDetail.properties[70]"],
+            }
+        },
+    }
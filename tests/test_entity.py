@@ -1,6 +1,8 @@
 """Test the Generac entity."""
 from unittest.mock import MagicMock
 
+from custom_components.generac.diff import DeviceDiff
+from custom_components.generac.diff import FleetDiff
 from custom_components.generac.entity import GeneracEntity
 from custom_components.generac.models import Apparatus
 from custom_components.generac.models import ApparatusDetail
@@ -50,6 +52,7 @@ async def test_entity(hass):
         apparatusDetail=ApparatusDetail(),
     )
     coordinator.data = {"12345": new_item}
+    coordinator.changes = FleetDiff(added=frozenset({"12345"}))
     entity._handle_coordinator_update()
     assert entity.item == new_item
     assert entity.async_write_ha_state.called
@@ -71,8 +74,102 @@ async def test_entity_missing_device_falls_back_to_empty_item(hass):
 
     # Simulate a coordinator refresh where this device is no longer reported.
     coordinator.data = {}
+    coordinator.changes = FleetDiff(removed=frozenset({"12345"}))
     entity._handle_coordinator_update()
 
     assert entity.item is _EMPTY_ITEM
     assert entity.available is False
     assert entity.async_write_ha_state.called
+
+
+async def test_entity_skips_write_when_device_unchanged(hass):
+    """Unchanged device data and availability don't trigger a state write."""
+    coordinator = MagicMock()
+    coordinator.is_online = True
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    item = get_mock_item()
+    entity = GeneracEntity(coordinator, entry, "12345", item)
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    coordinator.data = {"12345": item}
+
+    coordinator.changes = FleetDiff(
+        devices={"12345": DeviceDiff(changed=frozenset({"apparatus.name"}))}
+    )
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # Another device changed; this one didn't.
+    coordinator.changes = FleetDiff(
+        devices={"67890": DeviceDiff(changed=frozenset({"apparatus.name"}))}
+    )
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # A failed poll flips availability, which must still be written.
+    coordinator.is_online = False
+    coordinator.changes = FleetDiff()
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+    assert entity.available is False
+
+
+async def test_entity_skips_write_when_watched_fields_unchanged(hass):
+    """Entities with watched_fields only write when one of them changed."""
+    coordinator = MagicMock()
+    coordinator.is_online = True
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    item = get_mock_item()
+    entity = GeneracEntity(coordinator, entry, "12345", item)
+    entity.watched_fields = ("apparatusDetail.properties",)
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    coordinator.data = {"12345": item}
+    coordinator.changes = FleetDiff(added=frozenset({"12345"}))
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    coordinator.changes = FleetDiff(
+        devices={"12345": DeviceDiff(changed=frozenset({"apparatus.name"}))}
+    )
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    coordinator.changes = FleetDiff(
+        devices={
+            "12345": DeviceDiff(added=frozenset({"apparatusDetail.properties[70]"}))
+        }
+    )
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+
+
+async def test_entity_identity_is_cached(hass):
+    """Identity is built once; device_info follows a renamed device only."""
+    coordinator = MagicMock()
+    coordinator.renamed = set()
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entity = GeneracEntity(coordinator, entry, "12345", get_mock_item())
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    device_info = entity.device_info
+    attributes = entity.extra_state_attributes
+
+    coordinator.data = {
+        "12345": Item(Apparatus(name="Renamed", modelNumber="G2"), ApparatusDetail())
+    }
+    coordinator.changes = FleetDiff(
+        devices={"12345": DeviceDiff(changed=frozenset({"apparatus.name"}))}
+    )
+    entity._handle_coordinator_update()
+    assert entity.device_info is device_info
+    assert entity.extra_state_attributes is attributes
+
+    coordinator.renamed = {"12345"}
+    entity._handle_coordinator_update()
+    assert entity.device_info["name"] == "Renamed"
+    assert entity.device_info["model"] == "G2"
+    assert entity.unique_id == f"test_entry_id_12345_{entity.name}"
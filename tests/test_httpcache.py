@@ -0,0 +1,36 @@
+"""Tests for the conditional-request response cache."""
+from custom_components.generac.httpcache import body_digest
+from custom_components.generac.httpcache import CachedResponse
+from custom_components.generac.httpcache import ResponseCache
+
+
+def _entry(body: bytes) -> CachedResponse:
+    return CachedResponse(body_digest(body), body.decode())
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", _entry(b"1"))
+    cache.put("b", _entry(b"2"))
+    assert cache.get("a") is not None
+    cache.put("c", _entry(b"3"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").payload == "1"
+    assert len(cache) == 2
+
+
+def test_reserve_only_grows():
+    cache = ResponseCache(maxsize=4)
+    cache.reserve(10)
+    cache.reserve(2)
+    assert cache.maxsize == 10
+
+
+def test_conditional_headers():
+    assert _entry(b"x").conditional_headers() == {}
+    entry = CachedResponse("d", {}, etag='W/"1"', last_modified="yesterday")
+    assert entry.conditional_headers() == {
+        "If-None-Match": 'W/"1"',
+        "If-Modified-Since": "yesterday",
+    }
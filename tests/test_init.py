@@ -1,18 +1,32 @@
 """Test generac setup process."""
+import asyncio
+import time
+from unittest.mock import AsyncMock
 from unittest.mock import patch
 
 import pytest
 from custom_components.generac import async_reload_entry
+from custom_components.generac import async_remove_config_entry_device
 from custom_components.generac import async_setup_entry
 from custom_components.generac import async_unload_entry
 from custom_components.generac.auth import DPoPKey
+from custom_components.generac.auth import GeneracAuth
 from custom_components.generac.const import CONF_DPOP_PEM
+from custom_components.generac.const import CONF_MAX_CONCURRENCY
 from custom_components.generac.const import CONF_REFRESH_TOKEN
 from custom_components.generac.const import CONF_USERNAME
+from custom_components.generac.const import DEVICE_TYPE_GENERATOR
 from custom_components.generac.const import DOMAIN
+from custom_components.generac.coordinator import DEVICE_REMOVAL_GRACE
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import Item
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
@@ -43,6 +57,26 @@ async def test_setup_unload_and_reload_entry(hass: HomeAssistant, bypass_get_dat
     assert config_entry.entry_id not in hass.data[DOMAIN]
 
 
+async def test_setup_entry_dedicated_api_session(hass: HomeAssistant, bypass_get_data):
+    """The API gets its own pooled session, closed when the entry unloads."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=_make_mock_config(),
+        options={CONF_MAX_CONCURRENCY: 6},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    session = hass.data[DOMAIN][config_entry.entry_id].api._session
+    assert session.connector.limit_per_host == 6
+    assert not session.closed
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert session.closed
+
+
 async def test_setup_entry_exception(hass: HomeAssistant, error_on_get_data):
     """Test config entry not ready when API errors."""
     config_entry = MockConfigEntry(
@@ -128,20 +162,25 @@ async def test_setup_entry_persist_callback_registered(hass, bypass_get_data):
 
     captured = {}
 
-    def fake_from_storage(session, refresh_token, pem_str, email=None):
+    def fake_from_storage(
+        session, refresh_token, pem_str, email=None, token_url=None, token_state=None
+    ):
         auth = type("FakeAuth", (), {})()
         auth.set_refresh_token_persist_callback = lambda cb: captured.setdefault(
             "cb", cb
         )
+        auth.set_token_persist_callback = lambda cb: captured.setdefault("token_cb", cb)
+        auth.async_background_refresh = AsyncMock()
         return auth
 
     with patch(
-        "custom_components.generac.GeneracAuth.from_storage",
+        "custom_components.generac.auth.GeneracAuth.from_storage",
         side_effect=fake_from_storage,
     ):
         await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
     assert callable(captured.get("cb"))
+    assert callable(captured.get("token_cb"))
 
 
 async def test_setup_entry_invalid_credentials_raises_auth_failed(hass):
@@ -180,3 +219,212 @@ async def test_setup_entry_invalid_grant_raises_auth_failed(hass):
         boom,
     ), pytest.raises(ConfigEntryAuthFailed):
         await async_setup_entry(hass, config_entry)
+
+
+async def test_setup_entry_from_snapshot_refreshes_in_background(
+    hass: HomeAssistant, hass_storage
+):
+    """A persisted snapshot sets entities up without blocking on the cloud."""
+    hass_storage["generac.test.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "generac.test.snapshot",
+        "data": {
+            "devices": {
+                "1": [
+                    {"apparatusId": 1, "name": "Cached Generator", "type": 0},
+                    {"apparatusId": 1, "name": "Cached Generator"},
+                ]
+            }
+        },
+    }
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=_make_mock_config(), entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+
+    async def never(self):
+        raise AssertionError("first refresh must not block setup")
+
+    # Hold the live poll so the cached state can be observed before it lands
+    # (the background task starts eagerly).
+    release = asyncio.Event()
+
+    async def slow_get_data(*args, **kwargs):
+        await release.wait()
+        return {}, frozenset()
+
+    with patch(
+        "custom_components.generac.coordinator.GeneracDataUpdateCoordinator.async_config_entry_first_refresh",
+        never,
+    ), patch(
+        "custom_components.generac.api.GeneracApiClient.async_get_data",
+        side_effect=slow_get_data,
+    ) as get_data:
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        coordinator = hass.data[DOMAIN][config_entry.entry_id]
+        assert coordinator.from_snapshot
+        assert coordinator.data["1"].apparatus.name == "Cached Generator"
+        release.set()
+        await hass.async_block_till_done()
+
+    get_data.assert_awaited()
+    assert not coordinator.from_snapshot
+
+
+async def test_setup_entry_restores_token_state(hass: HomeAssistant, hass_storage):
+    """A still-valid stored access token is reused instead of refreshing."""
+    config = _make_mock_config()
+    auth = GeneracAuth.from_storage(
+        None, config[CONF_REFRESH_TOKEN], config[CONF_DPOP_PEM]
+    )
+    auth._access_token = "stored-token"
+    auth._access_token_exp = time.time() + 3600
+    hass_storage["generac.test.auth"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "generac.test.auth",
+        "data": auth.token_state(),
+    }
+    config_entry = MockConfigEntry(domain=DOMAIN, data=config, entry_id="test")
+    config_entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.generac.api.GeneracApiClient.async_get_data",
+        return_value=({}, frozenset()),
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert await coordinator.api._auth.ensure_access_token() == "stored-token"
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert "generac.test.auth" not in hass_storage
+
+
+async def test_setup_entry_saves_token_state_in_background(
+    hass: HomeAssistant, hass_storage
+):
+    """Persisting a fresh access token doesn't wait for the disk write."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=_make_mock_config(), entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.generac.api.GeneracApiClient.async_get_data",
+        return_value=({}, frozenset()),
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    auth = hass.data[DOMAIN][config_entry.entry_id].api._auth
+    auth._access_token = "fresh-token"
+    auth._access_token_exp = time.time() + 3600
+    await auth._persist_token_state(auth.token_state())
+    assert "generac.test.auth" not in hass_storage
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage["generac.test.auth"]["data"] == auth.token_state()
+
+
+def _generator(device_id: int) -> Item:
+    return Item(
+        Apparatus(
+            apparatusId=device_id,
+            name=f"Generator {device_id}",
+            type=DEVICE_TYPE_GENERATOR,
+        ),
+        ApparatusDetail(apparatusId=device_id, isConnected=True),
+    )
+
+
+def _fleet(*device_ids: int) -> tuple[dict[str, Item], frozenset[str]]:
+    """What async_get_data returns when these devices are listed and polled."""
+    items = {str(device_id): _generator(device_id) for device_id in device_ids}
+    return items, frozenset(items)
+
+
+async def test_devices_added_and_removed_between_polls(hass: HomeAssistant):
+    """Entities follow the fleet without reloading the entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=_make_mock_config(), entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    devices = dr.async_get(hass)
+    entities = er.async_get(hass)
+
+    def entities_of(device_id: str) -> list[er.RegistryEntry]:
+        device = devices.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device is None:
+            return []
+        return er.async_entries_for_device(
+            entities, device.id, include_disabled_entities=True
+        )
+
+    get_data = AsyncMock(return_value=_fleet(1))
+    with patch(
+        "custom_components.generac.api.GeneracApiClient.async_get_data", get_data
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][config_entry.entry_id]
+        assert entities_of("1")
+        assert not entities_of("2")
+
+        get_data.return_value = _fleet(1, 2)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert len(entities_of("2")) == len(entities_of("1"))
+
+        # Gone from the list: kept, unavailable, for the grace period.
+        get_data.return_value = _fleet(1)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        enabled = [e for e in entities_of("2") if not e.disabled_by]
+        assert enabled
+        assert hass.states.get(enabled[0].entity_id).state == "unavailable"
+
+        coordinator._missing_since["2"] -= DEVICE_REMOVAL_GRACE
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert coordinator.purged == {"2"}
+        assert devices.async_get_device(identifiers={(DOMAIN, "2")}) is None
+        assert not entities_of("2")
+        assert hass.states.get(enabled[0].entity_id) is None
+        assert entities_of("1")
+
+        # A device that comes back is set up again.
+        get_data.return_value = _fleet(1, 2)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert len(entities_of("2")) == len(entities_of("1"))
+        assert get_data.await_count == 5
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_remove_config_entry_device(hass: HomeAssistant, bypass_get_data):
+    """Only devices MobileLink no longer lists can be deleted from the UI."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=_make_mock_config(), entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    hass.data[DOMAIN][config_entry.entry_id].data = {"1": _generator(1)}
+    devices = dr.async_get(hass)
+    listed = devices.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={(DOMAIN, "1")}
+    )
+    gone = devices.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={(DOMAIN, "2")}
+    )
+
+    assert not await async_remove_config_entry_device(hass, config_entry, listed)
+    assert await async_remove_config_entry_device(hass, config_entry, gone)
+
+    # Still listed, only its details were skipped: not deletable either.
+    hass.data[DOMAIN][config_entry.entry_id].listed = frozenset({"1", "2"})
+    assert not await async_remove_config_entry_device(hass, config_entry, gone)
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
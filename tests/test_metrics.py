@@ -0,0 +1,63 @@
+"""Tests for the poll-path metrics."""
+import pytest
+from custom_components.generac.metrics import endpoint_key
+from custom_components.generac.metrics import Histogram
+from custom_components.generac.metrics import PHASE_DECODE
+from custom_components.generac.metrics import PHASE_ENTITY_WRITES
+from custom_components.generac.metrics import PHASE_TOTAL
+from custom_components.generac.metrics import PollMetrics
+
+
+def test_endpoint_key_collapses_ids():
+    assert endpoint_key("/Apparatus/details/12345") == "/Apparatus/details/{id}"
+    assert endpoint_key("/Apparatus/list") == "/Apparatus/list"
+
+
+def test_histogram_buckets():
+    histogram = Histogram()
+    for seconds in (0.01, 0.04, 0.04, 3.0, 60.0):
+        histogram.observe(seconds)
+    summary = histogram.as_dict()
+    assert summary["count"] == 5
+    assert summary["max"] == 60.0
+    assert summary["buckets"]["le_0.025"] == 1
+    assert summary["buckets"]["le_0.05"] == 2
+    assert summary["buckets"]["le_5"] == 1
+    assert summary["buckets"]["+Inf"] == 1
+
+
+def test_record_request_per_endpoint():
+    metrics = PollMetrics()
+    metrics.record_request("/Apparatus/details/1", 0.2, 100)
+    metrics.record_request("/Apparatus/details/2", 0.3, 50, "http_500")
+    metrics.record_request("/Apparatus/list", 0.1, 10)
+
+    assert metrics.requests == 3
+    assert metrics.errors == 1
+    details = metrics.as_dict()["endpoints"]["/Apparatus/details/{id}"]
+    assert details["requests"] == 2
+    assert details["bytes"] == 150
+    assert details["errors"] == {"http_500": 1}
+
+
+def test_poll_publishes_phases():
+    metrics = PollMetrics()
+    with metrics.poll():
+        metrics.add_phase(PHASE_DECODE, 0.25)
+        metrics.add_phase(PHASE_DECODE, 0.25)
+    metrics.record_entity_writes(0.1)
+
+    assert metrics.polls == 1
+    assert metrics.last_poll[PHASE_DECODE] == 0.5
+    assert metrics.last_poll[PHASE_ENTITY_WRITES] == 0.1
+    assert PHASE_TOTAL in metrics.last_poll
+    assert metrics.phases[PHASE_DECODE].count == 1
+
+
+def test_failed_poll_is_counted():
+    metrics = PollMetrics()
+    with pytest.raises(IOError):
+        with metrics.poll():
+            raise IOError("boom")
+    assert metrics.failures == {"OSError": 1}
+    assert metrics.polls == 1
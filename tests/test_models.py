@@ -0,0 +1,149 @@
+"""Test the Generac payload models and decoder."""
+import json
+
+import pytest
+from custom_components.generac.models import Apparatus
+from custom_components.generac.models import ApparatusDetail
+from custom_components.generac.models import decode
+from custom_components.generac.models import DecodeError
+from custom_components.generac.models import Item
+from custom_components.generac.models import Weather
+from dacite import from_dict
+
+APPARATUS = {
+    "apparatusId": 1,
+    "name": "Generator 1",
+    "type": 0,
+    "isConnected": True,
+    "weather": {"temperature": {"value": 72, "unit": "°F"}, "iconCode": 3},
+    "properties": [
+        {"name": "Device", "value": {"type": 0, "status": "Online"}, "type": 3},
+        {"name": "Subscriptions", "value": [], "type": 4},
+        {"name": "Model", "value": "22kW", "type": 5},
+        {"name": "Count", "value": 7, "type": 6},
+        {"name": "Empty", "value": None, "type": 7},
+    ],
+    "unknownField": "ignored",
+}
+
+DETAIL = {
+    "apparatusId": 1,
+    "name": "Generator 1",
+    "apparatusStatus": 1,
+    "address": {"line1": "123 Main St", "city": "Springfield"},
+    "properties": [
+        {"name": "Battery", "value": 13.4, "type": 70},
+        {"name": "Hours", "value": "123", "type": "71"},
+        {"name": "Blob", "value": {"k": 1}, "type": 99},
+    ],
+    "tuProperties": [],
+    "subscription": {"type": 1, "status": 1, "isLegacy": False, "isDunning": False},
+}
+
+
+def test_decode_matches_dacite():
+    """decode() builds exactly what dacite.from_dict builds."""
+    assert decode(Apparatus, APPARATUS) == from_dict(Apparatus, APPARATUS)
+    assert decode(ApparatusDetail, DETAIL) == from_dict(ApparatusDetail, DETAIL)
+
+
+def test_decode_resolves_property_value_union():
+    """Apparatus.Property.value picks the first matching union member."""
+    props = decode(Apparatus, APPARATUS).properties
+    assert isinstance(props[0].value, Apparatus.Property.Value)
+    assert props[0].value.status == "Online"
+    assert props[1].value == []
+    assert props[2].value == "22kW"
+    assert props[3].value == 7
+    assert props[4].value is None
+
+
+def test_decode_missing_optional_fields_default_to_none():
+    """Missing Optional fields without a default decode as None."""
+    assert decode(Weather, {}) == Weather(temperature=None, iconCode=None)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"apparatusId": "not-an-int"},
+        {"weather": []},
+        {"properties": {"not": "a list"}},
+        {"properties": [{"name": 1}]},
+        {"address": {"line1": 5}},
+    ],
+)
+def test_decode_rejects_wrong_types(payload):
+    """Type mismatches raise DecodeError, like dacite's WrongTypeError."""
+    with pytest.raises(DecodeError):
+        decode(ApparatusDetail, payload)
+
+
+def test_decode_rejects_non_object():
+    """A non-dict payload for a dataclass is an error."""
+    with pytest.raises(DecodeError):
+        decode(Apparatus, ["not", "a", "dict"])
+
+
+def test_property_index_lookups():
+    """property_value/tu_property_value find the first entry per type code."""
+    detail = decode(
+        ApparatusDetail,
+        {
+            "properties": [
+                {"name": "Battery", "value": 13.4, "type": 70},
+                {"name": "Battery (dup)", "value": 0.0, "type": 70},
+            ],
+            "tuProperties": [{"name": "Capacity", "value": 500, "type": 1}],
+        },
+    )
+    assert detail.property_value(70) == 13.4
+    assert detail.property_value(71, 0) == 0
+    assert detail.tu_property_value(1) == 500
+    assert detail.tu_property_value(9, "n/a") == "n/a"
+
+    apparatus = decode(Apparatus, APPARATUS)
+    assert apparatus.property_value(3).status == "Online"
+    assert Apparatus().property_value(3) is None
+
+
+def test_property_index_follows_reassigned_list():
+    """Assigning a new property list is reflected on the next lookup."""
+    detail = ApparatusDetail(
+        properties=[ApparatusDetail.Property(name="Hours", value=1, type=71)]
+    )
+    assert detail.property_value(71) == 1
+    detail.properties = [ApparatusDetail.Property(name="Hours", value=2, type=71)]
+    assert detail.property_value(71) == 2
+    detail.properties = None
+    assert detail.property_value(71, "none") == "none"
+
+
+def test_poll_models_are_slotted():
+    """Models decoded on every poll carry no per-instance __dict__."""
+    apparatus = decode(Apparatus, APPARATUS)
+    detail = decode(ApparatusDetail, DETAIL)
+    for model in (
+        apparatus,
+        apparatus.weather,
+        apparatus.weather.temperature,
+        apparatus.properties[0],
+        apparatus.properties[0].value,
+        detail,
+        detail.address,
+        detail.subscription,
+        detail.properties[0],
+        Item(apparatus=apparatus, apparatusDetail=detail),
+    ):
+        assert not hasattr(model, "__dict__"), type(model).__qualname__
+
+
+def test_decode_interns_repeated_strings():
+    """INTERN fields share one string object across separately parsed bodies."""
+    first = decode(ApparatusDetail, json.loads(json.dumps(DETAIL)))
+    second = decode(ApparatusDetail, json.loads(json.dumps(DETAIL)))
+    assert first.properties[0].name is second.properties[0].name
+    assert first.address.city is second.address.city
+    # Unique per device: left alone.
+    assert first.address.line1 == second.address.line1
+    assert first.address.line1 is not second.address.line1
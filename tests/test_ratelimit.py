@@ -0,0 +1,76 @@
+"""Tests for the MobileLink client-side rate limiter."""
+import asyncio
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
+
+from custom_components.generac.ratelimit import DEFAULT_RETRY_AFTER
+from custom_components.generac.ratelimit import get_rate_limiter
+from custom_components.generac.ratelimit import MAX_RETRY_AFTER
+from custom_components.generac.ratelimit import parse_retry_after
+from custom_components.generac.ratelimit import TokenBucket
+
+
+async def test_burst_is_immediate_then_rate_limited():
+    """`burst` tokens are free; the next caller waits ~1/rate seconds."""
+    bucket = TokenBucket(rate=20, burst=2)
+    assert await bucket.acquire() < 0.01
+    assert await bucket.acquire() < 0.01
+    waited = await bucket.acquire()
+    assert 0.03 < waited < 0.2
+    assert bucket.acquired == 3
+    assert bucket.max_wait == waited
+
+
+async def test_zero_rate_is_unlimited():
+    """A rate of 0 never waits."""
+    bucket = TokenBucket(rate=0, burst=1)
+    for _ in range(50):
+        assert await bucket.acquire() < 0.01
+
+
+async def test_queue_depth_counts_waiters():
+    """Callers blocked on the bucket show up in queue_depth."""
+    bucket = TokenBucket(rate=10, burst=1)
+    await bucket.acquire()
+    tasks = [asyncio.create_task(bucket.acquire()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert bucket.queue_depth == 3
+    await asyncio.gather(*tasks)
+    assert bucket.queue_depth == 0
+
+
+async def test_penalize_blocks_until_retry_after():
+    """A 429 penalty blocks even an otherwise full bucket."""
+    bucket = TokenBucket(rate=0, burst=5)
+    bucket.penalize(0.1)
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+    assert bucket.throttled == 1
+    assert bucket.as_dict()["throttled"] == 1
+
+
+async def test_get_rate_limiter_shared_per_account():
+    """Entries on the same account (case-insensitive) share one bucket."""
+    first = get_rate_limiter("Shared@Example.com", 60, 5)
+    second = get_rate_limiter("shared@example.com", 120, 10)
+    assert first is second
+    assert second.as_dict()["rate_per_minute"] == 120
+    assert second.as_dict()["burst"] == 10
+    assert get_rate_limiter("other@example.com", 60, 5) is not first
+
+
+def test_parse_retry_after():
+    """Delta-seconds, HTTP-dates and junk all parse to a sane delay."""
+    assert parse_retry_after("7") == 7
+    assert parse_retry_after(None) == DEFAULT_RETRY_AFTER
+    assert parse_retry_after("soon") == DEFAULT_RETRY_AFTER
+    assert parse_retry_after("inf") == DEFAULT_RETRY_AFTER
+    assert parse_retry_after("nan") == DEFAULT_RETRY_AFTER
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("1e9") == MAX_RETRY_AFTER
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < parse_retry_after(format_datetime(future, usegmt=True)) <= 60
@@ -0,0 +1,31 @@
+"""Tests for the transient-failure retry policy."""
+import asyncio
+
+import aiohttp
+from custom_components.generac.retry import RetryPolicy
+
+
+def test_allows_bounded_attempts():
+    policy = RetryPolicy(attempts=3)
+    assert policy.allows(1)
+    assert policy.allows(2)
+    assert not policy.allows(3)
+    assert not RetryPolicy(attempts=0).allows(1)
+
+
+def test_delay_backs_off_exponentially_with_jitter():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for _ in range(20):
+        assert 0.5 <= policy.delay(1) <= 1.0
+        assert 1.0 <= policy.delay(2) <= 2.0
+        assert 2.0 <= policy.delay(3) <= 4.0
+        assert 2.5 <= policy.delay(6) <= 5.0
+
+
+def test_retryable_classes():
+    assert RetryPolicy.retryable_status(503)
+    assert not RetryPolicy.retryable_status(401)
+    assert not RetryPolicy.retryable_status(429)
+    assert RetryPolicy.retryable_error(asyncio.TimeoutError())
+    assert RetryPolicy.retryable_error(aiohttp.ServerDisconnectedError())
+    assert not RetryPolicy.retryable_error(ValueError("bad json"))
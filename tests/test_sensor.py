@@ -1,38 +1,33 @@
 """Test the Generac sensor platform."""
 from unittest.mock import MagicMock
 
+from custom_components.generac.breaker import CircuitBreaker
 from custom_components.generac.const import DEVICE_TYPE_GENERATOR
 from custom_components.generac.const import DEVICE_TYPE_PROPANE_MONITOR
+from custom_components.generac.metrics import PollMetrics
 from custom_components.generac.models import Apparatus
 from custom_components.generac.models import ApparatusDetail
 from custom_components.generac.models import Item
 from custom_components.generac.models import Weather
-from custom_components.generac.sensor import ActivationDateSensor
-from custom_components.generac.sensor import AddressSensor
-from custom_components.generac.sensor import BatteryLevelSensor
-from custom_components.generac.sensor import BatteryVoltageSensor
-from custom_components.generac.sensor import CapacitySensor
-from custom_components.generac.sensor import ConnectionTimeSensor
-from custom_components.generac.sensor import DealerEmailSensor
-from custom_components.generac.sensor import DealerNameSensor
-from custom_components.generac.sensor import DealerPhoneSensor
-from custom_components.generac.sensor import DeviceSsidSensor
-from custom_components.generac.sensor import DeviceTypeSensor
-from custom_components.generac.sensor import FuelLevelSensor
-from custom_components.generac.sensor import FuelTypeSensor
-from custom_components.generac.sensor import LastReadingDateSensor
-from custom_components.generac.sensor import LastSeenSensor
-from custom_components.generac.sensor import ModelNumberSensor
-from custom_components.generac.sensor import OrientationSensor
-from custom_components.generac.sensor import OutdoorTemperatureSensor
-from custom_components.generac.sensor import PanelIDSensor
-from custom_components.generac.sensor import ProtectionTimeSensor
-from custom_components.generac.sensor import RunTimeSensor
-from custom_components.generac.sensor import SerialNumberSensor
-from custom_components.generac.sensor import SignalStrengthSensor
-from custom_components.generac.sensor import StatusLabelSensor
-from custom_components.generac.sensor import StatusSensor
-from custom_components.generac.sensor import StatusTextSensor
+from custom_components.generac.sensor import ApiErrorsSensor
+from custom_components.generac.sensor import ApiRequestsSensor
+from custom_components.generac.sensor import CircuitBreakerSensor
+from custom_components.generac.sensor import descriptions
+from custom_components.generac.sensor import GeneracSensor
+from custom_components.generac.sensor import PollDurationSensor
+from custom_components.generac.sensor import SENSORS
+
+_DESCRIPTIONS = {description.key: description for description in SENSORS}
+
+
+def _sensor(key: str, item: Item, coordinator=None, entry=None) -> GeneracSensor:
+    return GeneracSensor(
+        coordinator or MagicMock(),
+        entry or MagicMock(),
+        "12345",
+        item,
+        _DESCRIPTIONS[key],
+    )
 
 
 def get_mock_item(
@@ -120,28 +115,30 @@ def get_mock_item(
 
 async def test_status_sensor(hass):
     """Test the status sensor."""
-    coordinator = MagicMock()
     entry = MagicMock()
+    entry.entry_id = "entry"
 
     # Test generator status
     item = get_mock_item(DEVICE_TYPE_GENERATOR, 1)
-    sensor = StatusSensor(coordinator, entry, "12345", item)
+    sensor = _sensor("status", item, entry=entry)
     assert sensor.native_value == "Ready"
     assert sensor.name == "generac_12345_status"
+    assert sensor.unique_id == "entry_12345_generac_12345_status"
     assert sensor.device_class == "enum"
     assert sensor.icon == "mdi:power"
+    assert sensor.native_value in sensor.options
+    assert _sensor("status", get_mock_item(DEVICE_TYPE_GENERATOR, 42)).native_value
+    assert _sensor("status", get_mock_item(DEVICE_TYPE_GENERATOR, None)).native_value
 
     # Test propane monitor status
     item = get_mock_item(DEVICE_TYPE_PROPANE_MONITOR, 1, "Online")
     item.apparatus.properties = [MagicMock(type=3, value=MagicMock(status="Online"))]
-    sensor = StatusSensor(coordinator, entry, "12345", item)
+    sensor = _sensor("status", item)
     assert sensor.native_value == "Online"
 
 
 async def test_generator_sensors(hass):
     """Test the generator sensors."""
-    coordinator = MagicMock()
-    entry = MagicMock()
     item = get_mock_item(
         DEVICE_TYPE_GENERATOR,
         1,
@@ -170,69 +167,53 @@ async def test_generator_sensors(hass):
         MagicMock(type=3, value=MagicMock(signalStrength="100%"))
     ]
 
-    sensor = RunTimeSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 123
-
-    sensor = ProtectionTimeSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 456
-
-    sensor = ActivationDateSensor(coordinator, entry, "12345", item)
+    assert _sensor("run_time", item).native_value == 123
+    assert _sensor("protection_time", item).native_value == 456
+    sensor = _sensor("activation_date", item)
     assert sensor.native_value.isoformat() == "2022-01-01T00:00:00+00:00"
-
-    sensor = LastSeenSensor(coordinator, entry, "12345", item)
+    sensor = _sensor("last_seen", item)
     assert sensor.native_value.isoformat() == "2022-01-02T00:00:00+00:00"
-
-    sensor = ConnectionTimeSensor(coordinator, entry, "12345", item)
+    sensor = _sensor("connection_time", item)
     assert sensor.native_value.isoformat() == "2022-01-03T00:00:00+00:00"
-
-    sensor = BatteryVoltageSensor(coordinator, entry, "12345", item)
+    sensor = _sensor("battery_voltage", item)
     assert sensor.native_value == 12.3
+    assert sensor.native_unit_of_measurement == "V"
+    assert sensor.suggested_display_precision == 1
+    assert _sensor("device_type", item).native_value == "Wifi"
+    assert _sensor("dealer_email", item).native_value == "test@example.com"
+    assert _sensor("dealer_name", item).native_value == "Test Dealer"
+    assert _sensor("dealer_phone", item).native_value == "123-456-7890"
+    assert _sensor("address", item).native_value == "123 Main St"
+    assert _sensor("status_text", item).native_value == "Ready"
+    assert _sensor("status_label", item).native_value == "Ready"
+    assert _sensor("serial_number", item).native_value == "1234567890"
+    assert _sensor("model_number", item).native_value == "G12345"
+    assert _sensor("device_ssid", item).native_value == "TestSSID"
+    assert _sensor("panel_id", item).native_value == "P12345"
+    assert _sensor("signal_strength", item).native_value == "100%"
+    sensor = _sensor("outdoor_temperature", item)
+    assert sensor.native_value == 72.0
+    assert sensor.native_unit_of_measurement == "°F"
 
-    sensor = DeviceTypeSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Wifi"
-
-    sensor = DealerEmailSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "test@example.com"
-
-    sensor = DealerNameSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Test Dealer"
-
-    sensor = DealerPhoneSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "123-456-7890"
-
-    sensor = AddressSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "123 Main St"
-
-    sensor = StatusTextSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Ready"
-
-    sensor = StatusLabelSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Ready"
-
-    sensor = SerialNumberSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "1234567890"
-
-    sensor = ModelNumberSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "G12345"
-
-    sensor = DeviceSsidSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "TestSSID"
-
-    sensor = PanelIDSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "P12345"
 
-    sensor = SignalStrengthSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "100%"
+async def test_generator_sensor_defaults(hass):
+    """Missing values fall back to each sensor's default."""
+    item = get_mock_item(DEVICE_TYPE_GENERATOR, 1)
+    item.apparatusDetail.properties = []
+    item.apparatus.properties = None
 
-    sensor = OutdoorTemperatureSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 72.0
-    assert sensor.native_unit_of_measurement == "°F"
+    assert _sensor("run_time", item).native_value == 0.0
+    assert _sensor("battery_voltage", item).native_value == 0.0
+    assert _sensor("activation_date", item).native_value is None
+    assert _sensor("device_type", item).native_value == "Unknown"
+    assert _sensor("signal_strength", item).native_value == "0%"
+    sensor = _sensor("outdoor_temperature", item)
+    assert sensor.native_value == 0
+    assert sensor.native_unit_of_measurement == "°C"
 
 
 async def test_propane_monitor_sensors(hass):
     """Test the propane monitor sensors."""
-    coordinator = MagicMock()
-    entry = MagicMock()
     item = get_mock_item(
         DEVICE_TYPE_PROPANE_MONITOR,
         1,
@@ -246,35 +227,24 @@ async def test_propane_monitor_sensors(hass):
         device_type_str="lte-tankutility-v2",
     )
 
-    sensor = CapacitySensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 100
-
-    sensor = FuelLevelSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 50
-
-    sensor = FuelTypeSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Propane"
-
-    sensor = OrientationSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "Vertical"
-
-    sensor = LastReadingDateSensor(coordinator, entry, "12345", item)
+    assert _sensor("capacity", item).native_value == 100
+    assert _sensor("fuel_level", item).native_value == 50
+    assert _sensor("fuel_type", item).native_value == "Propane"
+    assert _sensor("orientation", item).native_value == "Vertical"
+    sensor = _sensor("last_reading", item)
     assert sensor.native_value.isoformat() == "2022-01-01T00:00:00+00:00"
+    assert _sensor("battery_level", item).native_value == 75
+    assert _sensor("address", item).native_value == "456 Oak Ave"
+    assert _sensor("device_type", item).native_value == "lte-tankutility-v2"
 
-    sensor = BatteryLevelSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == 75
-
-    sensor = AddressSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "456 Oak Ave"
-
-    sensor = DeviceTypeSensor(coordinator, entry, "12345", item)
-    assert sensor.native_value == "lte-tankutility-v2"
+    item.apparatusDetail.tuProperties = []
+    assert _sensor("capacity", item).native_value == 0
+    assert _sensor("fuel_type", item).native_value == "Propane"
+    assert _sensor("last_reading", item).native_value is None
 
 
 async def test_safe_float_handles_none_and_invalid(hass):
     """Bad sensor values (None, 'N/A', non-numeric) yield None instead of crashing."""
-    coordinator = MagicMock()
-    entry = MagicMock()
     item = get_mock_item(DEVICE_TYPE_GENERATOR, 1)
     item.apparatusDetail.properties = [
         MagicMock(type=71, value=None),
@@ -282,6 +252,104 @@ async def test_safe_float_handles_none_and_invalid(hass):
         MagicMock(type=70, value="not-a-number"),
     ]
 
-    assert RunTimeSensor(coordinator, entry, "12345", item).native_value is None
-    assert ProtectionTimeSensor(coordinator, entry, "12345", item).native_value is None
-    assert BatteryVoltageSensor(coordinator, entry, "12345", item).native_value is None
+    assert _sensor("run_time", item).native_value is None
+    assert _sensor("protection_time", item).native_value is None
+    assert _sensor("battery_voltage", item).native_value is None
+
+
+async def test_descriptions_by_device_type(hass):
+    """Each device type gets its sensors; outdoor temperature when reported."""
+    generator = get_mock_item(DEVICE_TYPE_GENERATOR, 1)
+    assert [d.key for d in descriptions(generator)] == [
+        "status",
+        "run_time",
+        "protection_time",
+        "activation_date",
+        "last_seen",
+        "connection_time",
+        "battery_voltage",
+        "device_type",
+        "dealer_email",
+        "dealer_name",
+        "dealer_phone",
+        "address",
+        "status_text",
+        "status_label",
+        "serial_number",
+        "model_number",
+        "device_ssid",
+        "panel_id",
+        "signal_strength",
+    ]
+    monitor = get_mock_item(DEVICE_TYPE_PROPANE_MONITOR, 1, outdoor_temperature=50)
+    assert [d.key for d in descriptions(monitor)] == [
+        "status",
+        "device_type",
+        "address",
+        "capacity",
+        "fuel_level",
+        "fuel_type",
+        "orientation",
+        "last_reading",
+        "battery_level",
+        "outdoor_temperature",
+    ]
+    unknown = get_mock_item(99, 1, outdoor_temperature=50)
+    assert [d.key for d in descriptions(unknown)] == ["outdoor_temperature"]
+
+
+async def test_sensor_watched_fields(hass):
+    """Sensors only depend on the diff paths their value is read from."""
+    item = get_mock_item(DEVICE_TYPE_GENERATOR, 1)
+    assert _sensor("run_time", item).watched_fields == (
+        "apparatusDetail.properties[71]",
+    )
+    assert _sensor("last_seen", item).watched_fields == ("apparatusDetail.lastSeen",)
+    assert _sensor("outdoor_temperature", item).watched_fields == (
+        "apparatusDetail.weather",
+    )
+
+
+async def test_metrics_sensors(hass):
+    """Diagnostic sensors read the API client's poll metrics."""
+    metrics = PollMetrics()
+    with metrics.poll():
+        metrics.add_phase("list", 0.5)
+    metrics.record_request("/Apparatus/list", 0.5, 10)
+    metrics.record_request("/Apparatus/details/1", 0.2, 10, "http_500")
+    coordinator = MagicMock()
+    coordinator.api.metrics = metrics
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.title = "user@example.com"
+
+    sensor = PollDurationSensor(coordinator, entry)
+    assert sensor.unique_id == "entry_poll_duration"
+    assert sensor.name == "generac_user@example.com_poll_duration"
+    assert sensor.native_value == round(metrics.last_poll["total"], 3)
+    assert sensor.extra_state_attributes["last_poll"]["list"] == 0.5
+    assert not sensor.entity_registry_enabled_default
+
+    sensor = ApiRequestsSensor(coordinator, entry)
+    assert sensor.native_value == 2
+    assert sensor.extra_state_attributes["/Apparatus/list"]["bytes"] == 10
+
+    sensor = ApiErrorsSensor(coordinator, entry)
+    assert sensor.native_value == 1
+    assert sensor.extra_state_attributes["/Apparatus/details/{id}"] == {"http_500": 1}
+
+
+async def test_circuit_breaker_sensor(hass):
+    coordinator = MagicMock()
+    coordinator.api.breaker = CircuitBreaker(failure_threshold=1)
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    sensor = CircuitBreakerSensor(coordinator, entry)
+
+    assert sensor.unique_id == "entry_circuit_breaker"
+    assert sensor.native_value == "closed"
+    assert sensor.entity_registry_enabled_default
+    coordinator.api.breaker.record_failure()
+    assert sensor.native_value == "open"
+    assert sensor.native_value in sensor.options
+    assert sensor.extra_state_attributes["consecutive_failures"] == 1